@@ -0,0 +1,31 @@
+# ====================== PAGE REGISTRY ======================
+# One module per sidebar page, each exposing render(). Not named `pages/` on
+# purpose: Streamlit would turn that folder into its own multipage navigation.
+# A page module (and its heavy imports: plotly, qrcode, ...) is imported the
+# first time the page is opened, then reused from sys.modules for the process.
+import importlib
+
+PAGES = {
+    "🏠 Dashboard": "dashboard",
+    "📊 FTMO Accounts": "ftmo_accounts",
+    "💰 Profit Sharing": "profit_sharing",
+    "👤 My Profile": "my_profile",
+    "🌱 Growth Fund": "growth_fund",
+    "🔑 License Generator": "license_generator",
+    "📁 File Vault": "file_vault",
+    "📢 Announcements": "announcements",
+    "💬 Messages": "messages",
+    "🔔 Notifications": "notifications",
+    "💳 Withdrawals": "withdrawals",
+    "🤖 EA Versions": "ea_versions",
+    "📸 Testimonials": "testimonials",
+    "📈 Reports & Export": "reports_export",
+    "🔮 Simulator": "simulator",
+    "📜 Audit Logs": "audit_logs",
+    "👤 Admin Management": "admin_management",
+}
+
+
+def load_page(title: str):
+    """Module for a sidebar page title • imported on first use only"""
+    return importlib.import_module(f"{__name__}.{PAGES[title]}")
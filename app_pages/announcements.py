@@ -0,0 +1,245 @@
+# ====================== ANNOUNCEMENTS PAGE - FULL FINAL LATEST 2026 (FULLY FIXED: PIN DEFAULT OFF + IMAGES/ATTACHMENTS VISIBLE + PERMANENT + REALTIME) ======================
+import datetime
+
+import streamlit as st
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.helpers import deferred_download, get_signed_urls, live_select, upload_to_supabase, watch_tables
+from utils.supabase_client import supabase
+from utils.theme import accent_color
+from utils.thumbnails import with_thumbnails
+
+
+def render():
+    st.header("Empire Announcements 📢")
+    st.markdown("**Central realtime communication: Broadcast updates • Rich images/attachments (PERMANENT STORAGE + FULLY VISIBLE) • Likes ❤️ • Threaded comments 💬 • Pinning 📌 • Search & filters • Full team engagement.**")
+    current_role = st.session_state.get("role", "guest")
+
+    # LIVE CACHE: announcements stream in via realtime • comments/files still refresh on ttl
+    @cached_query("announcements", "announcement_files", "announcement_comments", ttl=60)
+    def fetch_announcements_realtime():
+        announcements = live_select("announcements", "date")
+        ann_ids = [a["id"] for a in announcements]
+
+        # ALL attachments in ONE query (was 1 query per announcement)
+        files = []
+        if ann_ids:
+            files_resp = supabase.table("announcement_files").select(
+                "id, announcement_id, original_name, storage_path"
+            ).in_("announcement_id", ann_ids).execute()
+            files = files_resp.data or []
+
+        # SIGNED URLs from the shared manager (still-valid URLs reused • renewals batched in ONE call)
+        signed_by_path = get_signed_urls().get_many(
+            "announcements", [att.get("storage_path") for att in files]
+        )
+
+        # Join in memory
+        files_map = {}
+        for att in files:
+            att["signed_url"] = signed_by_path.get(att.get("storage_path"))
+            files_map.setdefault(att["announcement_id"], []).append(att)
+        for ann in announcements:
+            ann["attachments"] = files_map.get(ann["id"], [])
+
+        # Comments (realtime)
+        comm_resp = supabase.table("announcement_comments").select("*").order("timestamp", desc=True).execute()
+        comments_map = {}
+        for c in comm_resp.data or []:
+            comments_map.setdefault(c["announcement_id"], []).append(c)
+        for ann in announcements:
+            ann["comments"] = comments_map.get(ann["id"], [])
+        return announcements
+
+    announcements = fetch_announcements_realtime()
+    watch_tables("announcements")
+
+    # Manual refresh
+    if st.button("🔄 Refresh Feed Now", use_container_width=True, type="secondary"):
+        fetch_announcements_realtime.clear()
+        st.rerun()
+
+    st.caption("🔄 Feed updates live • Images & attachments FULLY VISIBLE • Pin to Top default OFF")
+
+    # POST NEW (OWNER/ADMIN ONLY)
+    if current_role in ["owner", "admin"]:
+        st.subheader("📢 Broadcast New Announcement")
+        with st.form("ann_form", clear_on_submit=True):
+            title = st.text_input("Title *")
+            category = st.selectbox("Category", [
+                "General", "Profit Distribution", "Withdrawal Update",
+                "License Granted", "Milestone", "EA Update", "Team Alert"
+            ])
+            message = st.text_area("Message *", height=150)
+            attachments = st.file_uploader("Attachments (Images/Proofs/Files - Permanent + Visible)", accept_multiple_files=True)
+
+            # FIXED: Pin checkbox default OFF
+            pin = st.checkbox("📌 Pin to Top", value=False)
+
+            submitted = st.form_submit_button("📢 Post Announcement", type="primary", use_container_width=True)
+            if submitted:
+                if not title.strip() or not message.strip():
+                    st.error("Title and message required")
+                else:
+                    try:
+                        resp = supabase.table("announcements").insert({
+                            "title": title.strip(),
+                            "message": message.strip(),
+                            "date": datetime.date.today().isoformat(),
+                            "posted_by": st.session_state.full_name,
+                            "likes": 0,
+                            "category": category,
+                            "pinned": pin  # Only True if explicitly checked
+                        }).execute()
+                        ann_id = resp.data[0]["id"]
+
+                        if attachments:
+                            progress = st.progress(0)
+                            for idx, file in enumerate(attachments):
+                                try:
+                                    url, storage_path = upload_to_supabase(
+                                        file=file,
+                                        bucket="announcements",
+                                        folder="attachments"
+                                    )
+                                    supabase.table("announcement_files").insert({
+                                        "announcement_id": ann_id,
+                                        "original_name": file.name,
+                                        "file_url": url,
+                                        "storage_path": storage_path
+                                    }).execute()
+                                except Exception as e:
+                                    st.warning(f"Attachment {file.name} failed: {str(e)}")
+                                progress.progress((idx + 1) / len(attachments))
+                            progress.empty()
+
+                        st.success("Announcement posted successfully! Images & files are fully visible.")
+                        invalidate_tables("announcements", "announcement_files")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+
+    # SEARCH & FILTER
+    st.subheader("🔍 Search & Filter")
+    col_s1, col_s2 = st.columns(2)
+    with col_s1:
+        search = st.text_input("Search title/message")
+    with col_s2:
+        cat_filter = st.selectbox("Category", ["All"] + sorted(set(a.get("category", "General") for a in announcements)))
+
+    filtered = [a for a in announcements if cat_filter == "All" or a.get("category") == cat_filter]
+    if search:
+        s = search.lower()
+        filtered = [a for a in filtered if s in a["title"].lower() or s in a["message"].lower()]
+
+    # Sort: Pinned first, then newest
+    filtered = sorted(filtered, key=lambda x: (not x.get("pinned", False), x["date"]), reverse=True)
+
+    # RICH FEED
+    st.subheader(f"📻 Live Feed ({len(filtered)} posts)")
+    if filtered:
+        for ann in filtered:
+            pinned = " 📌 PINNED" if ann.get("pinned") else ""
+            with st.container():
+                st.markdown(f"<h3 style='color:{accent_color};'>{ann['title']}{pinned}</h3>", unsafe_allow_html=True)
+                st.caption(f"{ann.get('category', 'General')} • by {ann['posted_by']} • {ann['date']}")
+                st.markdown(ann['message'])
+
+                # IMAGES (FULLY VISIBLE via signed URL)
+                images = [att for att in ann["attachments"] if att["original_name"].lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
+                if images:
+                    cols = st.columns(min(len(images), 4))
+                    for idx, att in enumerate(images):
+                        signed = att.get("signed_url")
+                        if signed:
+                            with cols[idx % 4]:
+                                st.image(signed, use_container_width=True)
+                        else:
+                            st.caption(f"{att['original_name']} (loading failed)")
+
+                # NON-IMAGES (downloadable)
+                non_images = [att for att in ann["attachments"] if not att["original_name"].lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
+                if non_images:
+                    st.markdown("**Files:**")
+                    for att in non_images:
+                        signed = att.get("signed_url")
+                        if signed:
+                            st.download_button(
+                                label=att['original_name'],
+                                data=deferred_download("announcements", att.get("storage_path"), signed),
+                                file_name=att['original_name'],
+                                mime="application/octet-stream",
+                                on_click="ignore",
+                                use_container_width=True,
+                                key=f"ann_dl_{att['id']}"
+                            )
+                        else:
+                            st.caption(att['original_name'])
+
+                # Likes
+                if st.button(f"❤️ {ann.get('likes', 0)}", key=f"like_{ann['id']}"):
+                    supabase.table("announcements").update({"likes": ann.get('likes', 0) + 1}).eq("id", ann["id"]).execute()
+                    invalidate_tables("announcements")
+                    st.rerun()
+
+                # Comments
+                with st.expander(f"💬 Comments ({len(ann['comments'])})", expanded=False):
+                    for c in ann["comments"]:
+                        st.markdown(f"**{c['user_name']}** • {c['timestamp'][:16].replace('T', ' ')}")
+                        st.markdown(c['message'])
+                        st.divider()
+                    with st.form(key=f"comment_form_{ann['id']}"):
+                        comment = st.text_area("Add comment...", height=80, label_visibility="collapsed")
+                        if st.form_submit_button("Post Comment"):
+                            if comment.strip():
+                                supabase.table("announcement_comments").insert({
+                                    "announcement_id": ann["id"],
+                                    "user_name": st.session_state.full_name,
+                                    "message": comment.strip(),
+                                    "timestamp": datetime.datetime.now().isoformat()
+                                }).execute()
+                                invalidate_tables("announcement_comments")
+                                st.rerun()
+
+                # Admin actions
+                if current_role in ["owner", "admin"]:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.button("📌 Pin/Unpin", key=f"pin_{ann['id']}"):
+                            supabase.table("announcements").update({"pinned": not ann.get("pinned", False)}).eq("id", ann["id"]).execute()
+                            invalidate_tables("announcements")
+                            st.rerun()
+                    with col2:
+                        if st.button("🗑️ Delete", key=f"del_{ann['id']}", type="secondary"):
+                            # Delete attachments from storage
+                            for att in ann["attachments"]:
+                                if att.get("storage_path"):
+                                    try:
+                                        supabase.storage.from_("announcements").remove(with_thumbnails(att["storage_path"]))
+                                    except:
+                                        pass
+                            # Delete DB records
+                            supabase.table("announcement_files").delete().eq("announcement_id", ann["id"]).execute()
+                            supabase.table("announcement_comments").delete().eq("announcement_id", ann["id"]).execute()
+                            supabase.table("announcements").delete().eq("id", ann["id"]).execute()
+                            st.success("Announcement deleted")
+                            invalidate_tables("announcements", "announcement_files", "announcement_comments")
+                            st.rerun()
+                st.divider()
+    else:
+        st.info("No announcements yet • Empire feed is ready!")
+
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Realtime Empire Feed
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            ✅ Pin to Top default OFF (fixed)<br>
+            ✅ Images & attachments FULLY VISIBLE & downloadable<br>
+            ✅ Permanent storage • Likes • Comments • Search • Empire connected.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX Announcements • Fully Fixed 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,181 @@
+# ====================== EA VERSIONS PAGE - FULL FINAL LATEST 2026 (PERMANENT STORAGE + LICENSE GATING + REALTIME + ELITE UI) ======================
+import datetime
+
+import streamlit as st
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.helpers import deferred_download, log_action, upload_to_supabase, user_directory
+from utils.supabase_client import supabase
+from utils.theme import accent_color
+
+
+def render():
+    st.header("EA Versions Management 🤖")
+    st.markdown("**Elite EA distribution: Owner release with changelog • Auto-announce • Download tracking • Latest version license gated • Permanent files • Realtime list**")
+ 
+    current_role = st.session_state.get("role", "guest")
+ 
+    # ULTRA-REALTIME CACHE (10s) • keyed by the client's name (None for owner/admin)
+    @cached_query("ea_versions", "ea_downloads", "users", "client_licenses", ttl=10)
+    def fetch_ea_full(client_name=None):
+        versions_resp = supabase.table("ea_versions").select("*").order("upload_date", desc=True).execute()
+        versions = versions_resp.data or []
+ 
+        downloads_resp = supabase.table("ea_downloads").select("*").execute()
+        downloads = downloads_resp.data or []
+ 
+        download_counts = {}
+        for d in downloads:
+            vid = d["version_id"]
+            download_counts[vid] = download_counts.get(vid, 0) + 1
+ 
+        # Client license check (proper user_id fetch)
+        client_license = None
+        if client_name:
+            me = user_directory().by_name(client_name)
+            if me:
+                user_id = me["id"]
+                license_resp = supabase.table("client_licenses").select("allow_live, version, revoked").eq("account_id", user_id).order("date_generated", desc=True).limit(1).execute()
+                if license_resp.data and not license_resp.data[0].get("revoked", False):
+                    client_license = license_resp.data[0]
+ 
+        return versions, download_counts, client_license
+ 
+    versions, download_counts, client_license = fetch_ea_full(
+        st.session_state.full_name if current_role == "client" else None
+    )
+ 
+    # Manual refresh
+    if st.button("🔄 Refresh EA Versions Now", use_container_width=True, type="secondary"):
+        fetch_ea_full.clear()
+        st.rerun()
+ 
+    st.caption("🔄 Versions auto-refresh every 10s • EA files PERMANENT in Supabase Storage")
+ 
+    # RELEASE NEW VERSION (OWNER ONLY)
+    if current_role == "owner":
+        st.subheader("📤 Release New EA Version")
+        with st.form("ea_release_form", clear_on_submit=True):
+            version_name = st.text_input("Version Name *", placeholder="e.g. v3.0 Elite Scalper 2026")
+            ea_file = st.file_uploader("Upload EA File (.ex5 / .mq5) *", type=["ex5", "mq5"])
+            changelog = st.text_area("Changelog *", height=200, placeholder="• New gold scalping filters\n• Reduced drawdown\n• FTMO optimized")
+            announce = st.checkbox("📢 Auto-Announce to Empire", value=True)
+ 
+            submitted = st.form_submit_button("🚀 Release Version", type="primary", use_container_width=True)
+            if submitted:
+                if not version_name.strip() or not ea_file or not changelog.strip():
+                    st.error("Version name, file, and changelog required")
+                else:
+                    try:
+                        url, storage_path = upload_to_supabase(
+                            file=ea_file,
+                            bucket="ea_versions",
+                            folder="releases"
+                        )
+ 
+                        supabase.table("ea_versions").insert({
+                            "version": version_name.strip(),
+                            "file_url": url,
+                            "storage_path": storage_path,
+                            "upload_date": datetime.date.today().isoformat(),
+                            "notes": changelog.strip()
+                        }).execute()
+ 
+                        if announce:
+                            supabase.table("announcements").insert({
+                                "title": f"🚀 New EA Version Released: {version_name.strip()}",
+                                "message": f"Elite update available!\n\n**Changelog:**\n{changelog.strip()}\n\nDownload now in EA Versions page.",
+                                "date": datetime.date.today().isoformat(),
+                                "posted_by": st.session_state.full_name,
+                                "category": "EA Update",
+                                "pinned": True
+                            }).execute()
+ 
+                        log_action("EA Version Released (Permanent)", version_name.strip())
+                        st.success(f"Version {version_name} released permanently!")
+                        st.balloons()
+                        invalidate_tables("ea_versions", "announcements")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Release failed: {str(e)}")
+    elif current_role == "admin":
+        st.info("Admins can view & track downloads • Owner releases new versions")
+ 
+    # REALTIME VERSION LIST
+    st.subheader("Available EA Versions")
+    if versions:
+        latest_version = versions[0]
+        for v in versions:
+            vid = v["id"]
+            downloads = download_counts.get(vid, 0)
+            file_url = v.get("file_url")
+            is_latest = v == latest_version
+ 
+            # License gating
+            can_download = True
+            gating_msg = ""
+            if current_role == "client" and is_latest and client_license:
+                if not client_license.get("allow_live", False):
+                    can_download = False
+                    gating_msg = "🔒 Active LIVE license required for latest version • Contact owner"
+                elif client_license.get("revoked", False):
+                    can_download = False
+                    gating_msg = "🔒 Your license is revoked • Contact owner"
+ 
+            with st.expander(f"🤖 {v['version']} • Released {v['upload_date']} • {downloads} downloads" + (" 👑 LATEST" if is_latest else ""), expanded=is_latest):
+                st.markdown(f"**Changelog:**\n{v['notes'].replace(chr(10), '<br>')}", unsafe_allow_html=True)
+ 
+                if gating_msg:
+                    st.warning(gating_msg)
+ 
+                if file_url and can_download:
+                    if st.download_button(
+                        f"⬇️ Download {v['version']}",
+                        data=deferred_download("ea_versions", v.get("storage_path"), file_url),
+                        file_name=f"KMFX_EA_{v['version']}.ex5",
+                        use_container_width=True,
+                        key=f"dl_ea_{vid}"
+                    ):
+                        try:
+                            supabase.table("ea_downloads").insert({
+                                "version_id": vid,
+                                "downloaded_by": st.session_state.full_name,
+                                "download_date": datetime.date.today().isoformat()
+                            }).execute()
+                            log_action("EA Downloaded", f"{v['version']} by {st.session_state.full_name}")
+                            invalidate_tables("ea_downloads")
+                        except:
+                            pass
+                elif file_url:
+                    st.info("Contact owner for access")
+                else:
+                    st.error("File missing • Contact owner")
+ 
+                # Owner delete
+                if current_role == "owner":
+                    if st.button("🗑️ Delete Version Permanently", key=f"del_ea_{vid}", type="secondary"):
+                        try:
+                            if v.get("storage_path"):
+                                supabase.storage.from_("ea_versions").remove([v["storage_path"]])
+                            supabase.table("ea_versions").delete().eq("id", vid).execute()
+                            supabase.table("ea_downloads").delete().eq("version_id", vid).execute()
+                            st.success("Version deleted permanently")
+                            invalidate_tables("ea_versions", "ea_downloads")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+    else:
+        st.info("No EA versions released yet • Owner uploads activate elite distribution")
+ 
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Elite EA Distribution System
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            Permanent files • License gating on latest • Download tracked • Auto-announce • Owner control • Empire performance elite.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX EA Versions • Cloud Permanent 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,232 @@
+# ====================== FILE VAULT PAGE - FULL FINAL LATEST 2026 (PERMANENT SUPABASE STORAGE + REALTIME + ELITE GRID) ======================
+import datetime
+
+import streamlit as st
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.helpers import deferred_download, live_select, log_action, thumbnail_urls, upload_to_supabase, user_directory, watch_tables
+from utils.supabase_client import supabase
+from utils.theme import accent_color
+from utils.thumbnails import IMAGE_EXTENSIONS, with_thumbnails
+
+
+def render():
+    st.header("Secure File Vault 📦")
+    st.markdown("**Permanent encrypted storage • All file types supported • Proofs & documents secured • Auto-assigned access • Realtime grid with full previews**")
+ 
+    current_role = st.session_state.get("role", "guest")
+ 
+    # LIVE CACHE: realtime events invalidate it • ttl is only a safety net
+    @cached_query("client_files", ttl=300)
+    def fetch_vault_data():
+        return live_select("client_files", "upload_date")
+ 
+    files = fetch_vault_data()
+    registered_clients = user_directory().names("client")
+    watch_tables("client_files")
+ 
+    # Manual refresh button
+    if st.button("🔄 Refresh Vault Now", use_container_width=True, type="secondary"):
+        fetch_vault_data.clear()
+        st.rerun()
+ 
+    st.caption("🔄 Vault updates live • All files PERMANENT in Supabase Storage")
+ 
+    # CLIENT VIEW RESTRICTION
+    if current_role == "client":
+        my_name = st.session_state.full_name
+        files = [f for f in files if f["sent_by"] == my_name or f.get("assigned_client") == my_name]
+        st.info(f"Showing only your files ({len(files)} total)")
+ 
+    # UPLOAD SECTION (OWNER/ADMIN ONLY)
+    if current_role in ["owner", "admin"]:
+        st.subheader("📤 Upload New Files (Permanent Storage)")
+        # Payout / withdrawal proofs can be linked to their request (shown on its Withdrawals card)
+        # Options are the ids (labels can repeat: same client / amount / status / day)
+        withdrawal_labels = {None: "None"}
+        withdrawal_labels.update({
+            w["id"]: f"#{w['id']} • {w['client_name']} • ${w['amount']:,.0f} • {w['status']} • {w['date_requested']}"
+            for w in live_select("withdrawals", "date_requested")
+        })
+        with st.form("file_upload_form", clear_on_submit=True):
+            col_upload, col_options = st.columns([3, 2])
+            with col_upload:
+                uploaded_files = st.file_uploader(
+                    "Choose files (PDF, images, .ex5, zip, docs, etc.)",
+                    accept_multiple_files=True,
+                    help="Max 200MB per file • All types supported • .ex5 fully allowed"
+                )
+            with col_options:
+                category = st.selectbox("Category", [
+                    "Payout Proof", "Withdrawal Proof", "Agreement", "KYC/ID",
+                    "Contributor Contract", "Testimonial Image", "EA File", "License Key", "Other"
+                ])
+                assigned_client = st.selectbox("Assign to Client (optional)", ["None"] + registered_clients)
+                linked_withdrawal = st.selectbox("Link to Withdrawal (optional)", list(withdrawal_labels), format_func=withdrawal_labels.get)
+                tags = st.text_input("Tags (comma-separated)", placeholder="e.g. payout, 2026, ex5")
+                notes = st.text_area("Notes (Optional)", height=100)
+ 
+            submitted = st.form_submit_button("📤 Upload Permanently", type="primary", use_container_width=True)
+            if submitted and uploaded_files:
+                success_count = 0
+                failed = []
+                progress = st.progress(0)
+                status = st.empty()
+                for idx, file in enumerate(uploaded_files):
+                    status.text(f"Uploading {file.name} ({idx+1}/{len(uploaded_files)})...")
+                    try:
+                        url, storage_path = upload_to_supabase(
+                            file=file,
+                            bucket="client_files",
+                            folder="vault",
+                            use_signed_url=False,
+                            thumbnails=True  # vault grid
+                        )
+                        supabase.table("client_files").insert({
+                            "original_name": file.name,
+                            "file_url": url,
+                            "storage_path": storage_path,
+                            "upload_date": datetime.date.today().isoformat(),
+                            "sent_by": st.session_state.full_name,
+                            "category": category,
+                            "assigned_client": assigned_client if assigned_client != "None" else None,
+                            "tags": tags.strip() or None,
+                            "notes": notes.strip() or None,
+                            "withdrawal_id": linked_withdrawal
+                        }).execute()
+                        success_count += 1
+                        log_action("File Uploaded (Permanent)", f"{file.name} → {category} → {assigned_client}")
+                    except Exception as e:
+                        failed.append(f"{file.name}: {str(e)}")
+                    progress.progress((idx + 1) / len(uploaded_files))
+                status.empty()
+                progress.empty()
+                if success_count:
+                    st.success(f"**{success_count}/{len(uploaded_files)}** files uploaded permanently!")
+                    invalidate_tables("client_files")
+                    st.rerun()
+                if failed:
+                    st.error("Some uploads failed:")
+                    for f in failed:
+                        st.caption(f"• {f}")
+ 
+    # ADVANCED FILTERS & SEARCH
+    st.subheader("🔍 Search & Filter Vault")
+    col_f1, col_f2, col_f3, col_f4 = st.columns(4)
+    with col_f1:
+        search = st.text_input("Search name/tags/notes", placeholder="e.g. payout proof, .ex5")
+    with col_f2:
+        cat_filter = st.selectbox("Category", ["All"] + sorted(set(f.get("category", "Other") for f in files)))
+    with col_f3:
+        client_filter = st.selectbox("Assigned Client", ["All"] + sorted(set(f.get("assigned_client") for f in files if f.get("assigned_client"))))
+    with col_f4:
+        sort_by = st.selectbox("Sort By", ["Newest First", "Oldest First", "Name A-Z", "Name Z-A"])
+ 
+    # Apply filters
+    filtered = files
+    if search:
+        s = search.lower()
+        filtered = [f for f in filtered if s in f["original_name"].lower() or
+                    s in (f.get("tags") or "").lower() or
+                    s in (f.get("notes") or "").lower()]
+    if cat_filter != "All":
+        filtered = [f for f in filtered if f.get("category") == cat_filter]
+    if client_filter != "All":
+        filtered = [f for f in filtered if f.get("assigned_client") == client_filter]
+ 
+    # Sorting
+    reverse_sort = False
+    if sort_by == "Newest First":
+        key = lambda x: x["upload_date"]
+        reverse_sort = True
+    elif sort_by == "Oldest First":
+        key = lambda x: x["upload_date"]
+    elif sort_by == "Name A-Z":
+        key = lambda x: x["original_name"].lower()
+    elif sort_by == "Name Z-A":
+        key = lambda x: x["original_name"].lower()
+        reverse_sort = True
+    filtered = sorted(filtered, key=key, reverse=reverse_sort)
+ 
+    # REALTIME GRID DISPLAY
+    st.subheader(f"Vault Contents ({len(filtered)} files)")
+    if filtered:
+        # Tiles show stored thumbnails • the original is only downloaded via "View full size"
+        thumbs = thumbnail_urls("client_files", [f.get("storage_path") for f in filtered
+                                                 if f["original_name"].lower().endswith(IMAGE_EXTENSIONS)])
+        cols = st.columns(3)
+        for idx, f in enumerate(filtered):
+            with cols[idx % 3]:
+                file_url = f.get("file_url")
+                assigned = f.get("assigned_client")
+                tags = f.get("tags", "")
+                notes = f.get("notes", "")
+ 
+                # Glass card
+                st.markdown(f"""
+                <div style="background:rgba(30,35,45,0.7); backdrop-filter:blur(12px); border-radius:16px; padding:1.4rem; margin-bottom:1.6rem; box-shadow:0 6px 20px rgba(0,0,0,0.15); border:1px solid rgba(100,100,100,0.25);">
+                """, unsafe_allow_html=True)
+ 
+                # Preview
+                thumb_url = thumbs.get(f.get("storage_path"))
+                if file_url and f["original_name"].lower().endswith(IMAGE_EXTENSIONS):
+                    st.image(thumb_url or file_url, use_container_width=True)
+                    if thumb_url:
+                        st.markdown(f"[🔍 View full size]({file_url})")
+                else:
+                    st.markdown("<div style='height:140px; background:rgba(50,55,65,0.5); border-radius:10px; display:flex; align-items:center; justify-content:center; color:#aaa; font-size:1rem;'>No Preview</div>", unsafe_allow_html=True)
+ 
+                st.markdown(f"**{f['original_name']}**")
+                st.caption(f"{f['upload_date']} • Uploaded by {f['sent_by']}")
+                st.caption(f"Category: **{f.get('category','Other')}**")
+                if assigned:
+                    st.caption(f"Assigned: **{assigned}**")
+                if tags:
+                    st.caption(f"Tags: {tags}")
+ 
+                # Notes
+                if notes:
+                    with st.expander("Notes"):
+                        st.write(notes)
+ 
+                # Download (fetched only on click — no per-file request on render)
+                if file_url:
+                    st.download_button(
+                        "⬇ Download",
+                        data=deferred_download("client_files", f.get("storage_path"), file_url),
+                        file_name=f["original_name"],
+                        on_click="ignore",
+                        use_container_width=True,
+                        key=f"dl_{f['id']}_{idx}"
+                    )
+ 
+                # Delete (owner/admin only)
+                if current_role in ["owner", "admin"]:
+                    if st.button("🗑️ Delete Permanently", key=f"del_{f['id']}_{idx}", type="secondary", use_container_width=True):
+                        try:
+                            if f.get("storage_path"):
+                                supabase.storage.from_("client_files").remove(with_thumbnails(f["storage_path"]))
+                            supabase.table("client_files").delete().eq("id", f["id"]).execute()
+                            st.success(f"Deleted: {f['original_name']}")
+                            log_action("File Deleted (Permanent)", f"{f['original_name']} by {st.session_state.full_name}")
+                            invalidate_tables("client_files")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Delete failed: {str(e)}")
+ 
+                st.markdown("</div>", unsafe_allow_html=True)
+    else:
+        st.info("No files match your filters • Vault is clean and permanent")
+ 
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Permanent Secure Vault
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            Supabase Storage • Full previews • Advanced search/filter/sort • Permanent delete • Client restricted • Empire documents fortress.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX File Vault • Cloud Permanent 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
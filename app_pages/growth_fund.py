@@ -0,0 +1,199 @@
+# ====================== GROWTH FUND PAGE - FULL FINAL LATEST 2026 (FULLY SUPABASE SYNCED + INSTANT MV + REALTIME EVERYTHING) ======================
+import datetime
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.projections import DEFAULT_GROSS_PER_ACC, empire_profit_stats, project
+from utils.supabase_client import supabase
+from utils.theme import accent_color
+
+
+def render():
+    st.header("Growth Fund Management 🌱")
+    st.markdown("**Empire reinvestment engine: 100% automatic inflows from profit distributions • Full source transparency with auto-trees • Advanced projections & scaling simulations • Manual adjustments • Instant sync across dashboard, profits, balances.**")
+ 
+    current_role = st.session_state.get("role", "guest")
+ 
+    # INSTANT FULL REALTIME CACHE (10s for ultra-realtime)
+    @cached_query("growth_fund_transactions", "profits", "ftmo_accounts", ttl=10)
+    def fetch_gf_full_data():
+        try:
+            # INSTANT balance from materialized view (lightning fast)
+            gf_resp = supabase.table("mv_growth_fund_balance").select("balance").single().execute()
+            gf_balance = gf_resp.data["balance"] if gf_resp.data else 0.0
+         
+            # All transactions (realtime history)
+            trans_resp = supabase.table("growth_fund_transactions").select("*").order("date", desc=True).execute()
+            transactions = trans_resp.data or []
+         
+            # Auto-sources breakdown for tree (+ gross for projection stats)
+            profits_resp = supabase.table("profits").select("id, account_id, record_date, gross_profit, growth_fund_add").execute()
+            all_profits = profits_resp.data or []
+            profits = [p for p in all_profits if (p.get("growth_fund_add") or 0) > 0]
+         
+            accounts_resp = supabase.table("ftmo_accounts").select("id, name").execute()
+            account_map = {a["id"]: a["name"] for a in accounts_resp.data or []}
+         
+            auto_sources = {}
+            for p in profits:
+                acc_name = account_map.get(p["account_id"], "Unknown Account")
+                key = f"{acc_name} ({p['record_date']})"
+                auto_sources[key] = auto_sources.get(key, 0) + p["growth_fund_add"]
+         
+            # Manual sources
+            manual_sources = {}
+            for t in transactions:
+                if t["type"] == "Out" or t.get("account_source") == "Manual" or not t.get("description", "").startswith("Auto"):
+                    key = t.get("description") or t.get("account_source") or ("Manual Out" if t["type"] == "Out" else "Manual In")
+                    amount = -t["amount"] if t["type"] == "Out" else t["amount"]
+                    manual_sources[key] = manual_sources.get(key, 0) + amount
+         
+            # Current empire accounts + real profit stats for projections
+            empire_resp = supabase.table("mv_empire_summary").select("total_accounts").single().execute()
+            total_accounts = empire_resp.data["total_accounts"] if empire_resp.data else 0
+            avg_per_acc, realized_gf_pct = empire_profit_stats(all_profits, total_accounts)
+         
+            return transactions, gf_balance, auto_sources, manual_sources, total_accounts, avg_per_acc, realized_gf_pct
+        except Exception as e:
+            st.error(f"Growth Fund data error: {e}")
+            return [], 0.0, {}, {}, 0, DEFAULT_GROSS_PER_ACC, None
+ 
+    transactions, gf_balance, auto_sources, manual_sources, total_accounts, avg_per_acc, realized_gf_pct = fetch_gf_full_data()
+ 
+    # Manual refresh button
+    if st.button("🔄 Refresh Growth Fund Now", use_container_width=True, type="secondary"):
+        fetch_gf_full_data.clear()
+        st.rerun()
+ 
+    # KEY METRICS (INSTANT FROM MV)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Current Growth Fund (Instant)", f"${gf_balance:,.0f}")
+    auto_in = sum(auto_sources.values())
+    col2.metric("Total Auto Inflows", f"${auto_in:,.0f}")
+    manual_in = sum(v for v in manual_sources.values() if v > 0)
+    col3.metric("Total Manual In", f"${manual_in:,.0f}")
+    outflows = sum(abs(v) for v in manual_sources.values() if v < 0)
+    col4.metric("Total Outflows", f"${outflows:,.0f}")
+ 
+    # REALTIME SOURCE TREE
+    st.subheader("🌳 All Inflow/Outflow Sources Tree (Realtime Auto + Manual)")
+    all_sources = {**auto_sources, **manual_sources}
+    if all_sources:
+        labels = ["Growth Fund"]
+        values = []
+        colors = []
+        source = []
+        target = []
+        idx = 1
+ 
+        for key, amount in all_sources.items():
+            labels.append(key)
+            values.append(abs(amount))
+            colors.append(accent_color if amount > 0 else "#ff6b6b")
+            source.append(0)
+            target.append(idx)
+            idx += 1
+ 
+        fig = go.Figure(data=[go.Sankey(
+            node=dict(pad=20, thickness=30, label=labels, color=["#ffd700"] + colors),
+            link=dict(source=source, target=target, value=values)
+        )])
+        fig.update_layout(height=600, title="Complete Flow by Source")
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Growth Fund empty • Activates with first profit or manual transaction")
+ 
+    # MANUAL TRANSACTION (OWNER/ADMIN ONLY)
+    if current_role in ["owner", "admin"]:
+        with st.expander("➕ Manual Transaction (Scaling/Reinvestment)", expanded=False):
+            with st.form("gf_manual_form", clear_on_submit=True):
+                col_t1, col_t2 = st.columns([1, 2])
+                with col_t1:
+                    trans_type = st.selectbox("Type", ["In", "Out"])
+                with col_t2:
+                    amount = st.number_input("Amount (USD)", min_value=0.01, step=100.0)
+                purpose = st.selectbox("Purpose", ["New Challenge Purchase", "Scaling Capital", "EA Development", "Team Bonus", "Operational", "Other"])
+                desc = st.text_area("Description (Optional)")
+                trans_date = st.date_input("Date", datetime.date.today())
+ 
+                submitted = st.form_submit_button("Record Transaction", type="primary", use_container_width=True)
+                if submitted:
+                    try:
+                        supabase.table("growth_fund_transactions").insert({
+                            "date": str(trans_date),
+                            "type": trans_type,
+                            "amount": amount,
+                            "description": desc or purpose,
+                            "account_source": "Manual",
+                            "recorded_by": st.session_state.full_name
+                        }).execute()
+                        st.success("Transaction recorded instantly! GF balance & tree updated realtime.")
+                        invalidate_tables("growth_fund_transactions")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+ 
+    # FULL HISTORY TABLE
+    st.subheader("📜 Complete Transaction History (Realtime)")
+    if transactions:
+        df = pd.DataFrame(transactions)
+        df["Amount"] = df.apply(lambda row: f"+${row['amount']:,.0f}" if row["type"] == "In" else f"-${row['amount']:,.0f}", axis=1)
+        df["Type"] = df["type"].map({"In": "✅ In", "Out": "❌ Out"})
+        df["Source"] = df.apply(lambda row: row["account_source"] if row["account_source"] != "Manual" else row["description"] or "Manual", axis=1)
+        df_display = df[["date", "Type", "Amount", "Source", "recorded_by"]].rename(columns={
+            "date": "Date", "Source": "Source/Description", "recorded_by": "Recorded By"
+        })
+        st.dataframe(df_display, use_container_width=True, hide_index=True)
+    else:
+        st.info("No transactions yet • Auto-inflows start with profits")
+ 
+    # ADVANCED PROJECTIONS (AUTO-LOADED CURRENT STATS)
+    st.subheader("🔮 Advanced Scaling Projections (Auto-Loaded Empire Stats)")
+    col_proj1, col_proj2 = st.columns(2)
+    with col_proj1:
+        months = st.slider("Projection Months", 6, 72, 36)
+        projected_accounts = st.slider("Projected Active Accounts", total_accounts, total_accounts + 30, total_accounts + 10)
+        avg_monthly_profit = st.number_input("Avg Monthly Gross per Account (USD)", value=avg_per_acc, step=1000.0, help="Auto-loaded historical average per account (or default if no data)")
+        gf_pct = st.slider("Growth Fund % from Profits", 0.0, 50.0, min(realized_gf_pct, 50.0) if realized_gf_pct else 20.0, help="Auto-loaded realized GF share of all recorded gross profit")
+    with col_proj2:
+        monthly_manual = st.number_input("Additional Monthly Manual In (USD)", value=0.0, step=1000.0)
+        gross_growth_pct = st.number_input("Monthly Gross Growth % (compounding)", value=0.0, step=0.5)
+        gf_return_pct = st.number_input("GF Monthly Return % (reinvested)", value=0.0, step=0.5)
+ 
+    projected_monthly_gross = avg_monthly_profit * projected_accounts
+    projected_monthly_gf = projected_monthly_gross * (gf_pct / 100) + monthly_manual
+ 
+    # Whole trajectory in ONE kernel call (same kernel as the Simulator)
+    dates = [datetime.date.today() + datetime.timedelta(days=30*i) for i in range(months + 1)]
+    gf_proj = project(
+        months, projected_monthly_gross, gf_pct=gf_pct, manual_in=monthly_manual, start_gf=gf_balance,
+        gross_growth_pct=gross_growth_pct, gf_return_pct=gf_return_pct
+    )["growth_fund"]
+ 
+    fig_proj = go.Figure()
+    fig_proj.add_trace(go.Scatter(x=dates, y=gf_proj, mode='lines+markers', line=dict(color=accent_color, width=6)))
+    fig_proj.add_hline(y=gf_balance * 10, line_dash="dash", line_color="#ffd700", annotation_text="10x Current Target")
+    fig_proj.update_layout(height=500, title=f"Projected GF Growth (+${projected_monthly_gf:,.0f}/month)")
+    st.plotly_chart(fig_proj, use_container_width=True)
+ 
+    st.metric(f"Projected Balance in {months} Months", f"${gf_proj[-1]:,.0f}")
+    if gf_proj[-1] >= gf_balance * 10:
+        st.success("🚀 On track for 10x Growth Fund!")
+    elif gf_proj[-1] >= gf_balance * 5:
+        st.success("🔥 Strong growth trajectory!")
+ 
+    # MOTIVATIONAL FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Automatic Reinvestment Engine
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            Instant MV balance • Realtime trees & history • Manual control • Projections auto-loaded • Empire compounds itself.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX Growth Fund • Fully Automatic & Realtime 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
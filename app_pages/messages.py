@@ -0,0 +1,250 @@
+# ====================== MESSAGES PAGE ======================
+import datetime
+
+import streamlit as st
+
+from utils.cache_tags import invalidate_tables, table_versions
+from utils.helpers import log_action, upload_to_supabase, user_directory, watch_tables
+from utils.message_sync import MessageSync
+from utils.supabase_client import supabase
+from utils.theme import accent_primary, theme_colors
+
+
+def render():
+    st.header("Private Messages 💬")
+    st.markdown(
+        "**Secure 1:1 communication • File attachments with inline previews • "
+        "Search • Balance context • Realtime updates**"
+    )
+
+    current_role = st.session_state.get("role", "guest")
+    my_name = st.session_state.full_name
+    colors = theme_colors(st.session_state.theme)
+    card_bg, card_shadow, text_primary = colors.card_bg, colors.card_shadow, colors.text_primary
+
+    # ────────────────────────────────────────────────
+    # Fetch data - users from the shared directory • messages synced incrementally per session
+    # ────────────────────────────────────────────────
+    users = user_directory()
+
+    # One MessageSync per session & account: only rows newer than its (timestamp, id)
+    # cursor are fetched on refresh • history pages in per conversation on demand
+    msg_sync = st.session_state.get("message_sync")
+    msg_scope = None if current_role in ["owner", "admin"] else my_name
+    if msg_sync is None or st.session_state.get("message_sync_owner") != (my_name, current_role):
+        msg_sync = MessageSync(supabase, scope=msg_scope)
+        st.session_state.message_sync = msg_sync
+        st.session_state.message_sync_owner = (my_name, current_role)
+    # Cursor query only when `messages` moved (realtime event / a send) since the last sync
+    msg_sync.sync(version=table_versions(("messages",)))
+    watch_tables("messages")
+
+    # Name lookup (prebuilt in the directory)
+    name_by_id = users.mapping("id", "full_name")
+
+    # ────────────────────────────────────────────────
+    # Determine who we're chatting with
+    # ────────────────────────────────────────────────
+    if current_role in ["owner", "admin"]:
+        client_names = users.names("client")
+        if not client_names:
+            st.info("No clients yet. Messaging will activate once team members are added.")
+            st.stop()
+
+        client_options = {
+            f"{name} (Balance: ${users.balance_of(name):,.2f})": name
+            for name in sorted(client_names)
+        }
+
+        selected_name = st.selectbox(
+            "Chat with team member",
+            options=list(client_options.keys()),
+            index=0,
+            key="admin_chat_select"
+        )
+        partner_name = client_options[selected_name]
+        partner_balance = users.balance_of(partner_name)
+
+        st.info(f"**Chatting with:** {partner_name} • Balance: **${partner_balance:,.2f}**")
+
+        # Filter messages for this partner
+        convo_key = partner_name
+        convo = [
+            m for m in msg_sync.conversation(convo_key)
+            if (m.get("from_client") == partner_name and m.get("to_client") is None) or
+               (m.get("from_admin") == my_name and m.get("to_client") == partner_name) or
+               (m.get("from_client") == partner_name and m.get("to_client") == my_name)
+        ]
+
+    else:  # Client view — always talking to admin / system
+        partner_name = "KMFX Admin"
+        partner_balance = None  # Admin has no balance shown to clients
+
+        st.info("**Private channel with KMFX Admin** • Updates on profits, withdrawals, licenses, etc.")
+
+        convo_key = my_name
+        convo = msg_sync.conversation(convo_key)
+
+    # ────────────────────────────────────────────────
+    # Chat display
+    # ────────────────────────────────────────────────
+    if msg_sync.has_older(convo_key):
+        if st.button("⬆️ Load older messages", key="msg_load_older"):
+            msg_sync.load_older(convo_key)
+            st.rerun()
+
+    if convo:
+        search_term = st.text_input("Search loaded messages", "", key="msg_search")
+        if search_term:
+            search_lower = search_term.lower()
+            display_msgs = [m for m in convo if search_lower in m["message"].lower()]
+        else:
+            display_msgs = convo
+
+        # Chat container with auto-scroll behavior
+        chat_container = st.container()
+        with chat_container:
+            for msg in display_msgs:
+                # Determine direction and sender
+                if current_role in ["owner", "admin"]:
+                    is_from_me = msg.get("from_admin") == my_name
+                    sender_name = my_name if is_from_me else (msg.get("from_client") or "System")
+                else:
+                    is_from_me = msg.get("from_client") == my_name
+                    sender_name = my_name if is_from_me else "KMFX Admin"
+
+                align = "flex-end" if is_from_me else "flex-start"
+                bubble_bg = accent_primary if is_from_me else card_bg
+                text_color = "#000000" if is_from_me else text_primary
+                time_str = msg["timestamp"][:16].replace("T", " ")
+
+                # Message bubble
+                st.markdown(
+                    f"""
+                    <div style="
+                        display: flex;
+                        justify-content: {align};
+                        margin: 1.1rem 0;
+                    ">
+                        <div style="
+                            background: {bubble_bg};
+                            color: {text_color};
+                            padding: 1.1rem 1.5rem;
+                            border-radius: 20px;
+                            max-width: 78%;
+                            box-shadow: {card_shadow};
+                            position: relative;
+                        ">
+                            <div style="font-weight: 600; margin-bottom: 0.4rem;">
+                                {sender_name}
+                            </div>
+                            <div style="font-size: 0.9rem; opacity: 0.7; margin-bottom: 0.6rem;">
+                                {time_str}
+                            </div>
+                            {msg['message'].replace('\n', '<br>')}
+                        </div>
+                    </div>
+                    """,
+                    unsafe_allow_html=True
+                )
+
+        # Fake auto-scroll effect (Streamlit limitation workaround)
+        st.markdown(
+            """
+            <script>
+            const chat = window.parent.document.querySelectorAll('.stChatMessage, .stContainer')[-1];
+            if (chat) chat.scrollIntoView({behavior: 'smooth', block: 'end'});
+            </script>
+            """,
+            unsafe_allow_html=True
+        )
+
+        st.caption(f"{len(convo)} message{'s' if len(convo) != 1 else ''} • newest at bottom")
+
+    else:
+        st.info("No messages yet. Start the conversation below ↓")
+
+    # ────────────────────────────────────────────────
+    # Send message form
+    # ────────────────────────────────────────────────
+    st.subheader("Send a Message")
+    with st.form("send_message_form", clear_on_submit=True):
+        col_msg, col_file = st.columns([3, 2])
+
+        with col_msg:
+            new_message = st.text_area(
+                "Your message...",
+                height=110,
+                placeholder="Type here...",
+                label_visibility="collapsed",
+                key="new_msg_input"
+            )
+
+        with col_file:
+            attached_files = st.file_uploader(
+                "Attach images / files (visible inline)",
+                accept_multiple_files=True,
+                type=["png", "jpg", "jpeg", "gif", "pdf", "txt", "docx"],
+                key="msg_attach"
+            )
+
+        submitted = st.form_submit_button("Send →", type="primary", use_container_width=True)
+
+        if submitted:
+            if not new_message.strip() and not attached_files:
+                st.error("Please write a message or attach at least one file.")
+            else:
+                with st.spinner("Sending..."):
+                    try:
+                        # Build message content
+                        content_parts = [new_message.strip()] if new_message.strip() else []
+
+                        # Handle attachments
+                        if attached_files:
+                            for file in attached_files:
+                                try:
+                                    url, _ = upload_to_supabase(
+                                        file=file,
+                                        bucket="messages",
+                                        folder="chat_attachments",
+                                        use_signed_url=False  # assuming public bucket
+                                    )
+
+                                    if file.type.startswith("image/"):
+                                        content_parts.append(f"![{file.name}]({url})")
+                                    else:
+                                        content_parts.append(f"[{file.name}]({url})")
+                                except Exception as upload_err:
+                                    st.warning(f"Could not upload {file.name}: {upload_err}")
+
+                        final_content = "\n\n".join(content_parts) or "📎 Attachment only"
+
+                        # Prepare insert
+                        insert_row = {
+                            "message": final_content,
+                            "timestamp": datetime.datetime.now().isoformat()
+                        }
+
+                        if current_role in ["owner", "admin"]:
+                            insert_row["from_admin"] = my_name
+                            insert_row["to_client"] = partner_name
+                        else:
+                            insert_row["from_client"] = my_name
+                            # to_admin is implicit (or you can add "to_admin": "KMFX Admin")
+
+                        supabase.table("messages").insert(insert_row).execute()
+
+                        log_action(
+                            "Private Message Sent",
+                            f"{'To ' + partner_name if current_role in ['owner','admin'] else 'From client'}"
+                        )
+
+                        st.success("Message sent!")
+                        invalidate_tables("messages")
+                        msg_sync.sync(force=True)
+                        st.rerun()
+
+                    except Exception as e:
+                        st.error(f"Failed to send message: {str(e)}")
+
+    st.caption("ℹ️ Auto-messages (profit shares, withdrawals, licenses) appear here automatically.")
@@ -0,0 +1,183 @@
+# ====================== NOTIFICATIONS PAGE - FULL FINAL LATEST 2026 (REALTIME + UNREAD BADGES + SEARCH + ELITE CARDS) ======================
+import datetime
+
+import streamlit as st
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.helpers import live_select, user_directory, watch_tables
+from utils.supabase_client import supabase
+from utils.theme import accent_color
+
+
+def render():
+    st.header("Empire Notifications 🔔")
+    st.markdown("**Realtime alert system: Auto-push on profits, withdrawals, licenses, milestones • Prominent unread badges • Search & filters • Mark read • Instant sync & team alignment.**")
+ 
+    current_role = st.session_state.get("role", "guest")
+ 
+    # LIVE CACHE: realtime events invalidate it • ttl is only a safety net
+    @cached_query("notifications", ttl=300)
+    def fetch_notifications_full():
+        return live_select("notifications", "date")
+ 
+    notifications = fetch_notifications_full()
+    users = user_directory()
+    client_names = users.names("client")
+    watch_tables("notifications")
+ 
+    # Manual refresh
+    if st.button("🔄 Refresh Notifications Now", use_container_width=True, type="secondary"):
+        fetch_notifications_full.clear()
+        st.rerun()
+ 
+    st.caption("🔄 Notifications update live • Auto-push on key events")
+ 
+    # CLIENT VIEW: Own notifications + unread count
+    if current_role == "client":
+        my_name = st.session_state.full_name
+        my_notifications = [n for n in notifications if n["client_name"] == my_name]
+        unread_count = sum(1 for n in my_notifications if n.get("read", 0) == 0)
+ 
+        st.subheader(f"Your Notifications 🔔")
+        if unread_count > 0:
+            st.markdown(f"### 🟡 {unread_count} Unread Alert{'' if unread_count == 1 else 's'}")
+        else:
+            st.markdown("### ✅ All caught up!")
+    else:
+        # OWNER/ADMIN: All notifications
+        my_notifications = notifications
+        st.subheader("All Empire Notifications")
+ 
+    # SEND NEW NOTIFICATION (OWNER/ADMIN)
+    if current_role in ["owner", "admin"]:
+        st.subheader("📢 Send New Notification")
+        with st.form("notif_form", clear_on_submit=True):
+            target = st.selectbox("Send to", ["All Clients"] + client_names)
+            category = st.selectbox("Category", [
+                "Profit Share", "Withdrawal Update", "License Granted", 
+                "Milestone", "EA Update", "General Alert", "Team Message"
+            ])
+            title = st.text_input("Title *", placeholder="e.g. New Profit Distributed!")
+            message = st.text_area("Message *", height=150, placeholder="Details here...")
+ 
+            submitted = st.form_submit_button("🔔 Send Alert", type="primary", use_container_width=True)
+            if submitted:
+                if not title.strip() or not message.strip():
+                    st.error("Title and message required")
+                else:
+                    try:
+                        inserts = []
+                        if target == "All Clients":
+                            for name in client_names:
+                                inserts.append({
+                                    "client_name": name,
+                                    "title": title.strip(),
+                                    "message": message.strip(),
+                                    "date": datetime.date.today().isoformat(),
+                                    "category": category,
+                                    "read": 0
+                                })
+                        else:
+                            inserts.append({
+                                "client_name": target,
+                                "title": title.strip(),
+                                "message": message.strip(),
+                                "date": datetime.date.today().isoformat(),
+                                "category": category,
+                                "read": 0
+                            })
+                        if inserts:
+                            supabase.table("notifications").insert(inserts).execute()
+                        st.success(f"Notification sent to {'all clients' if target == 'All Clients' else target}!")
+                        invalidate_tables("notifications")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+ 
+    # SEARCH & FILTER
+    st.subheader("🔍 Search & Filter")
+    col_s1, col_s2 = st.columns(2)
+    with col_s1:
+        search = st.text_input("Search title/message", placeholder="e.g. profit, license")
+    with col_s2:
+        cat_filter = st.selectbox("Category", ["All"] + sorted(set(n.get("category", "General") for n in my_notifications)))
+ 
+    # Apply filters
+    filtered = my_notifications
+    if search:
+        s = search.lower()
+        filtered = [n for n in filtered if s in n["title"].lower() or s in n["message"].lower()]
+    if cat_filter != "All":
+        filtered = [n for n in filtered if n.get("category") == cat_filter]
+ 
+    # Sort newest first
+    filtered = sorted(filtered, key=lambda x: x["date"], reverse=True)
+ 
+    # REALTIME NOTIFICATION CARDS
+    st.subheader(f"📬 Your Alerts ({len(filtered)} total)")
+    if filtered:
+        for n in filtered:
+            is_unread = n.get("read", 0) == 0
+            badge_color = accent_color if is_unread else "#888"
+            badge_text = "🟡 UNREAD" if is_unread else "✅ Read"
+            client_balance = users.balance_of(n["client_name"])
+ 
+            with st.container():
+                st.markdown(f"""
+                <div class='glass-card' style='padding:1.8rem; border-left:6px solid {badge_color};'>
+                    <div style='display:flex; justify-content:space-between; align-items:center;'>
+                        <h4 style='margin:0; color:{accent_color};'>{n['title']}</h4>
+                        <span style='background:{badge_color}; color:white; padding:0.4rem 1rem; border-radius:20px; font-weight:bold;'>
+                            {badge_text}
+                        </span>
+                    </div>
+                    <small style='opacity:0.8;'>
+                        {n.get('category', 'General')} • For <strong>{n['client_name']}</strong> 
+                        (Balance: ${client_balance:,.2f}) • {n['date']}
+                    </small>
+                </div>
+                """, unsafe_allow_html=True)
+ 
+                st.markdown(n['message'])
+ 
+                # Mark as read
+                if is_unread:
+                    if st.button("Mark as Read", key=f"read_{n['id']}", use_container_width=True):
+                        try:
+                            supabase.table("notifications").update({"read": 1}).eq("id", n["id"]).execute()
+                            st.success("Marked as read!")
+                            invalidate_tables("notifications")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+ 
+                # Admin delete
+                if current_role in ["owner", "admin"]:
+                    if st.button("🗑️ Delete Notification", key=f"del_{n['id']}", type="secondary", use_container_width=True):
+                        try:
+                            supabase.table("notifications").delete().eq("id", n["id"]).execute()
+                            st.success("Deleted")
+                            invalidate_tables("notifications")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+ 
+                st.divider()
+    else:
+        st.info("No notifications match filters • All clear!")
+ 
+    # Auto-note
+    st.caption("🤖 Auto-notifications: Profits, withdrawals, licenses, milestones • Delivered instantly")
+ 
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Realtime Empire Alerts
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            Prominent unread badges • Search/filter • Instant mark read • Auto-push • Team always informed.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX Notifications • Elite Realtime 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
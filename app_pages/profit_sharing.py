@@ -0,0 +1,269 @@
+# ====================== PROFIT SHARING PAGE ======================
+import datetime
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.helpers import get_email_outbox, get_user_directory, log_action, user_directory
+from utils.profit_import import build_import_payload, read_profit_file, validate_profit_rows
+from utils.profit_split import split_profits
+from utils.supabase_client import supabase
+
+
+def render():
+    st.header("Profit Sharing & Auto-Distribution 💰")
+    st.markdown("**Empire engine: Record FTMO profit → Auto-split via stored v2 tree • Bulletproof UUID balance updates • Premium HTML auto-email to all involved (including Growth Fund row) • Realtime previews • Instant sync.**")
+    current_role = st.session_state.get("role", "guest")
+    if current_role not in ["owner", "admin"]:
+        st.warning("Profit recording is owner/admin only.")
+        st.stop()
+    @cached_query("ftmo_accounts", ttl=60)
+    def fetch_profit_data():
+        accounts = supabase.table("ftmo_accounts").select(
+            "id, name, current_phase, current_equity, "
+            "participants_v2, contributors_v2, contributor_share_pct"
+        ).execute().data or []
+        return accounts
+    accounts = fetch_profit_data()
+    # Names / emails from the shared user directory • balances are incremented server-side by record_profit_distribution
+    users = user_directory()
+    user_id_to_display = users.mapping("id", "full_name")
+    user_id_to_email = users.mapping("id", "email")
+    if not accounts:
+        st.info("No accounts yet • Launch in FTMO Accounts first.")
+        st.stop()
+    # ====================== BULK HISTORICAL IMPORT (BACKFILL) ======================
+    with st.expander("📥 Bulk Import Historical Profits (CSV / Parquet)"):
+        st.caption("Columns: **account_id, record_date, gross_profit** • Validated against each account's stored v2 tree • Already-recorded rows are skipped • No emails are sent for backfills")
+        import_file = st.file_uploader("Upload profits file", type=["csv", "parquet"], key="profit_import_file")
+        if import_file:
+            try:
+                import_df = read_profit_file(import_file)
+                existing = []
+                # Already-recorded profits in the file's accounts/date range, paged past PostgREST's row cap
+                # (preview only • record_profit_distributions_bulk skips them again server-side)
+                has_keys = {"account_id", "record_date"} <= set(import_df.columns)
+                dates = pd.to_datetime(import_df["record_date"], errors="coerce") if has_keys else pd.Series(dtype="datetime64[ns]")
+                if dates.notna().any():
+                    account_ids = sorted(import_df["account_id"].astype(str).str.strip().unique().tolist())
+                    while True:
+                        page = supabase.table("profits").select("id, account_id, record_date, gross_profit").in_(
+                            "account_id", account_ids
+                        ).gte("record_date", str(dates.min().date())).lte("record_date", str(dates.max().date())).order(
+                            "id"
+                        ).range(len(existing), len(existing) + 999).execute().data or []
+                        existing.extend(page)
+                        if len(page) < 1000:
+                            break
+                valid_rows, rejected_rows = validate_profit_rows(import_df, accounts, existing)
+            except Exception as e:
+                st.error(f"Could not read file: {str(e)}")
+                valid_rows, rejected_rows = pd.DataFrame(), pd.DataFrame()
+            if not rejected_rows.empty:
+                st.warning(f"{len(rejected_rows):,} row(s) rejected")
+                st.dataframe(rejected_rows, use_container_width=True, hide_index=True)
+            if not valid_rows.empty:
+                import_items, import_summary = build_import_payload(valid_rows, accounts, user_id_to_display, st.session_state.full_name)
+                st.success(f"{len(valid_rows):,} profit(s) ready to import")
+                st.dataframe(import_summary, use_container_width=True, hide_index=True)
+                if st.button("🚀 Import & Distribute All", type="primary", use_container_width=True, key="profit_import_submit"):
+                    imported = skipped = 0
+                    try:
+                        # Large batches • each RPC call is one transaction
+                        for offset in range(0, len(import_items), 500):
+                            batch = import_items[offset:offset + 500]
+                            result = supabase.rpc("record_profit_distributions_bulk", {"p_items": batch}).execute().data or {}
+                            imported += result.get("profits", len(batch))
+                            skipped += result.get("skipped", 0)
+                        log_action("Bulk Profit Import", f"{imported} profits • ${import_summary['Gross'].sum():,.2f} gross")
+                        st.success(f"Imported & distributed {imported:,} profits! Balances + GF updated.")
+                        if skipped:
+                            st.info(f"{skipped:,} already-recorded profit(s) skipped")
+                        invalidate_tables("profits", "profit_distributions", "users", "growth_fund_transactions")
+                    except Exception as e:
+                        st.error(f"Import stopped after {imported:,} profits: {str(e)} • Re-upload the same file to resume (recorded rows are skipped)")
+    # ====================== EMAIL OUTBOX STATUS ======================
+    with st.expander("📬 Email Outbox Status"):
+        outbox = get_email_outbox()
+        if not outbox:
+            st.info("Email disabled • Add EMAIL_SENDER/PASSWORD secrets")
+        else:
+            counts = outbox.status_counts()
+            col_o1, col_o2, col_o3, col_o4 = st.columns(4)
+            col_o1.metric("Queued", counts.get("queued", 0) + counts.get("sending", 0))
+            col_o2.metric("Sent", counts.get("sent", 0))
+            col_o3.metric("Failed", counts.get("failed", 0))
+            with col_o4:
+                if st.button("🔁 Retry Failed", disabled=not counts.get("failed"), use_container_width=True, key="outbox_retry"):
+                    st.success(f"{outbox.retry_failed()} email(s) re-queued")
+            recent_mail = pd.DataFrame(outbox.recent(50))
+            if not recent_mail.empty:
+                for col in ("created_at", "next_attempt_at", "sent_at"):
+                    recent_mail[col] = pd.to_datetime(recent_mail[col], unit="s").dt.strftime("%Y-%m-%d %H:%M:%S")
+                recent_mail.loc[recent_mail["status"] != "queued", "next_attempt_at"] = ""
+                st.dataframe(recent_mail.rename(columns={
+                    "created_at": "Queued At", "to_addr": "To", "subject": "Subject", "status": "Status",
+                    "attempts": "Attempts", "next_attempt_at": "Next Retry", "last_error": "Last Error", "sent_at": "Sent At"
+                }), use_container_width=True, hide_index=True)
+    account_options = {f"{a['name']} • Phase: {a['current_phase']} • Equity ${a.get('current_equity', 0):,.0f} • Pool {a.get('contributor_share_pct', 0):.1f}%": a for a in accounts}
+    selected_key = st.selectbox("Select Account for Profit Record", list(account_options.keys()))
+    acc = account_options[selected_key]
+    acc_id = acc["id"]
+    acc_name = acc["name"]
+    # FORCE v2
+    participants = acc.get("participants_v2", [])
+    contributors = acc.get("contributors_v2", [])
+    contributor_share_pct = acc.get("contributor_share_pct", 0.0)
+    if not participants:
+        st.error("Account missing v2 participants • Re-edit in FTMO Accounts to fix.")
+        st.stop()
+    st.info(f"**Recording for:** {acc_name} • Contributor Pool: {contributor_share_pct:.1f}% • v2 Active (perfect sync)")
+    with st.form("profit_form", clear_on_submit=True):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            gross_profit = st.number_input("Gross Profit Received (USD) *", min_value=0.01, step=500.0)
+        with col2:
+            record_date = st.date_input("Record Date", datetime.date.today())
+        # Tree preview
+        st.subheader("Stored Unified Tree (Edit in FTMO Accounts)")
+        part_df = pd.DataFrame([{
+            "Name": user_id_to_display.get(p.get("user_id"), p.get("display_name", "Unknown")) if p.get("user_id") else p.get("display_name", "Unknown"),
+            "Role": p.get("role", ""),
+            "%": f"{p['percentage']:.2f}"
+        } for p in participants])
+        st.dataframe(part_df, use_container_width=True, hide_index=True)
+        # ONE split (preview, submit, email & Sankey all use it) — ALL rows incl. Growth Fund, manual, etc.
+        split = split_profits(participants, contributors, contributor_share_pct, [gross_profit], user_id_to_display)
+        shares = split.shares(0)
+        is_contrib = split.rows["kind"] == "contributor"
+        contributor_pool = split.pool_cents[0] / 100
+        gf_add = split.gf_cents[0] / 100
+        involved_user_ids = split.recipient_ids()
+        contrib_preview = [
+            {"Name": r["name"], "Funded PHP": f"₱{r['funded_php']:,.0f}", "Share": f"${share:,.2f}"}
+            for r, share in zip(split.rows[is_contrib], shares[is_contrib])
+        ]
+        part_preview = [
+            {"Name": r["name"], "%": f"{r['percentage']:.2f}", "Share": f"${share:,.2f}"}
+            for r, share in zip(split.rows[~is_contrib], shares[~is_contrib])
+        ]
+        col_prev1, col_prev2 = st.columns(2)
+        with col_prev1:
+            st.subheader("Contributor Pool Preview")
+            if contrib_preview:
+                st.dataframe(pd.DataFrame(contrib_preview), use_container_width=True, hide_index=True)
+            else:
+                st.info("No contributors or 0% pool")
+        with col_prev2:
+            st.subheader("Participants Preview (incl. Growth Fund if allocated)")
+            st.dataframe(pd.DataFrame(part_preview), use_container_width=True, hide_index=True)
+        # Metrics
+        units = gross_profit / 3000.0 if gross_profit > 0 else 0  # Adjust unit_value if dynamic
+        col_m1, col_m2, col_m3 = st.columns(3)
+        col_m1.metric("Gross Profit", f"${gross_profit:,.2f}")
+        col_m2.metric("Contributor Pool", f"${contributor_pool:,.2f}")
+        col_m3.metric("Growth Fund Add", f"${gf_add:,.2f}")
+        # Sankey preview — now includes Growth Fund row automatically (numeric shares straight from the split)
+        # Node indices are assigned as nodes are added • no pool node when the pool rounds to 0 cents
+        labels = [f"Gross ${gross_profit:,.0f}"]
+        colors = ["#00ffaa"]
+        values = []
+        source = []
+        target = []
+        pool_idx = None
+        if split.pool_cents[0] > 0 and contrib_preview:
+            pool_idx = len(labels)
+            labels.append("Contributor Pool")
+            colors.append("#ffaa00")
+            values.append(contributor_pool)
+            source.append(0)
+            target.append(pool_idx)
+        for r, share in zip(split.rows, shares):
+            from_contrib = r["kind"] == "contributor"
+            if from_contrib and pool_idx is None:
+                continue  # nothing flows to contributors without a pool
+            target.append(len(labels))
+            labels.append(r["name"])
+            colors.append("#ffd700" if from_contrib else "#00cc99")
+            values.append(float(share))
+            source.append(pool_idx if from_contrib else 0)
+        fig = go.Figure(data=[go.Sankey(
+            node=dict(pad=20, thickness=30, label=labels, color=colors),
+            link=dict(source=source, target=target, value=values)
+        )])
+        fig.update_layout(title="Distribution Flow Preview (incl. Growth Fund)", height=600)
+        st.plotly_chart(fig, use_container_width=True)
+        submitted = st.form_submit_button("🚀 Record & Distribute Profit", type="primary", use_container_width=True)
+        if submitted:
+            if gross_profit <= 0:
+                st.error("Gross profit > 0 required")
+            else:
+                try:
+                    distributions = split.distribution_rows(0)
+                    # ONE atomic RPC: profit + distributions + balance = balance + share + GF transaction
+                    supabase.rpc("record_profit_distribution", {
+                        "p_profit": {
+                            "account_id": acc_id,
+                            "gross_profit": gross_profit,
+                            "record_date": str(record_date),
+                            "units_generated": units,
+                            "growth_fund_add": gf_add,
+                            "contributor_share_pct": contributor_share_pct
+                        },
+                        "p_distributions": distributions,
+                        "p_growth_fund": {
+                            "date": str(record_date),
+                            "type": "In",
+                            "amount": gf_add,
+                            "description": f"Auto from {acc_name} profit",
+                            "account_source": acc_name,
+                            "recorded_by": st.session_state.full_name
+                        } if gf_add > 0 else None
+                    }).execute()
+                    # HTML email breakdown — now includes Growth Fund row automatically
+                    date_str = record_date.strftime("%B %d, %Y")
+                    html_breakdown = f"""
+                    <html><body style="font-family:Arial,sans-serif;background:#f8fbff;padding:20px;">
+                        <div style="max-width:800px;margin:auto;background:white;border-radius:20px;padding:30px;box-shadow:0 10px 30px rgba(0,0,0,0.1);">
+                            <h1 style="color:#00ffaa;text-align:center;">🚀 KMFX Profit Distribution</h1>
+                            <h2 style="text-align:center;">{acc_name} • {date_str}</h2>
+                            <p style="text-align:center;font-size:1.2rem;">Gross: <strong>${gross_profit:,.2f}</strong> • Pool ({contributor_share_pct:.1f}%): <strong>${contributor_pool:,.2f}</strong></p>
+                            <h3>Contributor Breakdown</h3>
+                            <table style="width:100%;border-collapse:collapse;">
+                                <tr style="background:#00ffaa;color:black;"><th style="padding:12px;border:1px solid #ddd;">Name</th><th>Funded PHP</th><th>Share</th></tr>
+                                {''.join(f'<tr><td style="padding:12px;border:1px solid #ddd;">{r["Name"]}</td><td>{r["Funded PHP"]}</td><td>{r["Share"]}</td></tr>' for r in contrib_preview) or '<tr><td colspan="3" style="text-align:center;padding:12px;">None</td></tr>'}
+                            </table>
+                            <h3>Participants Breakdown (incl. Growth Fund)</h3>
+                            <table style="width:100%;border-collapse:collapse;">
+                                <tr style="background:#ffd700;color:black;"><th style="padding:12px;border:1px solid #ddd;">Name</th><th>%</th><th>Share</th></tr>
+                                {''.join(f'<tr><td style="padding:12px;border:1px solid #ddd;">{r["Name"]}</td><td>{r["%"]}%</td><td>{r["Share"]}</td></tr>' for r in part_preview)}
+                            </table>
+                            <p style="margin-top:30px;text-align:center;">Thank you for scaling the Empire 👑</p>
+                        </div>
+                    </body></html>
+                    """
+                    st.subheader("Auto-Email Breakdown Preview")
+                    st.markdown(html_breakdown, unsafe_allow_html=True)
+                    # Queue emails → sent in the background (no waiting on Gmail per recipient)
+                    outbox = get_email_outbox()
+                    if outbox and involved_user_ids:
+                        try:
+                            queued = outbox.enqueue(
+                                [user_id_to_email.get(uid) for uid in involved_user_ids],
+                                f"KMFX Profit - {acc_name} {date_str}",
+                                html_breakdown
+                            )
+                            if queued > 0:
+                                st.success(f"Email queued for {queued} members! 🚀")
+                        except Exception as e:
+                            st.error(f"Email queue error: {str(e)}")
+                    else:
+                        st.warning("No email sent • Add EMAIL_SENDER/PASSWORD secrets or member emails")
+                    st.success("Profit recorded & distributed instantly! Balances + GF updated.")
+                    get_user_directory().refresh(*involved_user_ids)  # re-reads only the credited balances
+                    invalidate_tables("profits", "profit_distributions", "growth_fund_transactions")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Record failed: {str(e)}")
@@ -0,0 +1,181 @@
+# ====================== REPORTS & EXPORT PAGE - FULL FINAL LATEST 2026 (INSTANT MV + REALTIME + ELITE CHARTS & EXPORTS) ======================
+import datetime
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.cache_tags import cached_query
+from utils.helpers import user_directory
+from utils.supabase_client import supabase
+from utils.theme import accent_color, accent_primary
+
+
+def render():
+    if st.session_state.role not in ["owner", "admin"]:
+        st.error("🔒 Access Denied — Owner or Admin only page.")
+        st.stop()
+    st.header("Empire Reports & Export 📈")
+    st.markdown("**Full analytics engine: Instant realtime reports via materialized views • Professional charts • Detailed breakdowns • Multiple CSV exports • Owner/Admin only.**")
+ 
+    # STRICT OWNER/ADMIN ONLY
+    current_role = st.session_state.get("role", "guest")
+    if current_role not in ["owner", "admin"]:
+        st.error("🔒 Reports & Export is restricted to Owner/Admin.")
+        st.stop()
+ 
+    # ULTRA-REALTIME CACHE (10s)
+    @cached_query("profits", "profit_distributions", "users", "ftmo_accounts", "growth_fund_transactions", ttl=10)
+    def fetch_reports_full():
+        try:
+            # INSTANT MV TOTALS
+            empire = supabase.table("mv_empire_summary").select("*").single().execute().data or {}
+            client_mv = supabase.table("mv_client_balances").select("*").single().execute().data or {}
+            gf_mv = supabase.table("mv_growth_fund_balance").select("balance").single().execute().data or {}
+ 
+            total_accounts = empire.get("total_accounts", 0)
+            total_equity = empire.get("total_equity", 0.0)
+            total_withdrawable = empire.get("total_withdrawable", 0.0)
+            total_client_balances = client_mv.get("total_client_balances", 0.0)
+            gf_balance = gf_mv.get("balance", 0.0)
+ 
+            # Full data for charts/tables
+            profits = supabase.table("profits").select("*").order("record_date", desc=True).execute().data or []
+            distributions = supabase.table("profit_distributions").select("*").execute().data or []
+            clients = [{"full_name": c["full_name"], "balance": c["balance"] or 0} for c in user_directory().rows("client")]
+            accounts = supabase.table("ftmo_accounts").select("name, current_phase, current_equity, withdrawable_balance").execute().data or []
+ 
+            total_gross = sum(p.get("gross_profit", 0) for p in profits)
+            total_distributed = sum(d.get("share_amount", 0) for d in distributions if not d.get("is_growth_fund", False))
+ 
+            return (
+                profits, distributions, clients, accounts,
+                total_gross, total_distributed, total_client_balances,
+                gf_balance, total_accounts, total_equity, total_withdrawable
+            )
+        except Exception as e:
+            st.error(f"Fetch error: {e}")
+            return [], [], [], [], 0, 0, 0, 0, 0, 0, 0
+ 
+    (profits, distributions, clients, accounts,
+     total_gross, total_distributed, total_client_balances,
+     gf_balance, total_accounts, total_equity, total_withdrawable) = fetch_reports_full()
+ 
+    # Manual refresh
+    if st.button("🔄 Refresh Reports Now", use_container_width=True, type="secondary"):
+        fetch_reports_full.clear()
+        st.rerun()
+ 
+    st.caption("🔄 Reports auto-refresh every 10s • Lightning fast via materialized views")
+ 
+    # EMPIRE METRICS GRID
+    st.subheader("Empire Overview (Instant Totals)")
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+    col1.metric("Active Accounts", total_accounts)
+    col2.metric("Total Equity", f"${total_equity:,.0f}")
+    col3.metric("Total Withdrawable", f"${total_withdrawable:,.0f}")
+    col4.metric("Gross Profits", f"${total_gross:,.0f}")
+    col5.metric("Distributed Shares", f"${total_distributed:,.0f}")
+    col6.metric("Client Balances", f"${total_client_balances:,.0f}")
+    st.metric("Growth Fund Balance", f"${gf_balance:,.0f}", delta=None)
+ 
+    # TABS FOR ORGANIZED REPORTS
+    tab1, tab2, tab3, tab4 = st.tabs(["Profit Trend", "Distribution Breakdown", "Client Balances", "Accounts Summary"])
+ 
+    with tab1:
+        st.subheader("Monthly Profit Trend")
+        if profits:
+            df = pd.DataFrame(profits)
+            df["record_date"] = pd.to_datetime(df["record_date"])
+            monthly = df.groupby(df["record_date"].dt.strftime("%Y-%m"))["gross_profit"].sum().reset_index()
+            monthly = monthly.sort_values("record_date")
+ 
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                x=monthly["record_date"],
+                y=monthly["gross_profit"],
+                marker_color=accent_primary,
+                text=monthly["gross_profit"].apply(lambda x: f"${x:,.0f}"),
+                textposition="outside"
+            ))
+            fig.update_layout(height=500, title="Monthly Gross Profit", xaxis_title="Month", yaxis_title="USD")
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No profits yet")
+ 
+    with tab2:
+        st.subheader("All-Time Participant Shares")
+        if distributions:
+            df = pd.DataFrame(distributions)
+            summary = df.groupby("participant_name")["share_amount"].sum().reset_index().sort_values("share_amount", ascending=False)
+ 
+            fig = go.Figure(go.Pie(
+                labels=summary["participant_name"],
+                values=summary["share_amount"],
+                hole=0.5,
+                textinfo="label+percent",
+                textposition="outside"
+            ))
+            fig.update_layout(height=600, title="Total Distributed Shares")
+            st.plotly_chart(fig, use_container_width=True)
+ 
+            summary["share_amount"] = summary["share_amount"].apply(lambda x: f"${x:,.2f}")
+            summary = summary.rename(columns={"participant_name": "Participant", "share_amount": "Total Share"})
+            st.dataframe(summary, use_container_width=True, hide_index=True)
+        else:
+            st.info("No distributions yet")
+ 
+    with tab3:
+        st.subheader("Client Balances (Realtime)")
+        if clients:
+            df = pd.DataFrame(clients)
+            df["balance"] = df["balance"].apply(lambda x: f"${x:,.2f}")
+            df = df.rename(columns={"full_name": "Client", "balance": "Balance"}).sort_values("Balance", ascending=False)
+            st.dataframe(df, use_container_width=True, hide_index=True)
+        else:
+            st.info("No clients yet")
+ 
+    with tab4:
+        st.subheader("Active Accounts")
+        if accounts:
+            df = pd.DataFrame(accounts)
+            df["current_equity"] = df["current_equity"].apply(lambda x: f"${x:,.0f}")
+            df["withdrawable_balance"] = df["withdrawable_balance"].apply(lambda x: f"${x:,.0f}")
+            st.dataframe(df[["name", "current_phase", "current_equity", "withdrawable_balance"]], use_container_width=True, hide_index=True)
+        else:
+            st.info("No accounts yet")
+ 
+    # EXPORTS
+    st.subheader("📤 Export Reports (CSV)")
+    col_e1, col_e2 = st.columns(2)
+    with col_e1:
+        if profits:
+            csv = pd.DataFrame(profits).to_csv(index=False).encode()
+            st.download_button("📄 Profits Report", csv, f"KMFX_Profits_{datetime.date.today()}.csv", "text/csv", use_container_width=True)
+        if distributions:
+            csv = pd.DataFrame(distributions).to_csv(index=False).encode()
+            st.download_button("📄 Distributions Report", csv, f"KMFX_Distributions_{datetime.date.today()}.csv", "text/csv", use_container_width=True)
+    with col_e2:
+        if clients:
+            csv = pd.DataFrame([{"Client": c["full_name"], "Balance": c["balance"]} for c in clients]).to_csv(index=False).encode()
+            st.download_button("📄 Client Balances", csv, f"KMFX_Balances_{datetime.date.today()}.csv", "text/csv", use_container_width=True)
+ 
+        summary = {
+            "Metric": ["Gross Profits", "Distributed", "Client Balances", "Growth Fund", "Accounts", "Equity", "Withdrawable"],
+            "Value": [total_gross, total_distributed, total_client_balances, gf_balance, total_accounts, total_equity, total_withdrawable]
+        }
+        csv = pd.DataFrame(summary).to_csv(index=False).encode()
+        st.download_button("📄 Empire Summary", csv, f"KMFX_Summary_{datetime.date.today()}.csv", "text/csv", use_container_width=True)
+ 
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Lightning Fast Analytics
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            Instant MV totals • Tabbed reports • Elite charts • Dated CSV exports • Empire performance mastered.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX Reports • Instant 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,327 @@
+# ====================== SIMULATOR PAGE ======================
+import datetime
+import time
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+
+from utils.cache_tags import cached_query
+from utils.monte_carlo import monthly_history, simulate_paths
+from utils.projections import DEFAULT_GROSS_PER_ACC, empire_profit_stats, project
+from utils.scenario_sweep import AXES as SWEEP_AXES, run_sweep, sweep_key
+from utils.supabase_client import supabase
+from utils.theme import accent_gold, accent_primary
+
+
+def render():
+    st.header("Empire Growth Simulator 🔮")
+    st.markdown("**Advanced scaling forecaster: Auto-loaded from current empire (accounts, equity, GF balance, avg profits per account, actual Growth Fund %, unit value) via materialized views + realtime data for instant accurate defaults • Simulate scenarios • Projected equity, distributions, growth fund, units • Realtime multi-line charts • Sankey flow previews • Professional planning tool.**")
+
+    # FULL INSTANT CACHE - MATERIALIZED VIEWS + REALTIME CALCS FOR ACCURATE DEFAULTS
+    @cached_query("profits", "ftmo_accounts", "growth_fund_transactions", ttl=60)
+    def fetch_simulator_data():
+        try:
+            # INSTANT core stats from materialized views
+            empire_resp = supabase.table("mv_empire_summary").select("total_accounts, total_equity, total_withdrawable").execute()
+            empire = empire_resp.data[0] if empire_resp.data else {}
+            total_accounts = empire.get("total_accounts", 0)
+            total_equity = empire.get("total_equity", 0.0)
+
+            gf_resp = supabase.table("mv_growth_fund_balance").select("balance").execute()
+            gf_balance = gf_resp.data[0]["balance"] if gf_resp.data else 0.0
+
+            # Lightweight tables for accurate averages
+            accounts_resp = supabase.table("ftmo_accounts").select("unit_value, participants_v2").execute()
+            accounts = accounts_resp.data or []
+
+            profits_resp = supabase.table("profits").select("account_id, gross_profit, record_date").execute()
+            profits = profits_resp.data or []
+
+            # === Accurate Avg Monthly Gross PER ACCOUNT (shared kernel • default if low/no data) ===
+            avg_per_acc, _ = empire_profit_stats(profits, total_accounts)
+
+            # === Accurate Avg Growth Fund % (from actual "Growth Fund" participant rows) ===
+            gf_pcts = []
+            for a in accounts:
+                gf_acc = 0.0
+                parts = a.get("participants_v2", []) or a.get("participants", [])
+                for p in parts:
+                    display = p.get("display_name") or p.get("name", "")
+                    if "growth fund" in display.lower():
+                        gf_acc += p.get("percentage", 0.0)
+                gf_pcts.append(gf_acc)
+            avg_gf_pct = sum(gf_pcts) / len(gf_pcts) if gf_pcts else 10.0
+            if avg_gf_pct == 0:
+                avg_gf_pct = 10.0  # reasonable default if no GF row yet
+
+            # === Avg Unit Value ===
+            unit_values = [a.get("unit_value", 3000.0) for a in accounts if a.get("unit_value", 0) > 0]
+            avg_unit_value = sum(unit_values) / len(unit_values) if unit_values else 3000.0
+
+            # === Monthly gross history PER ACCOUNT (Monte Carlo bootstrap source) ===
+            account_history = monthly_history(profits)
+
+            return (
+                total_equity, total_accounts, float(avg_per_acc),
+                float(avg_gf_pct), float(avg_unit_value), gf_balance, account_history
+            )
+        except Exception as e:
+            st.error(f"Simulator data fetch error: {e}")
+            return 0.0, 0, DEFAULT_GROSS_PER_ACC, 10.0, 3000.0, 0.0, []
+
+    (
+        total_equity, total_accounts, avg_per_acc,
+        avg_gf_pct, avg_unit_value, gf_balance, account_history
+    ) = fetch_simulator_data()
+
+    st.info(f"**Instant Auto-Loaded Empire Stats:** {total_accounts} accounts • Total Equity ${total_equity:,.0f} • Avg Monthly Gross per Account ${avg_per_acc:,.0f} • Avg Growth Fund % {avg_gf_pct:.1f}% • Avg Unit Value ${avg_unit_value:,.0f} • Current GF ${gf_balance:,.0f}")
+
+    # ====================== ADVANCED SIMULATION INPUTS (ACCURATE DEFAULTS) ======================
+    st.subheader("Configure Simulation Scenarios")
+    col_sim1, col_sim2 = st.columns(2)
+    with col_sim1:
+        months = st.slider("Projection Months", 6, 72, 36)
+        projected_accounts = st.slider("Projected Active Accounts", total_accounts, total_accounts + 50, total_accounts + 10)
+        monthly_gross_per_acc = st.number_input(
+            "Avg Monthly Gross Profit per Account (USD)",
+            value=avg_per_acc,
+            min_value=0.0,
+            step=1000.0,
+            help="Auto-loaded historical average per account (or default if no data)"
+        )
+        gf_percentage = st.slider(
+            "Growth Fund Allocation % (from Profits)",
+            0.0, 50.0, avg_gf_pct,
+            help="Auto-loaded from actual 'Growth Fund' participant rows across accounts"
+        )
+    with col_sim2:
+        unit_value_proj = st.number_input(
+            "Profit Unit Value (USD)",
+            value=avg_unit_value,
+            min_value=100.0,
+            step=500.0
+        )
+        monthly_manual_in = st.number_input("Additional Monthly Manual In to GF (USD)", value=0.0, step=1000.0)
+        gross_growth_pct = st.number_input("Monthly Gross Growth % (compounding)", value=0.0, step=0.5)
+        gf_return_pct = st.number_input("GF Monthly Return % (reinvested)", value=0.0, step=0.5)
+        scenario_name = st.text_input("Scenario Name", value="Elite Scaling Plan 2026")
+        sim_mode = st.radio("Simulation Mode", ["📈 Steady (avg gross)", "🎲 Monte Carlo (real history)", "🧮 Scenario Sweep"], horizontal=True)
+        if sim_mode.startswith("🎲"):
+            mc_paths = st.select_slider("Monte Carlo Paths", [1000, 2000, 5000, 10000, 20000], value=10000)
+
+    # Auto-calculated projected monthly totals
+    monthly_gross_total = monthly_gross_per_acc * projected_accounts
+    monthly_gf_add = monthly_gross_total * (gf_percentage / 100) + monthly_manual_in
+    monthly_distributed = monthly_gross_total - monthly_gf_add
+    monthly_units = monthly_gross_total / unit_value_proj if unit_value_proj > 0 else 0
+
+    col_calc1, col_calc2, col_calc3, col_calc4 = st.columns(4)
+    col_calc1.metric("Projected Monthly Gross (Total)", f"${monthly_gross_total:,.0f}")
+    col_calc2.metric("Monthly GF Add", f"${monthly_gf_add:,.0f}")
+    col_calc3.metric("Monthly Distributed", f"${monthly_distributed:,.0f}")
+    col_calc4.metric("Monthly Units Generated", f"{monthly_units:.2f}")
+
+    # ====================== RUN SIMULATION ======================
+    is_sweep = sim_mode.startswith("🧮")
+    run_sim = False if is_sweep else st.button("🚀 Run Simulation", type="primary", use_container_width=True)
+    if is_sweep:
+        # ====================== SCENARIO SWEEP (FULL GRID • VECTORIZED • MEMOIZED) ======================
+        st.subheader("🧮 Scenario Sweep — Every Combination at Once")
+        gross_max = max(100000, int(avg_per_acc * 3))
+        col_sw1, col_sw2 = st.columns(2)
+        with col_sw1:
+            sweep_accounts = st.slider("Projected Accounts Range", total_accounts, total_accounts + 50, (max(total_accounts, 1), total_accounts + 20))
+            sweep_gross = st.slider("Gross per Account Range (USD)", 0, gross_max, (int(avg_per_acc * 0.5), min(int(avg_per_acc * 1.5), gross_max)), step=1000)
+            sweep_gf = st.slider("Growth Fund % Range", 0.0, 50.0, (max(avg_gf_pct - 5, 0.0), min(avg_gf_pct + 5, 50.0)))
+        with col_sw2:
+            sweep_unit = st.slider("Unit Value Range (USD)", 500, 20000, (2000, 5000), step=500)
+            sweep_manual = st.slider("Manual GF Inflow Range (USD / month)", 0, 50000, (0, 5000), step=500)
+            sweep_steps = st.slider("Steps per Parameter", 2, 12, 6)
+            gf_target = st.number_input("Growth Fund Target (USD)", value=float(max(gf_balance * 2, 100000.0)), step=10000.0)
+
+        sweep_axes = {
+            "projected_accounts": np.unique(np.linspace(*sweep_accounts, sweep_steps).round()),
+            "gross_per_acc": np.unique(np.linspace(*sweep_gross, sweep_steps)),
+            "gf_pct": np.unique(np.linspace(*sweep_gf, sweep_steps)),
+            "unit_value": np.unique(np.linspace(*sweep_unit, sweep_steps)),
+            "manual_in": np.unique(np.linspace(*sweep_manual, sweep_steps))
+        }
+        sweep_fixed = {"months": months, "start_equity": total_equity, "start_gf": gf_balance, "gf_target": gf_target}
+        st.caption(f"{int(np.prod([len(v) for v in sweep_axes.values()])):,} scenarios • {months} months • Repeat sweeps are instant (memoized)")
+
+        # Results are kept with the key of the inputs they were computed for • any range change drops them
+        current_sweep_key = sweep_key(sweep_axes, sweep_fixed)
+        if st.button("🧮 Run Sweep", type="primary", use_container_width=True):
+            with st.spinner("Sweeping scenario grid..."):
+                st.session_state.sweep_results = (current_sweep_key, run_sweep(sweep_axes, sweep_fixed))
+
+        stored_sweep = st.session_state.get("sweep_results")
+        if stored_sweep is not None and stored_sweep[0] != current_sweep_key:
+            del st.session_state.sweep_results
+            stored_sweep = None
+        sweep_results = stored_sweep[1] if stored_sweep is not None else None
+        if sweep_results is not None:
+            sweep_metrics = {
+                "months_to_target": "Months to GF Target",
+                "final_gf": "Final Growth Fund",
+                "final_equity": "Final Total Equity",
+                "total_distributed": "Total Distributed Shares",
+                "total_units": "Total Units"
+            }
+            axis_labels = {
+                "projected_accounts": "Projected Accounts",
+                "gross_per_acc": "Gross per Account",
+                "gf_pct": "Growth Fund %",
+                "unit_value": "Unit Value",
+                "manual_in": "Manual GF Inflow"
+            }
+            col_h1, col_h2, col_h3 = st.columns(3)
+            sweep_metric = col_h1.selectbox("Outcome", list(sweep_metrics), format_func=sweep_metrics.get)
+            heat_x = col_h2.selectbox("Heatmap X", SWEEP_AXES, index=1, format_func=axis_labels.get)
+            heat_y = col_h3.selectbox("Heatmap Y", SWEEP_AXES, index=0, format_func=axis_labels.get)
+
+            outcome = sweep_results[sweep_metric].replace(np.inf, np.nan)
+            if heat_x != heat_y:
+                heat = outcome.groupby([sweep_results[heat_y], sweep_results[heat_x]]).median().unstack()
+                fig_heat = go.Figure(data=go.Heatmap(
+                    z=heat.values, x=heat.columns, y=heat.index,
+                    colorscale="Viridis_r" if sweep_metric == "months_to_target" else "Viridis",
+                    colorbar=dict(title=sweep_metrics[sweep_metric])
+                ))
+                fig_heat.update_layout(
+                    title=f"{sweep_metrics[sweep_metric]} (median over other parameters)",
+                    xaxis_title=axis_labels[heat_x], yaxis_title=axis_labels[heat_y], height=550
+                )
+                st.plotly_chart(fig_heat, use_container_width=True)
+
+            best = sweep_results.assign(**{sweep_metric: outcome}).sort_values(
+                sweep_metric, ascending=sweep_metric == "months_to_target", na_position="last"
+            ).head(50)
+            st.dataframe(
+                best.rename(columns={**axis_labels, **sweep_metrics}),
+                use_container_width=True,
+                hide_index=True
+            )
+    elif run_sim and sim_mode.startswith("🎲"):
+        if not account_history:
+            st.warning("No profit history yet • Monte Carlo needs recorded profits to resample")
+            st.stop()
+        # Bootstrap monthly gross per account from real history • ALL paths in one NumPy pass
+        with st.spinner(f"Simulating {mc_paths:,} paths × {months} months × {projected_accounts} accounts..."):
+            sim_start = time.perf_counter()
+            bands = simulate_paths(
+                account_history, projected_accounts, months, paths=mc_paths,
+                gross_per_acc=monthly_gross_per_acc, gf_pct=gf_percentage, manual_in=monthly_manual_in,
+                unit_value=unit_value_proj, start_equity=total_equity, start_gf=gf_balance
+            )
+            sim_secs = time.perf_counter() - sim_start
+        st.caption(f"🎲 {mc_paths:,} bootstrapped paths in {sim_secs:.2f}s • Monthly gross resampled from {len(account_history)} accounts' real history (scaled to ${monthly_gross_per_acc:,.0f}/account avg) • Bands = P5 / P50 / P95")
+
+        dates = [datetime.date.today() + datetime.timedelta(days=30 * i) for i in range(months + 1)]
+        band_specs = [
+            ("equity", "Total Equity", accent_primary, "rgba(0,255,170,0.15)"),
+            ("growth_fund", "Growth Fund", "#ffd700", "rgba(255,215,0,0.15)"),
+            ("distributed", "Distributed Shares", "#00ffcc", "rgba(0,255,204,0.15)"),
+            ("units", "Cumulative Units", "#ff6b6b", "rgba(255,107,107,0.15)")
+        ]
+        band_tabs = st.tabs([label for _, label, _, _ in band_specs])
+        for tab, (key, label, line_color, fill_color) in zip(band_tabs, band_specs):
+            p5, p50, p95 = bands[key]
+            with tab:
+                fig_band = go.Figure()
+                fig_band.add_trace(go.Scatter(x=dates, y=p95, name="P95", line=dict(color=line_color, width=1, dash="dot")))
+                fig_band.add_trace(go.Scatter(x=dates, y=p5, name="P5", fill="tonexty", fillcolor=fill_color, line=dict(color=line_color, width=1, dash="dot")))
+                fig_band.add_trace(go.Scatter(x=dates, y=p50, name="P50 (median)", line=dict(color=line_color, width=5)))
+                fig_band.update_layout(
+                    title=f"{scenario_name} — {label} (P5–P95)",
+                    height=550,
+                    hovermode="x unified",
+                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+                )
+                st.plotly_chart(fig_band, use_container_width=True)
+
+        # Final key metrics (median • P5–P95 range)
+        col_final1, col_final2, col_final3, col_final4 = st.columns(4)
+        col_final1.metric("Final Total Equity (P50)", f"${bands['equity'][1, -1]:,.0f}", help=f"P5 ${bands['equity'][0, -1]:,.0f} • P95 ${bands['equity'][2, -1]:,.0f}")
+        col_final2.metric("Final Growth Fund (P50)", f"${bands['growth_fund'][1, -1]:,.0f}", help=f"P5 ${bands['growth_fund'][0, -1]:,.0f} • P95 ${bands['growth_fund'][2, -1]:,.0f}")
+        col_final3.metric("Total Distributed (P50)", f"${bands['distributed'][1, -1]:,.0f}", help=f"P5 ${bands['distributed'][0, -1]:,.0f} • P95 ${bands['distributed'][2, -1]:,.0f}")
+        col_final4.metric("Total Units (P50)", f"{bands['units'][1, -1]:.2f}", help=f"P5 {bands['units'][0, -1]:.2f} • P95 {bands['units'][2, -1]:.2f}")
+
+    elif run_sim:
+        # Whole trajectory in ONE kernel call (closed-form / cumsum • compounding + reinvestment)
+        proj = project(
+            months, monthly_gross_total, gf_pct=gf_percentage, manual_in=monthly_manual_in,
+            unit_value=unit_value_proj, start_equity=total_equity, start_gf=gf_balance,
+            gross_growth_pct=gross_growth_pct, gf_return_pct=gf_return_pct
+        )
+        dates = [datetime.date.today() + datetime.timedelta(days=30 * i) for i in range(months + 1)]
+        equity_proj = proj["equity"]
+        gf_proj = proj["growth_fund"]
+        distributed_proj = proj["distributed"]
+        units_proj = proj["units"]
+
+        # Multi-line chart
+        fig_multi = go.Figure()
+        fig_multi.add_trace(go.Scatter(x=dates, y=equity_proj, name="Total Equity", line=dict(color=accent_primary, width=6)))
+        fig_multi.add_trace(go.Scatter(x=dates, y=gf_proj, name="Growth Fund", line=dict(color="#ffd700", width=6)))
+        fig_multi.add_trace(go.Scatter(x=dates, y=distributed_proj, name="Distributed Shares", line=dict(color="#00ffcc", width=5)))
+        fig_multi.add_trace(go.Scatter(x=dates, y=units_proj, name="Cumulative Units", line=dict(color="#ff6b6b", width=5, dash="dot")))
+        fig_multi.update_layout(
+            title=f"{scenario_name} — Empire Growth Trajectory",
+            height=600,
+            hovermode="x unified",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        )
+        st.plotly_chart(fig_multi, use_container_width=True)
+
+        # Final key metrics
+        col_final1, col_final2, col_final3, col_final4 = st.columns(4)
+        col_final1.metric("Final Total Equity", f"${equity_proj[-1]:,.0f}")
+        col_final2.metric("Final Growth Fund", f"${gf_proj[-1]:,.0f}")
+        col_final3.metric("Total Distributed Shares", f"${distributed_proj[-1]:,.0f}")
+        col_final4.metric("Total Units Generated", f"{units_proj[-1]:.2f}")
+
+        # Average monthly Sankey flow
+        st.subheader("Projected Average Monthly Flow")
+        if monthly_gross_total > 0:
+            labels = ["Monthly Gross"]
+            values = []
+            source = []
+            target = []
+            idx = 1
+
+            labels.append("Distributed Shares")
+            values.append(monthly_distributed)
+            source.append(0)
+            target.append(idx)
+            idx += 1
+
+            labels.append("Growth Fund")
+            values.append(monthly_gf_add)
+            source.append(0)
+            target.append(idx)
+
+            fig_avg = go.Figure(data=[go.Sankey(
+                node=dict(pad=20, thickness=30, label=labels, color=["#00ffaa", "#00ffcc", "#ffd700"]),
+                link=dict(source=source, target=target, value=values, color=["#00ffcc80", "#ffd70080"])
+            )])
+            fig_avg.update_layout(height=500, title=f"Avg Monthly Flow — ${monthly_gross_total:,.0f} Gross")
+            st.plotly_chart(fig_avg, use_container_width=True)
+        else:
+            st.info("No gross profit projected in this scenario")
+
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_primary},{accent_gold}); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Fixed & Enhanced Predictive Simulator 2026
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            ✅ Accurate auto-load: real historical avg gross per account + true Growth Fund % from participant rows<br>
+            ✅ Linear scaling with projected accounts • Instant MV core stats • Professional charts & flows<br>
+            ✅ Ready for elite empire planning 👑
+        </p>
+        <h2 style="color:{accent_gold};">KMFX Simulator • Fully Fixed & Lightning Fast</h2>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,167 @@
+# ====================== TESTIMONIALS PAGE - FULL FINAL LATEST 2026 (PERMANENT STORAGE + IMAGES FULLY VISIBLE + REALTIME GRID) ======================
+import datetime
+
+import streamlit as st
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.helpers import get_signed_urls, thumbnail_urls, upload_to_supabase, user_directory
+from utils.supabase_client import supabase
+from utils.theme import accent_color
+from utils.thumbnails import with_thumbnails
+
+
+def render():
+    st.header("Team Testimonials 📸")
+    st.markdown("**Empire motivation hub: Clients submit success stories + photos (PERMANENT STORAGE + FULLY VISIBLE) • Balance context • Owner approve/reject with auto-announce • Realtime grid • Search • Inspiration hub.**")
+ 
+    current_role = st.session_state.get("role", "guest")
+ 
+    # ULTRA-REALTIME CACHE (10s)
+    @cached_query("testimonials", ttl=10)
+    def fetch_testimonials_full():
+        approved_resp = supabase.table("testimonials").select("*").eq("status", "Approved").order("date_submitted", desc=True).execute()
+        approved = approved_resp.data or []
+ 
+        pending_resp = supabase.table("testimonials").select("*").eq("status", "Pending").order("date_submitted", desc=True).execute()
+        pending = pending_resp.data or []
+ 
+        # Signed URLs for ALL images (visible even on private bucket) • reused until near expiry
+        all_testimonials = approved + pending
+        signed_by_path = get_signed_urls().get_many(
+            "testimonials", [t.get("storage_path") for t in all_testimonials]
+        )
+        # Grid thumbnails (stored at upload) • older photos without one keep the full image
+        thumb_by_path = thumbnail_urls("testimonials", [t.get("storage_path") for t in all_testimonials])
+        for t in all_testimonials:
+            t["signed_url"] = signed_by_path.get(t.get("storage_path")) or t.get("image_url")
+            t["thumb_url"] = thumb_by_path.get(t.get("storage_path"))
+ 
+        return approved, pending
+ 
+    approved, pending = fetch_testimonials_full()
+    users = user_directory()
+ 
+    # Manual refresh
+    if st.button("🔄 Refresh Testimonials Now", use_container_width=True, type="secondary"):
+        fetch_testimonials_full.clear()
+        st.rerun()
+ 
+    st.caption("🔄 Testimonials auto-refresh every 10s • Photos PERMANENT & FULLY VISIBLE (signed URLs)")
+ 
+    # CLIENT SUBMIT
+    if current_role == "client":
+        my_balance = users.balance_of(st.session_state.full_name)
+        st.subheader(f"Share Your Success Story (Balance: ${my_balance:,.2f})")
+        with st.expander("➕ Submit Testimonial", expanded=True):
+            with st.form("testi_form", clear_on_submit=True):
+                story = st.text_area("Your Story *", height=200, placeholder="How KMFX changed my life, profits, journey...")
+                photo = st.file_uploader("Upload Photo * (Permanent + Visible)", type=["png","jpg","jpeg","gif"])
+ 
+                submitted = st.form_submit_button("Submit for Approval", type="primary", use_container_width=True)
+                if submitted:
+                    if not story.strip() or not photo:
+                        st.error("Story and photo required")
+                    else:
+                        try:
+                            url, storage_path = upload_to_supabase(
+                                file=photo,
+                                bucket="testimonials",
+                                folder="photos",
+                                thumbnails=True  # testimonial cards
+                            )
+                            supabase.table("testimonials").insert({
+                                "client_name": st.session_state.full_name,
+                                "message": story.strip(),
+                                "image_url": url,
+                                "storage_path": storage_path,
+                                "date_submitted": datetime.date.today().isoformat(),
+                                "status": "Pending"
+                            }).execute()
+                            st.success("Testimonial submitted permanently! Photo will be visible on approval.")
+                            invalidate_tables("testimonials")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+ 
+    # APPROVED GRID (FULL IMAGE PREVIEWS)
+    st.subheader("🌟 Approved Success Stories")
+    if approved:
+        search = st.text_input("Search stories or name")
+        filtered = [t for t in approved if search.lower() in t["message"].lower() or search.lower() in t["client_name"].lower()] if search else approved
+ 
+        cols = st.columns(3)
+        for idx, t in enumerate(filtered):
+            with cols[idx % 3]:
+                balance = users.balance_of(t["client_name"])
+                signed_url = t.get("signed_url")
+ 
+                with st.container():
+                    if signed_url:
+                        st.image(t.get("thumb_url") or signed_url, use_container_width=True)
+                        if t.get("thumb_url"):
+                            st.markdown(f"[🔍 View full size]({signed_url})")
+                    else:
+                        st.caption("No photo")
+                    st.markdown(f"**{t['client_name']}** (Balance: ${balance:,.2f})")
+                    st.markdown(t["message"])
+                    st.caption(f"Submitted: {t['date_submitted']}")
+    else:
+        st.info("No approved testimonials yet • Inspire the empire!")
+ 
+    # PENDING (OWNER/ADMIN)
+    if current_role in ["owner", "admin"] and pending:
+        st.subheader("⏳ Pending Approval")
+        for p in pending:
+            balance = users.balance_of(p["client_name"])
+            signed_url = p.get("signed_url")
+ 
+            with st.expander(f"{p['client_name']} • {p['date_submitted']} • Balance ${balance:,.2f}", expanded=False):
+                if signed_url:
+                    st.image(p.get("thumb_url") or signed_url, use_container_width=True)
+                    if p.get("thumb_url"):
+                        st.markdown(f"[🔍 View full size]({signed_url})")
+                else:
+                    st.caption("No photo")
+                st.markdown(p["message"])
+ 
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.button("Approve & Auto-Announce", key=f"app_{p['id']}"):
+                        try:
+                            supabase.table("testimonials").update({"status": "Approved"}).eq("id", p["id"]).execute()
+                            supabase.table("announcements").insert({
+                                "title": f"🌟 New Testimonial from {p['client_name']}!",
+                                "message": p["message"],
+                                "date": datetime.date.today().isoformat(),
+                                "posted_by": "System (Auto)",
+                                "category": "Testimonial"
+                            }).execute()
+                            st.success("Approved & announced!")
+                            invalidate_tables("testimonials", "announcements")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                with col2:
+                    if st.button("Reject & Delete", key=f"rej_{p['id']}", type="secondary"):
+                        try:
+                            if p.get("storage_path"):
+                                supabase.storage.from_("testimonials").remove(with_thumbnails(p["storage_path"]))
+                            supabase.table("testimonials").delete().eq("id", p["id"]).execute()
+                            st.success("Rejected & deleted permanently")
+                            invalidate_tables("testimonials")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+ 
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Empire Success Stories
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            Permanent photos • Full visibility • Balance context • Auto-announce • Realtime inspiration • Empire motivated.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX Testimonials • Cloud Permanent 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
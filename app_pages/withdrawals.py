@@ -0,0 +1,242 @@
+# ====================== WITHDRAWALS PAGE - FULL FINAL LATEST 2026 (PERMANENT STORAGE + PROOFS VISIBLE + REALTIME + ELITE UI) ======================
+import datetime
+
+import streamlit as st
+
+from utils.cache_tags import cached_query, invalidate_tables
+from utils.helpers import deferred_download, get_user_directory, live_select, upload_to_supabase, user_directory, watch_tables
+from utils.supabase_client import supabase
+from utils.theme import accent_color
+
+WITHDRAWALS_PER_PAGE = 20
+
+
+def render():
+    st.header("Withdrawal Management 💳")
+    st.markdown("**Empire payout engine: Clients request from earned balances • Permanent proof upload • Owner approve/pay/reject • Auto-deduct on paid • Realtime sync & full transparency.**")
+ 
+    current_role = st.session_state.get("role", "guest")
+ 
+    # LIVE CACHE: realtime events invalidate it • ttl is only a safety net
+    @cached_query("withdrawals", ttl=300)
+    def fetch_withdrawals_full():
+        return live_select("withdrawals", "date_requested")
+ 
+    # Proofs of the visible withdrawals only • ONE batched query → {withdrawal_id: [proofs]}
+    @cached_query("client_files", ttl=300)
+    def fetch_withdrawal_proofs(withdrawal_ids):
+        if not withdrawal_ids:
+            return {}
+        rows = supabase.table("client_files").select(
+            "id, original_name, file_url, storage_path, upload_date, withdrawal_id"
+        ).in_("withdrawal_id", list(withdrawal_ids)).order("upload_date", desc=True).execute().data or []
+        proofs_by_withdrawal = {}
+        for p in rows:
+            proofs_by_withdrawal.setdefault(p["withdrawal_id"], []).append(p)
+        return proofs_by_withdrawal
+ 
+    withdrawals = fetch_withdrawals_full()
+    users = user_directory()
+    watch_tables("withdrawals", "client_files")
+ 
+    # Manual refresh
+    if st.button("🔄 Refresh Withdrawals Now", use_container_width=True, type="secondary"):
+        fetch_withdrawals_full.clear()
+        st.rerun()
+ 
+    st.caption("🔄 Withdrawals update live • Proofs PERMANENT & fully visible")
+ 
+    # CLIENT VIEW
+    if current_role == "client":
+        my_name = st.session_state.full_name
+        my_balance = users.balance_of(my_name)
+        my_withdrawals = [w for w in withdrawals if w["client_name"] == my_name]
+ 
+        st.subheader(f"Your Withdrawals • Available Balance: ${my_balance:,.2f}")
+ 
+        # Request form
+        if my_balance > 0:
+            with st.expander("➕ Request New Withdrawal", expanded=True):
+                with st.form("client_wd_form", clear_on_submit=True):
+                    amount = st.number_input("Amount (USD)", min_value=1.0, max_value=my_balance, step=100.0)
+                    method = st.selectbox("Method", ["USDT", "Bank Transfer", "Wise", "PayPal", "GCash", "Other"])
+                    details = st.text_area("Payout Details (Wallet/Address/Bank Info)")
+                    proof = st.file_uploader("Upload Proof * (Permanent Storage)", type=["png","jpg","jpeg","pdf","gif"])
+ 
+                    submitted = st.form_submit_button("Submit Request", type="primary", use_container_width=True)
+                    if submitted:
+                        if amount > my_balance:
+                            st.error("Exceeds balance")
+                        elif not proof:
+                            st.error("Proof required")
+                        else:
+                            orphan_path = None
+                            try:
+                                url, storage_path = upload_to_supabase(
+                                    file=proof,
+                                    bucket="client_files",
+                                    folder="withdrawals"
+                                )
+                                orphan_path = storage_path
+                                # Withdrawal + proof in ONE transaction (no Pending request left without its proof)
+                                supabase.rpc("request_withdrawal", {
+                                    "p_withdrawal": {
+                                        "client_name": my_name,
+                                        "amount": amount,
+                                        "method": method,
+                                        "details": details,
+                                        "date_requested": datetime.date.today().isoformat()
+                                    },
+                                    "p_proof": {
+                                        "original_name": proof.name,
+                                        "file_url": url,
+                                        "storage_path": storage_path,
+                                        "upload_date": datetime.date.today().isoformat(),
+                                        "sent_by": my_name,
+                                        "category": "Withdrawal Proof",
+                                        "assigned_client": my_name,
+                                        "notes": f"Proof for ${amount:,.0f} withdrawal request"
+                                    }
+                                }).execute()
+                                orphan_path = None
+ 
+                                st.success("Request submitted with permanent proof!")
+                                invalidate_tables("client_files", "withdrawals")
+                                st.rerun()
+                            except Exception as e:
+                                # Request not recorded: drop the proof so no orphan is left in Storage
+                                if orphan_path:
+                                    try:
+                                        supabase.storage.from_("client_files").remove([orphan_path])
+                                    except Exception:
+                                        pass
+                                st.error(f"Error: {str(e)}")
+        else:
+            st.info("No balance yet • Earnings accumulate from profits")
+ 
+        # Client history
+        st.subheader("Your Request History")
+        if my_withdrawals:
+            for w in my_withdrawals:
+                status_color = {"Pending": "#ffa502", "Approved": accent_color, "Paid": "#2ed573", "Rejected": "#ff4757"}.get(w["status"], "#888")
+                st.markdown(f"""
+                <div class='glass-card' style='padding:1.6rem; border-left:6px solid {status_color};'>
+                    <h4 style='margin:0;'>${w['amount']:,.0f} • <span style='color:{status_color};'>{w['status']}</span></h4>
+                    <small>Method: {w['method']} • Requested: {w['date_requested']}</small>
+                </div>
+                """, unsafe_allow_html=True)
+                if w["details"]:
+                    with st.expander("Payout Details"):
+                        st.write(w["details"])
+                st.divider()
+        else:
+            st.info("No requests yet")
+ 
+    # OWNER/ADMIN VIEW
+    else:
+        st.subheader("All Empire Withdrawal Requests")
+        if withdrawals:
+            # One page of cards at a time • proofs are fetched for this page only
+            total_pages = (len(withdrawals) - 1) // WITHDRAWALS_PER_PAGE + 1
+            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1) if total_pages > 1 else 1
+            visible = withdrawals[(page - 1) * WITHDRAWALS_PER_PAGE:page * WITHDRAWALS_PER_PAGE]
+            proofs_by_withdrawal = fetch_withdrawal_proofs(tuple(w["id"] for w in visible))
+            for w in visible:
+                client_balance = users.balance_of(w["client_name"])
+                status_color = {"Pending": "#ffa502", "Approved": accent_color, "Paid": "#2ed573", "Rejected": "#ff4757"}.get(w["status"], "#888")
+ 
+                with st.container():
+                    st.markdown(f"""
+                    <div class='glass-card' style='padding:1.8rem; border-left:6px solid {status_color};'>
+                        <h4 style='margin:0;'>{w['client_name']} • ${w['amount']:,.0f} • <span style='color:{status_color};'>{w['status']}</span></h4>
+                        <small>Method: {w['method']} • Requested: {w['date_requested']} • Current Balance: ${client_balance:,.2f}</small>
+                    </div>
+                    """, unsafe_allow_html=True)
+ 
+                    if w["details"]:
+                        with st.expander("Payout Details"):
+                            st.write(w["details"])
+ 
+                    # Related proofs (permanent + visible)
+                    related_proofs = proofs_by_withdrawal.get(w["id"], [])
+                    if related_proofs:
+                        st.markdown("**Attached Proofs (Permanent):**")
+                        proof_cols = st.columns(min(len(related_proofs), 4))
+                        for idx, p in enumerate(related_proofs):
+                            file_url = p.get("file_url")
+                            if file_url:
+                                with proof_cols[idx % 4]:
+                                    if p["original_name"].lower().endswith(('.png','.jpg','.jpeg','.gif')):
+                                        st.image(file_url, caption=p["original_name"], use_container_width=True)
+                                    else:
+                                        st.markdown(f"**{p['original_name']}** • {p['upload_date']}")
+                                        st.download_button(
+                                            f"Download {p['original_name']}",
+                                            deferred_download("client_files", p.get("storage_path"), file_url),
+                                            p['original_name'],
+                                            on_click="ignore",
+                                            use_container_width=True,
+                                            key=f"proof_dl_{w['id']}_{p['id']}"
+                                        )
+ 
+                    # Actions
+                    col_act = st.columns(3)
+                    if w["status"] == "Pending":
+                        with col_act[0]:
+                            if st.button("Approve", key=f"app_{w['id']}", use_container_width=True):
+                                try:
+                                    supabase.table("withdrawals").update({
+                                        "status": "Approved",
+                                        "date_processed": datetime.date.today().isoformat(),
+                                        "processed_by": st.session_state.full_name
+                                    }).eq("id", w["id"]).execute()
+                                    st.success("Approved!")
+                                    invalidate_tables("withdrawals")
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"Error: {str(e)}")
+                        with col_act[1]:
+                            if st.button("Reject", key=f"rej_{w['id']}", use_container_width=True, type="secondary"):
+                                try:
+                                    supabase.table("withdrawals").update({
+                                        "status": "Rejected",
+                                        "date_processed": datetime.date.today().isoformat(),
+                                        "processed_by": st.session_state.full_name
+                                    }).eq("id", w["id"]).execute()
+                                    st.success("Rejected")
+                                    invalidate_tables("withdrawals")
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"Error: {str(e)}")
+ 
+                    if w["status"] == "Approved":
+                        with col_act[0]:
+                            if st.button("Mark as Paid → Auto-Deduct", key=f"paid_{w['id']}", type="primary", use_container_width=True):
+                                try:
+                                    # Deduct in place + mark Paid in ONE transaction (no stale balance written back)
+                                    resp = supabase.rpc("mark_withdrawal_paid", {"p_withdrawal_id": w["id"]}).execute()
+                                    paid_user = (resp.data or {}).get("user")
+                                    if paid_user:
+                                        get_user_directory().upsert(paid_user)
+                                    st.success("Paid & balance deducted!")
+                                    invalidate_tables("withdrawals")
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"Error: {str(e)}")
+ 
+                    st.divider()
+        else:
+            st.info("No withdrawal requests yet • Empire cashflow smooth")
+ 
+    # ELITE FOOTER
+    st.markdown(f"""
+    <div class='glass-card' style='padding:3rem; text-align:center; margin:3rem 0;'>
+        <h1 style="background:linear-gradient(90deg,{accent_color},#ffd700); -webkit-background-clip:text; -webkit-text-fill-color:transparent;">
+            Secure & Automatic Payouts
+        </h1>
+        <p style="font-size:1.3rem; margin:2rem 0;">
+            Permanent proofs • Balance limited • Owner actions instant • Auto-deduct • Realtime everywhere • Empire cashflow elite.
+        </p>
+        <h2 style="color:#ffd700;">👑 KMFX Withdrawals • Cloud Permanent 2026</h2>
+    </div>
+    """, unsafe_allow_html=True)
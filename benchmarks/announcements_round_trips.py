@@ -0,0 +1,190 @@
+# ====================== BENCHMARK • ANNOUNCEMENTS ROUND TRIPS ======================
+# Counts the Supabase round trips (PostgREST queries + Storage signing calls) that
+# one cold load of the Announcements feed costs, before and after attachments and
+# signed URLs were batched (user-004).
+#
+#   before: the old per-announcement loop (kept below, verbatim)
+#   after:  the real Announcements page rendered through streamlit's AppTest
+#
+# Both run against the same in-memory counting client, so no network or
+# credentials are needed:
+#
+#   python benchmarks/announcements_round_trips.py [--announcements 50] [--attachments 80] [--rtt-ms 40]
+import argparse
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# utils.supabase_client needs these at import time; the realtime mirror can't connect → DB fallback
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_KEY", "benchmark")
+
+
+class CountingSupabase:
+    """Just enough of the supabase client for the Announcements page • every execute()/sign call is one round trip"""
+
+    def __init__(self, n_announcements: int, n_attachments: int):
+        self.round_trips = []  # (kind, target)
+        self.db = {
+            "announcements": [
+                {"id": i, "title": f"Announcement {i}", "message": "…", "category": "General",
+                 "date": f"2026-10-{1 + i % 28:02d}", "posted_by": "Owner", "pinned": False, "likes": 0}
+                for i in range(n_announcements)
+            ],
+            "announcement_files": [
+                {"id": k, "announcement_id": k % max(n_announcements, 1),
+                 "original_name": f"proof_{k}.pdf", "storage_path": f"uuid-{k}_proof_{k}.pdf"}
+                for k in range(n_attachments if n_announcements else 0)
+            ],
+            "announcement_comments": [],
+        }
+        self.storage = _Storage(self)
+
+    def table(self, name):
+        return _Query(self, name)
+
+    def rpc(self, name, params=None):
+        return _Query(self, f"rpc:{name}")
+
+
+class _Query:
+    def __init__(self, client, table):
+        self.client, self.table, self.filters = client, table, []
+
+    def __getattr__(self, name):
+        def chain(*args, **kwargs):
+            if name == "eq":
+                self.filters.append(lambda r: r.get(args[0]) == args[1])
+            elif name == "in_":
+                self.filters.append(lambda r, v=set(args[1]): r.get(args[0]) in v)
+            return self
+        return chain
+
+    def execute(self):
+        self.client.round_trips.append(("query", self.table))
+        rows = [dict(r) for r in self.client.db.get(self.table, []) if all(f(r) for f in self.filters)]
+        return type("Response", (), {"data": rows, "count": len(rows)})()
+
+
+class _Storage:
+    def __init__(self, client):
+        self.client = client
+
+    def from_(self, bucket):
+        return _Bucket(self.client, bucket)
+
+
+class _Bucket:
+    def __init__(self, client, bucket):
+        self.client, self.bucket = client, bucket
+
+    def create_signed_url(self, path, expires_in):
+        self.client.round_trips.append(("sign", self.bucket))
+        return {"signedURL": f"https://storage.local/{self.bucket}/{path}?token=x"}
+
+    def create_signed_urls(self, paths, expires_in):
+        self.client.round_trips.append(("sign", self.bucket))
+        return [{"path": p, "signedURL": f"https://storage.local/{self.bucket}/{p}?token=x", "error": None} for p in paths]
+
+    def get_public_url(self, path):
+        return f"https://storage.local/{self.bucket}/{path}"
+
+
+def legacy_fetch(supabase):
+    """fetch_announcements_realtime as it was before user-004 (1 query per announcement, 1 sign per file)"""
+    ann_resp = supabase.table("announcements").select("*").order("date", desc=True).execute()
+    announcements = ann_resp.data or []
+
+    # Fetch attachments + generate SIGNED URLs (works even on private buckets)
+    for ann in announcements:
+        att_resp = supabase.table("announcement_files").select(
+            "id, original_name, storage_path"
+        ).eq("announcement_id", ann["id"]).execute()
+        attachments = []
+        for att in att_resp.data or []:
+            if att.get("storage_path"):
+                try:
+                    signed = supabase.storage.from_("announcements").create_signed_url(
+                        att["storage_path"], 3600 * 24 * 30  # 30 days expiry
+                    )
+                    att["signed_url"] = signed.get("signedURL") if signed else None
+                except:
+                    att["signed_url"] = None
+            else:
+                att["signed_url"] = None
+            attachments.append(att)
+        ann["attachments"] = attachments
+
+    # Comments (realtime)
+    comm_resp = supabase.table("announcement_comments").select("*").order("timestamp", desc=True).execute()
+    comments_map = {}
+    for c in comm_resp.data or []:
+        comments_map.setdefault(c["announcement_id"], []).append(c)
+    for ann in announcements:
+        ann["comments"] = comments_map.get(ann["id"], [])
+    return announcements
+
+
+def _render_page(root, n_announcements, n_attachments):
+    # AppTest runs only this function's source: swap the shared client for the counting one, render once
+    import sys
+
+    sys.path.insert(0, root)
+    import streamlit as st
+
+    import utils.helpers as helpers
+    import utils.supabase_client as supabase_client
+    from app_pages import load_page
+    from benchmarks.announcements_round_trips import CountingSupabase
+
+    fake = CountingSupabase(n_announcements, n_attachments)
+    supabase_client.supabase = helpers.supabase = fake
+    page = load_page("📢 Announcements")
+    page.supabase = fake
+    page.render()
+    st.session_state["round_trips"] = fake.round_trips
+
+
+def page_round_trips(n_announcements: int, n_attachments: int) -> list:
+    from streamlit.testing.v1 import AppTest
+
+    # Bare-mode "missing ScriptRunContext" noise from setting session_state outside a run
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    at = AppTest.from_function(_render_page, args=(ROOT, n_announcements, n_attachments), default_timeout=60)
+    at.session_state["authenticated"] = True
+    at.session_state["role"] = "owner"
+    at.session_state["full_name"] = "Owner"
+    at.session_state["theme"] = "light"
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at.session_state["round_trips"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Announcements feed round trips, before vs after")
+    parser.add_argument("--announcements", type=int, default=50)
+    parser.add_argument("--attachments", type=int, default=80)
+    parser.add_argument("--rtt-ms", type=float, default=40, help="round-trip latency used for the time estimate")
+    args = parser.parse_args()
+
+    before_client = CountingSupabase(args.announcements, args.attachments)
+    legacy_fetch(before_client)
+    before = before_client.round_trips
+
+    after_all = page_round_trips(args.announcements, args.attachments)
+    feed_targets = {"announcements", "announcement_files", "announcement_comments"}
+    after = [rt for rt in after_all if rt[0] == "sign" or rt[1] in feed_targets]
+
+    print(f"{args.announcements} announcements, {args.attachments} attachments, {args.rtt_ms:.0f} ms per round trip")
+    print(f"  before: {len(before):4d} round trips  (~{len(before) * args.rtt_ms / 1000:.2f}s sequential)")
+    print(f"  after:  {len(after):4d} round trips  (~{len(after) * args.rtt_ms / 1000:.2f}s sequential)")
+    for kind, target in after:
+        print(f"          {kind:5s} {target}")
+    print(f"  whole page render: {len(after_all)} round trips")
+
+
+if __name__ == "__main__":
+    main()
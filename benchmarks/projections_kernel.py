@@ -0,0 +1,65 @@
+# ====================== BENCHMARK • PROJECTION KERNEL ======================
+# utils.projections.project() vs the month-by-month list appends the Growth Fund
+# and Simulator pages used before (user-014), on the same inputs with both
+# compounding options on. Checks every series matches, then times both:
+#
+#   python benchmarks/projections_kernel.py [--runs 2000] [--months 72 720]
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.projections import project  # noqa: E402
+
+INPUTS = dict(monthly_gross=150000.0, gf_pct=20.0, manual_in=5000.0, unit_value=3000.0,
+              start_equity=250000.0, start_gf=40000.0, gross_growth_pct=2.0, gf_return_pct=1.0)
+
+
+def loop_project(months, monthly_gross, gf_pct=0.0, manual_in=0.0, unit_value=3000.0, start_equity=0.0,
+                 start_gf=0.0, gross_growth_pct=0.0, gf_return_pct=0.0):
+    """The pages' old append loop, extended with the kernel's two compounding inputs"""
+    equity_proj = [start_equity]
+    gf_proj = [start_gf]
+    distributed_proj = [0.0]
+    units_proj = [0.0]
+
+    gross = monthly_gross
+    for i in range(months):
+        if i > 0:
+            gross *= 1 + gross_growth_pct / 100
+        gf_add = gross * gf_pct / 100 + manual_in
+        equity_proj.append(equity_proj[-1] + gross)
+        gf_proj.append(gf_proj[-1] * (1 + gf_return_pct / 100) + gf_add)
+        distributed_proj.append(distributed_proj[-1] + gross - gf_add)
+        units_proj.append(units_proj[-1] + gross / unit_value)
+    return {"equity": equity_proj, "growth_fund": gf_proj, "distributed": distributed_proj, "units": units_proj}
+
+
+def check(months):
+    for inputs in (dict(INPUTS, gross_growth_pct=0.0, gf_return_pct=0.0), INPUTS):
+        expected = loop_project(months, **inputs)
+        got = project(months, **inputs)
+        for series, values in expected.items():
+            assert np.allclose(got[series], values), f"{series} differs ({months} months, {inputs})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Projection kernel vs append loop")
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--months", type=int, nargs="+", default=[72, 720])
+    args = parser.parse_args()
+
+    print(f"timeit, best of 5 × {args.runs} runs, compounding on")
+    for months in args.months:
+        check(months)
+        loop = min(timeit.repeat(lambda: loop_project(months, **INPUTS), number=args.runs, repeat=5)) / args.runs
+        kernel = min(timeit.repeat(lambda: project(months, **INPUTS), number=args.runs, repeat=5)) / args.runs
+        print(f"  {months:4d} months: loop {loop * 1e6:7.1f}us  kernel {kernel * 1e6:7.1f}us  ({loop / kernel:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# ====================== BENCHMARK • SCENARIO SWEEP ======================
+# utils.scenario_sweep.run_sweep() on Simulator-sized grids: a per-scenario
+# Python loop (how the steady projection would be repeated per scenario) vs the
+# vectorized chunk evaluation vs a cold run_sweep() (grid build + DataFrame)
+# vs the memoized repeat.
+#
+#   python benchmarks/scenario_sweep.py [--steps 6 8 10 12]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import scenario_sweep  # noqa: E402
+from utils.scenario_sweep import AXES, _evaluate_chunk, run_sweep  # noqa: E402
+
+FIXED = {"months": 72, "start_equity": 250000.0, "start_gf": 40000.0, "gf_target": 1000000.0}
+RANGES = {
+    "projected_accounts": (1, 50),
+    "gross_per_acc": (5000, 30000),
+    "gf_pct": (0, 40),
+    "unit_value": (1000, 5000),
+    "manual_in": (0, 20000),
+}
+
+
+def axes_for(steps):
+    return {k: list(np.linspace(lo, hi, steps)) for k, (lo, hi) in RANGES.items()}
+
+
+def python_loop(grid, fixed):
+    """One steady projection per scenario, month by month (reference for the vectorized model)"""
+    out = []
+    for accounts, gross_per_acc, gf_pct, unit_value, manual_in in grid:
+        equity, gf, distributed, units, to_target = fixed["start_equity"], fixed["start_gf"], 0.0, 0.0, np.inf
+        if gf >= fixed["gf_target"]:
+            to_target = 0.0
+        for month in range(1, fixed["months"] + 1):
+            gross = accounts * gross_per_acc
+            gf_add = gross * gf_pct / 100 + manual_in
+            equity += gross
+            gf += gf_add
+            distributed += gross - gf_add
+            units += gross / unit_value if unit_value > 0 else 0.0
+            if to_target == np.inf and gf >= fixed["gf_target"]:
+                to_target = float(month)
+        out.append((equity, gf, distributed, units, to_target))
+    return np.array(out)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scenario sweep timings")
+    parser.add_argument("--steps", type=int, nargs="+", default=[6, 8, 10, 12],
+                        help="values per axis (grid size = steps^5)")
+    parser.add_argument("--loop-sample", type=int, default=2000,
+                        help="scenarios timed with the Python loop (extrapolated to the grid)")
+    args = parser.parse_args()
+
+    print(f"{FIXED['months']} months")
+    for steps in args.steps:
+        axes = axes_for(steps)
+        mesh = np.meshgrid(*(np.asarray(axes[k], dtype=float) for k in AXES), indexing="ij")
+        grid = np.stack(mesh, axis=-1).reshape(-1, len(AXES))
+        sample = grid[:args.loop_sample]
+
+        looped, loop_time = timed(lambda: python_loop(sample, FIXED))
+        vectorized, inline_time = timed(lambda: _evaluate_chunk(grid, FIXED))
+        # months_to_target may differ by one where the target is hit exactly (running sum vs ceil(gap / add))
+        assert np.allclose(looped[:, :4], vectorized[:len(sample), :4]), "vectorized model differs from the loop"
+        assert np.allclose(looped[:, 4], vectorized[:len(sample), 4], rtol=0, atol=1)
+
+        scenario_sweep._memo.clear()
+        result, cold_time = timed(lambda: run_sweep(axes, FIXED))
+        assert np.allclose(result.iloc[:, len(AXES):].to_numpy(), vectorized)
+        _, memo_time = timed(lambda: run_sweep(axes, FIXED))
+
+        loop_estimate = loop_time / len(sample) * len(grid)
+        print(f"  {len(grid):>7,} scenarios: loop ~{loop_estimate:8.3f}s  inline {inline_time:7.4f}s  "
+              f"run_sweep {cold_time:7.4f}s  memoized {memo_time * 1000:6.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
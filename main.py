@@ -21,9 +21,9 @@ from utils.auth import login_user, is_authenticated
 from utils.helpers import (
     upload_to_supabase,
     make_same_size,
-    log_action,
-    start_keep_alive_if_needed
+    log_action
 )
+from utils.bootstrap import start_keep_alive_if_needed
 
 # Optional keep-alive
 start_keep_alive_if_needed()
@@ -31,9 +31,9 @@ start_keep_alive_if_needed()
 # ────────────────────────────────────────────────
 # ADDITIONAL IMPORTS FOR NEW FEATURES
 # ────────────────────────────────────────────────
-import yfinance as yf
-from datetime import datetime, timedelta
 from streamlit_lightweight_charts import renderLightweightCharts
+from utils.gold_price import GoldPricePoller
+from utils.ohlc_store import OhlcStore
 
 # ────────────────────────────────────────────────
 # Determine authentication state FIRST
@@ -315,56 +315,61 @@ st.markdown(f"""
 st.markdown("<p style='text-align:center; font-size:1.1rem; color:#888888;'>Mark Jeff Blando – Founder & Developer • 2026</p>", unsafe_allow_html=True)
 
 # ================== LIVE GOLD PRICE METRIC ==================
-@st.cache_data(ttl=30)  # refresh every 30 seconds
+@st.cache_resource
+def get_gold_poller():
+    # ONE background poller per process (fast_info every 30s) • renders never wait on Yahoo
+    return GoldPricePoller(interval=30)
+
 def get_gold_price():
-    try:
-        ticker = yf.Ticker("GC=F")
-        info = ticker.info
-        price = info.get('regularMarketPrice') or info.get('previousClose', 'N/A')
-        change_pct = info.get('regularMarketChangePercent', 0)
-        return price, change_pct
-    except Exception:
-        return 'N/A', 0
+    quote = get_gold_poller().latest()
+    if quote is None:
+        return 'N/A', 0, None
+    return quote.price, quote.change_pct, quote
 
-price, change = get_gold_price()
+price, change, gold_quote = get_gold_price()
 
 st.markdown("<div style='text-align:center; margin:1.5rem 0;'>", unsafe_allow_html=True)
 st.metric(
-    label="Live Gold Price (XAU/USD)",
+    label="Live Gold Price (XAU/USD)" if gold_quote is None or not gold_quote.stale else "Gold Price (XAU/USD) • Delayed",
     value=f"${price:,.2f}" if isinstance(price, (int, float)) else price,
     delta=f"{change:+.2f}%",
     delta_color="normal" if change >= 0 else "inverse"
 )
+if gold_quote is not None and gold_quote.stale:
+    # Upstream failing (or quote too old) → last good price, clearly marked as not live
+    as_of = datetime.datetime.fromtimestamp(gold_quote.fetched_at).strftime("%b %d, %H:%M")
+    st.markdown(f"<p style='text-align:center; color:#f0ad4e; font-size:0.9rem;'>⚠️ Stale • last updated {as_of}</p>", unsafe_allow_html=True)
 st.markdown("</div>", unsafe_allow_html=True)
 
-# ================== MINI GOLD CHART (7-day candlestick) ==================
+# ================== MINI GOLD CHART (candlestick • local candle store) ==================
+GOLD_CHART_RANGES = {
+    "7D": {"days": 7, "bucket": None},       # hourly bars
+    "30D": {"days": 30, "bucket": "4h"},
+    "1Y": {"days": 365, "bucket": "1D"}
+}
+
+@st.cache_resource
+def get_ohlc_store():
+    # Local SQLite candles • each sync downloads only bars newer than the last stored one
+    return OhlcStore("uploaded_files/market/ohlc.sqlite3")
+
 @st.cache_data(ttl=300)  # refresh every 5 minutes
-def get_gold_chart_data():
+def get_gold_chart_data(range_key="7D"):
+    store = get_ohlc_store()
     try:
-        end = datetime.now()
-        start = end - timedelta(days=7)
-        df = yf.download("GC=F", start=start, end=end, interval="1h")
-        if df.empty:
-            return []
-        df = df[['Open', 'High', 'Low', 'Close']].reset_index()
-        df['time'] = (df['Datetime'].astype('int64') // 10**9).astype(int)
-        return [
-            {
-                "time": int(row['time']),
-                "open": float(row['Open']),
-                "high": float(row['High']),
-                "low": float(row['Low']),
-                "close": float(row['Close'])
-            }
-            for _, row in df.iterrows()
-        ]
-    except:
+        store.sync("GC=F", "1h")
+    except Exception:
+        pass  # keep serving the stored history
+    try:
+        return store.chart_payload("GC=F", **GOLD_CHART_RANGES[range_key])
+    except Exception:
         return []
 
-chart_data = get_gold_chart_data()
+chart_range = st.radio("Gold chart range", list(GOLD_CHART_RANGES), horizontal=True, label_visibility="collapsed", key="gold_chart_range")
+chart_data = get_gold_chart_data(chart_range)
 
 if chart_data:
-    st.markdown("<h3 style='text-align:center; color:#ffd700; margin:1.5rem 0;'>Gold 7-Day Mini Chart</h3>", unsafe_allow_html=True)
+    st.markdown(f"<h3 style='text-align:center; color:#ffd700; margin:1.5rem 0;'>Gold {chart_range} Mini Chart</h3>", unsafe_allow_html=True)
     
     chart_options = {
         "width": "100%",
@@ -0,0 +1,87 @@
+-- ====================== AUDIT LOGS • SERVER-SIDE FILTER + SUMMARY ======================
+-- The Audit Logs page used to download the whole `logs` table and filter / count in
+-- Python. Rows are now paged with keyset pagination on ("timestamp", id) and every
+-- count comes from audit_log_overview() / audit_log_summary() below, so only one
+-- page of rows ever leaves the database.
+
+create extension if not exists pg_trgm;
+
+-- Keyset pagination: ORDER BY "timestamp" DESC, id DESC
+create index if not exists logs_timestamp_id_idx on logs ("timestamp" desc, id desc);
+create index if not exists logs_user_name_idx on logs (user_name);
+create index if not exists logs_action_idx on logs (action);
+
+-- ILIKE '%term%' search on action / details / user_name
+create index if not exists logs_action_trgm_idx on logs using gin (action gin_trgm_ops);
+create index if not exists logs_details_trgm_idx on logs using gin (details gin_trgm_ops);
+create index if not exists logs_user_name_trgm_idx on logs using gin (user_name gin_trgm_ops);
+
+-- Page header, unfiltered (the same for every filter • cached once by the app):
+--   totals, action distribution, filter dropdown options, first/last activity
+create or replace function audit_log_overview()
+returns jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'total_actions', (select count(*) from logs),
+        'unique_users', (select count(distinct user_name) from logs where user_name is not null),
+        'unique_actions', (select count(distinct action) from logs),
+        'first_timestamp', (select min("timestamp") from logs),
+        'last_timestamp', (select max("timestamp") from logs),
+        'action_counts', coalesce((
+            select jsonb_object_agg(action, n order by n desc)
+            from (select coalesce(action, '') as action, count(*) as n from logs group by 1) a
+        ), '{}'::jsonb),
+        'users', coalesce((
+            select jsonb_agg(user_name order by user_name)
+            from (select distinct user_name from logs where user_name is not null) u
+        ), '[]'::jsonb),
+        'actions', coalesce((
+            select jsonb_agg(action order by action)
+            from (select distinct action from logs where action is not null) a
+        ), '[]'::jsonb)
+    );
+$$;
+
+-- Filtered part only: matching row count + daily counts for the timeline chart.
+-- Dates use the page's row-query convention: "timestamp" >= p_from and < p_to + 1 day.
+-- log_action writes ISO strings, so "timestamp" is cast explicitly (works for text and timestamptz).
+-- p_search is matched literally: % and _ typed by the user are escaped, like the page's row query.
+create or replace function audit_log_summary(
+    p_search text default null,
+    p_user text default null,
+    p_action text default null,
+    p_from date default null,
+    p_to date default null
+)
+returns jsonb
+language sql
+stable
+as $$
+    with term as (
+        select '%' || replace(replace(replace(p_search, '\', '\\'), '%', '\%'), '_', '\_') || '%' as pattern
+    ),
+    filtered as (
+        select l."timestamp"::timestamptz as ts
+        from logs l, term t
+        where (p_search is null or p_search = ''
+               or l.action ilike t.pattern
+               or l.details ilike t.pattern
+               or l.user_name ilike t.pattern)
+          and (p_user is null or l.user_name = p_user)
+          and (p_action is null or l.action = p_action)
+          and (p_from is null or l."timestamp"::timestamptz >= p_from)
+          and (p_to is null or l."timestamp"::timestamptz < p_to + 1)
+    )
+    select jsonb_build_object(
+        'filtered_total', (select count(*) from filtered),
+        'daily', coalesce((
+            select jsonb_agg(jsonb_build_object('day', day, 'actions', n) order by day)
+            from (select ts::date as day, count(*) as n from filtered group by 1) d
+        ), '[]'::jsonb)
+    );
+$$;
+
+grant execute on function audit_log_overview() to anon, authenticated;
+grant execute on function audit_log_summary(text, text, text, date, date) to anon, authenticated;
@@ -0,0 +1,62 @@
+-- ====================== PROFIT SHARING • ATOMIC DISTRIBUTION RPC ======================
+-- "Record & Distribute Profit" used to insert the profit, bulk-insert the
+-- distributions, then run one users.update({"balance": new_bal}) per recipient with
+-- new_bal taken from a 60s-stale snapshot, then insert the Growth Fund row — all as
+-- separate round trips. Two concurrent recordings could overwrite each other's
+-- balances. Everything now runs here in ONE transaction, and balances are
+-- incremented in place (balance = balance + share) in a single statement.
+--
+-- p_profit        → one `profits` row (without id)
+-- p_distributions → array of `profit_distributions` rows (profit_id is filled in here)
+-- p_growth_fund   → optional `growth_fund_transactions` row (null = no GF add)
+--
+-- Balance rule (unchanged): every distribution with a participant_user_id that is
+-- NOT the Growth Fund row is credited to that user.
+create or replace function record_profit_distribution(
+    p_profit jsonb,
+    p_distributions jsonb default '[]'::jsonb,
+    p_growth_fund jsonb default null
+)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_profit_id profits.id%type;
+    v_credited integer := 0;
+begin
+    insert into profits (account_id, gross_profit, record_date, units_generated, growth_fund_add, contributor_share_pct)
+    select r.account_id, r.gross_profit, r.record_date, r.units_generated, r.growth_fund_add, r.contributor_share_pct
+    from jsonb_populate_record(null::profits, p_profit) r
+    returning id into v_profit_id;
+
+    insert into profit_distributions (
+        profit_id, participant_name, participant_user_id, participant_role,
+        percentage, share_amount, is_growth_fund
+    )
+    select v_profit_id, d.participant_name, d.participant_user_id, d.participant_role,
+           d.percentage, d.share_amount, coalesce(d.is_growth_fund, false)
+    from jsonb_populate_recordset(null::profit_distributions, p_distributions) d;
+
+    update users u
+    set balance = coalesce(u.balance, 0) + c.total
+    from (
+        select d.participant_user_id::text as user_id, sum(d.share_amount) as total
+        from jsonb_populate_recordset(null::profit_distributions, p_distributions) d
+        where d.participant_user_id is not null
+          and not coalesce(d.is_growth_fund, false)
+        group by 1
+    ) c
+    where u.id::text = c.user_id;
+    get diagnostics v_credited = row_count;
+
+    if p_growth_fund is not null then
+        insert into growth_fund_transactions (date, type, amount, description, account_source, recorded_by)
+        select g.date, g.type, g.amount, g.description, g.account_source, g.recorded_by
+        from jsonb_populate_record(null::growth_fund_transactions, p_growth_fund) g;
+    end if;
+
+    return jsonb_build_object('profit_id', v_profit_id, 'credited_users', v_credited);
+end;
+$$;
+
+grant execute on function record_profit_distribution(jsonb, jsonb, jsonb) to anon, authenticated;
@@ -0,0 +1,88 @@
+-- ====================== PROFIT SHARING • BULK HISTORICAL IMPORT RPC ======================
+-- Backfills many profits in ONE transaction. Each item has the same shape as the
+-- arguments of record_profit_distribution():
+--   {"profit": {...}, "distributions": [{...}, ...], "growth_fund": {...} | null}
+-- Only the profit rows are inserted one by one (their ids are needed for the
+-- distributions); distributions, balance credits and Growth Fund transactions are
+-- each written with a single set-based statement for the whole batch.
+--
+-- Dedupe is enforced HERE, not only in the app's preview: an item whose
+-- (account_id, record_date, gross_profit) is already stored — or repeated
+-- earlier in the same call — is skipped entirely (no profit, no credit, no GF).
+
+-- Dedupe lookups + the app's range query
+create index if not exists profits_account_date_idx on profits (account_id, record_date);
+
+create or replace function record_profit_distributions_bulk(p_items jsonb)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_item jsonb;
+    v_profit_id profits.id%type;
+    v_distributions jsonb := '[]'::jsonb;
+    v_kept jsonb := '[]'::jsonb;
+    v_profits integer := 0;
+    v_skipped integer := 0;
+    v_credited integer := 0;
+begin
+    -- Concurrent imports run one after the other, so the dedupe check below is exact
+    perform pg_advisory_xact_lock(hashtext('record_profit_distributions_bulk'));
+
+    for v_item in select value from jsonb_array_elements(p_items)
+    loop
+        if exists (
+            select 1
+            from profits p, jsonb_populate_record(null::profits, v_item->'profit') r
+            where p.account_id = r.account_id
+              and p.record_date = r.record_date
+              and round(p.gross_profit::numeric, 2) = round(r.gross_profit::numeric, 2)
+        ) then
+            v_skipped := v_skipped + 1;
+            continue;
+        end if;
+
+        insert into profits (account_id, gross_profit, record_date, units_generated, growth_fund_add, contributor_share_pct)
+        select r.account_id, r.gross_profit, r.record_date, r.units_generated, r.growth_fund_add, r.contributor_share_pct
+        from jsonb_populate_record(null::profits, v_item->'profit') r
+        returning id into v_profit_id;
+
+        v_distributions := v_distributions || coalesce((
+            select jsonb_agg(d || jsonb_build_object('profit_id', v_profit_id))
+            from jsonb_array_elements(coalesce(v_item->'distributions', '[]'::jsonb)) d
+        ), '[]'::jsonb);
+        v_kept := v_kept || jsonb_build_array(v_item);
+        v_profits := v_profits + 1;
+    end loop;
+
+    insert into profit_distributions (
+        profit_id, participant_name, participant_user_id, participant_role,
+        percentage, share_amount, is_growth_fund
+    )
+    select d.profit_id, d.participant_name, d.participant_user_id, d.participant_role,
+           d.percentage, d.share_amount, coalesce(d.is_growth_fund, false)
+    from jsonb_populate_recordset(null::profit_distributions, v_distributions) d;
+
+    update users u
+    set balance = coalesce(u.balance, 0) + c.total
+    from (
+        select d.participant_user_id::text as user_id, sum(d.share_amount) as total
+        from jsonb_populate_recordset(null::profit_distributions, v_distributions) d
+        where d.participant_user_id is not null
+          and not coalesce(d.is_growth_fund, false)
+        group by 1
+    ) c
+    where u.id::text = c.user_id;
+    get diagnostics v_credited = row_count;
+
+    insert into growth_fund_transactions (date, type, amount, description, account_source, recorded_by)
+    select g.date, g.type, g.amount, g.description, g.account_source, g.recorded_by
+    from jsonb_array_elements(v_kept) i,
+         jsonb_populate_record(null::growth_fund_transactions, i->'growth_fund') g
+    where jsonb_typeof(i->'growth_fund') = 'object';
+
+    return jsonb_build_object('profits', v_profits, 'skipped', v_skipped, 'credited_users', v_credited);
+end;
+$$;
+
+grant execute on function record_profit_distributions_bulk(jsonb) to anon, authenticated;
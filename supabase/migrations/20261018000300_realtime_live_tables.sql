@@ -0,0 +1,20 @@
+-- ====================== REALTIME • LIVE TABLES ======================
+-- The app keeps one Realtime subscription per process (utils/live_tables.py) and
+-- mirrors these tables from their change events instead of polling them every
+-- 6–10s per session. Postgres changes are only broadcast for tables that are part
+-- of the supabase_realtime publication.
+
+do $$
+declare
+    t text;
+begin
+    foreach t in array array['messages', 'notifications', 'withdrawals', 'client_files', 'announcements'] loop
+        if not exists (
+            select 1 from pg_publication_tables
+            where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = t
+        ) then
+            execute format('alter publication supabase_realtime add table public.%I', t);
+        end if;
+    end loop;
+end;
+$$;
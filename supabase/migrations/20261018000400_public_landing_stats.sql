@@ -0,0 +1,21 @@
+-- ====================== PUBLIC LANDING • ONE-ROW STATS VIEW ======================
+-- The unauthenticated landing page ran four queries per visit: an accounts count,
+-- every account's current_equity, every growth_fund_transactions row (summed in
+-- Python) and a client count. The totals already live in the materialized views;
+-- this view exposes them as ONE row, read by a single process-wide refresher
+-- (utils/public_stats.py) instead of by every anonymous session.
+
+-- Client head count (the only non-MV figure) is an index-only count
+create index if not exists users_role_idx on users (role);
+
+create or replace view public_landing_stats as
+select
+    coalesce(e.total_accounts, 0)                                   as total_accounts,
+    coalesce(e.total_equity, 0)                                     as total_equity,
+    coalesce(g.balance, 0)                                          as growth_fund_balance,
+    (select count(*) from users u where u.role = 'client')          as members
+from (select 1) one
+left join mv_empire_summary e on true
+left join mv_growth_fund_balance g on true;
+
+grant select on public_landing_stats to anon, authenticated;
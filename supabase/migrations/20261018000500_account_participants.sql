@@ -0,0 +1,105 @@
+-- ====================== MY PROFILE • ACCOUNT PARTICIPANT INDEX ======================
+-- My Profile used to download every ftmo_accounts row (select *) every 10s per
+-- client and scan each participants_v2 / legacy participants JSON tree in Python
+-- to find the caller's accounts. account_participants is a flat index of who is
+-- in which tree, kept in sync by a trigger whenever a tree is saved, and
+-- my_profile_accounts() returns only the caller's accounts (the app projects
+-- the columns it renders).
+--
+-- One row per tree member:
+--   participants_v2 → user_id + display_name
+--   participants    → display_name = name (legacy trees have no user ids)
+
+-- Same id type as ftmo_accounts.id, whatever it is
+create table if not exists account_participants as
+select id as account_id, null::text as user_id, null::text as display_name
+from ftmo_accounts
+with no data;
+
+do $$
+begin
+    if not exists (
+        select 1 from pg_constraint where conname = 'account_participants_account_id_fkey'
+    ) then
+        alter table account_participants
+            alter column account_id set not null,
+            add constraint account_participants_account_id_fkey
+                foreign key (account_id) references ftmo_accounts (id) on delete cascade;
+    end if;
+end;
+$$;
+
+-- Only read through my_profile_accounts() • never exposed to the API roles directly
+alter table account_participants enable row level security;
+revoke all on account_participants from anon, authenticated;
+
+create index if not exists account_participants_account_idx on account_participants (account_id);
+create index if not exists account_participants_user_idx on account_participants (user_id);
+create index if not exists account_participants_name_idx on account_participants (display_name);
+
+-- Tree members of one account: v2 (user_id + display_name) + legacy (name)
+create or replace function account_participant_rows(p_participants_v2 jsonb, p_participants jsonb)
+returns table (user_id text, display_name text)
+language sql
+immutable
+as $$
+    select distinct p.user_id, p.display_name
+    from (
+        select nullif(e->>'user_id', '') as user_id, e->>'display_name' as display_name
+        from jsonb_array_elements(case when jsonb_typeof(p_participants_v2) = 'array' then p_participants_v2 else '[]'::jsonb end) e
+        union all
+        select null, e->>'name'
+        from jsonb_array_elements(case when jsonb_typeof(p_participants) = 'array' then p_participants else '[]'::jsonb end) e
+    ) p
+    where p.user_id is not null or p.display_name is not null;
+$$;
+
+-- security definer: the index is written on behalf of whoever saves the tree (RLS above)
+create or replace function sync_account_participants()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    delete from account_participants where account_id = new.id;
+
+    insert into account_participants (account_id, user_id, display_name)
+    select new.id, p.user_id, p.display_name
+    from account_participant_rows(to_jsonb(new.participants_v2), to_jsonb(new.participants)) p;
+
+    return new;
+end;
+$$;
+
+drop trigger if exists ftmo_accounts_sync_participants on ftmo_accounts;
+create trigger ftmo_accounts_sync_participants
+after insert or update of participants_v2, participants on ftmo_accounts
+for each row execute function sync_account_participants();
+
+-- Backfill existing trees straight into the index (ftmo_accounts itself is not touched)
+delete from account_participants;
+insert into account_participants (account_id, user_id, display_name)
+select a.id, p.user_id, p.display_name
+from ftmo_accounts a,
+     account_participant_rows(to_jsonb(a.participants_v2), to_jsonb(a.participants)) p;
+
+-- The caller's accounts: matched by user id (v2) or by name (v2 display name / legacy)
+create or replace function my_profile_accounts(p_user_id text, p_full_name text)
+returns setof ftmo_accounts
+language sql
+stable
+security definer
+set search_path = public
+as $$
+    select a.*
+    from ftmo_accounts a
+    where a.id in (
+        select ap.account_id
+        from account_participants ap
+        where ap.user_id = p_user_id or ap.display_name = p_full_name
+    )
+    order by a.created_date desc;
+$$;
+
+grant execute on function my_profile_accounts(text, text) to anon, authenticated;
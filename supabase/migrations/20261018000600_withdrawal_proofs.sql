@@ -0,0 +1,45 @@
+-- ====================== WITHDRAWALS • PROOF → WITHDRAWAL LINK ======================
+-- The Withdrawals page loaded the whole client_files table as "proofs" and, for
+-- every withdrawal card, filtered it by client, category and a substring match on
+-- notes. Proofs now point at their withdrawal (client_files.withdrawal_id) and
+-- the page fetches the proofs of the visible withdrawals in ONE .in_() query.
+
+do $$
+declare
+    v_type text;
+begin
+    if not exists (
+        select 1 from information_schema.columns
+        where table_schema = 'public' and table_name = 'client_files' and column_name = 'withdrawal_id'
+    ) then
+        -- Same type as withdrawals.id, whatever it is
+        select format_type(a.atttypid, a.atttypmod) into v_type
+        from pg_attribute a
+        where a.attrelid = 'public.withdrawals'::regclass and a.attname = 'id';
+
+        execute format(
+            'alter table public.client_files add column withdrawal_id %s references public.withdrawals (id) on delete set null',
+            v_type
+        );
+    end if;
+end;
+$$;
+
+create index if not exists client_files_withdrawal_idx on client_files (withdrawal_id) where withdrawal_id is not null;
+
+-- Backfill (best effort): a legacy proof belongs to the same client's withdrawal
+-- requested on its upload day, preferring the one whose amount matches the
+-- "Proof for $1,000 withdrawal" note, then the latest.
+update client_files f
+set withdrawal_id = (
+    select w.id
+    from withdrawals w
+    where w.client_name = f.assigned_client
+      and w.date_requested::date = f.upload_date::date
+    order by (round(w.amount) = nullif(replace(substring(f.notes from '\$([0-9,]+)'), ',', ''), '')::numeric) desc nulls last,
+             w.id desc
+    limit 1
+)
+where f.withdrawal_id is null
+  and f.category in ('Withdrawal Proof', 'Payout Proof')
+  and f.notes ilike '%withdrawal%';
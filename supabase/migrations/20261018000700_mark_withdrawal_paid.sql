@@ -0,0 +1,45 @@
+-- ====================== WITHDRAWALS • ATOMIC "MARK AS PAID" RPC ======================
+-- "Mark as Paid → Auto-Deduct" used to compute the new balance in Python from a
+-- cached users snapshot and write it back as an absolute value, so a profit
+-- credited after the snapshot was overwritten (the lost update that
+-- record_profit_distribution fixed for credits). The deduction now happens in
+-- place (balance = greatest(balance - amount, 0)) in the same transaction that
+-- marks the withdrawal Paid.
+--
+-- Returns {"user": <public users columns after the deduction> | null}; the app
+-- applies that row to its shared user directory.
+create or replace function mark_withdrawal_paid(p_withdrawal_id withdrawals.id%type)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_withdrawal withdrawals%rowtype;
+    v_user jsonb;
+begin
+    select * into v_withdrawal
+    from withdrawals
+    where id = p_withdrawal_id
+    for update;
+
+    if not found then
+        raise exception 'withdrawal % not found', p_withdrawal_id;
+    end if;
+    if v_withdrawal.status <> 'Approved' then
+        raise exception 'withdrawal % is %, not Approved', p_withdrawal_id, v_withdrawal.status;
+    end if;
+
+    update users u
+    set balance = greatest(coalesce(u.balance, 0) - v_withdrawal.amount, 0)
+    where u.full_name = v_withdrawal.client_name
+    returning jsonb_build_object(
+        'id', u.id, 'full_name', u.full_name, 'role', u.role,
+        'title', u.title, 'balance', u.balance, 'email', u.email
+    ) into v_user;
+
+    update withdrawals set status = 'Paid' where id = p_withdrawal_id;
+
+    return jsonb_build_object('user', v_user);
+end;
+$$;
+
+grant execute on function mark_withdrawal_paid(withdrawals.id%type) to anon, authenticated;
@@ -0,0 +1,34 @@
+-- ====================== WITHDRAWALS • ATOMIC REQUEST + PROOF RPC ======================
+-- The request forms (Withdrawals, My Profile) inserted the withdrawal and then
+-- its proof (client_files.withdrawal_id) as two PostgREST calls, so a failed
+-- proof insert left a Pending withdrawal without proof behind. Both rows are now
+-- written in one transaction.
+--
+-- p_withdrawal → withdrawals columns (client_name, amount, method, details, date_requested)
+-- p_proof      → client_files columns (original_name, file_url, storage_path,
+--                upload_date, sent_by, category, assigned_client, notes)
+-- Values are converted to the column types by jsonb_populate_record; status is
+-- always Pending. Returns {"id": <new withdrawal id>}.
+create or replace function request_withdrawal(p_withdrawal jsonb, p_proof jsonb)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_id withdrawals.id%type;
+begin
+    insert into withdrawals (client_name, amount, method, details, status, date_requested)
+    select w.client_name, w.amount, w.method, w.details, 'Pending', w.date_requested
+    from jsonb_populate_record(null::withdrawals, p_withdrawal) w
+    returning id into v_id;
+
+    insert into client_files (original_name, file_url, storage_path, upload_date, sent_by,
+                              category, assigned_client, notes, withdrawal_id)
+    select f.original_name, f.file_url, f.storage_path, f.upload_date, f.sent_by,
+           f.category, f.assigned_client, f.notes, v_id
+    from jsonb_populate_record(null::client_files, p_proof) f;
+
+    return jsonb_build_object('id', v_id);
+end;
+$$;
+
+grant execute on function request_withdrawal(jsonb, jsonb) to anon, authenticated;
@@ -0,0 +1,180 @@
+import socket
+import sqlite3
+import time
+from contextlib import closing
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from utils.email_outbox import EmailOutbox
+
+REFUSED = "nobody@example.com"
+
+
+class RecordingHandler:
+    """Local SMTP stand-in: records every delivered message and the session it came on"""
+
+    def __init__(self):
+        self.messages = []   # (session id, rcpt)
+        self.sessions = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address == REFUSED:
+            return "550 5.1.1 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        for rcpt in envelope.rcpt_tos:
+            self.messages.append((id(session), rcpt))
+        return "250 Message accepted"
+
+
+def _free_port():
+    with closing(socket.socket()) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield handler, controller.port
+    controller.stop()
+
+
+@pytest.fixture
+def make_outbox(tmp_path):
+    """EmailOutbox factory on the test's spool • every worker is stopped at teardown"""
+    outboxes = []
+
+    def make(port, **kwargs):
+        options = dict(host="127.0.0.1", port=port, starttls=False, poll_interval=0.05)
+        options.update(kwargs)
+        outbox = EmailOutbox(str(tmp_path / "outbox.sqlite3"), "kmfx@example.com", "", **options)
+        outboxes.append(outbox)
+        return outbox
+
+    yield make
+    for outbox in outboxes:
+        outbox.close()
+
+
+def _rows(tmp_path):
+    with closing(sqlite3.connect(tmp_path / "outbox.sqlite3")) as db:
+        db.row_factory = sqlite3.Row
+        return {r["to_addr"]: dict(r) for r in db.execute("select * from outbox")}
+
+
+def _wait(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_batch_is_sent_over_one_pooled_connection(make_outbox, smtp_server):
+    handler, port = smtp_server
+    recipients = [f"member{i}@example.com" for i in range(20)]
+    outbox = make_outbox(port)
+
+    assert outbox.enqueue(recipients + [recipients[0], None], "Profit", "<b>hi</b>") == 20
+    assert _wait(lambda: outbox.status_counts() == {"sent": 20})
+
+    assert sorted(rcpt for _, rcpt in handler.messages) == sorted(recipients)
+    assert len(handler.sessions) == 1
+
+
+def test_refused_recipient_is_backed_off_and_others_still_sent(tmp_path, make_outbox, smtp_server):
+    handler, port = smtp_server
+    outbox = make_outbox(port, base_backoff=300)
+
+    before = time.time()
+    outbox.enqueue(["ok@example.com", REFUSED, "ok2@example.com"], "Profit", "<b>hi</b>")
+    assert _wait(lambda: outbox.status_counts() == {"sent": 2, "queued": 1})
+
+    refused = _rows(tmp_path)[REFUSED]
+    assert refused["attempts"] == 1
+    assert refused["next_attempt_at"] >= before + 300
+    assert "No such user" in refused["last_error"]
+    # The refusal had an SMTP reply → the pooled connection was kept for the rest
+    assert len(handler.sessions) == 1
+
+
+def test_message_is_marked_failed_after_max_attempts(tmp_path, make_outbox, smtp_server):
+    _, port = smtp_server
+    outbox = make_outbox(port, max_attempts=3, base_backoff=0.01, max_backoff=0.05)
+
+    outbox.enqueue([REFUSED], "Profit", "<b>hi</b>")
+    assert _wait(lambda: outbox.status_counts() == {"failed": 1})
+    assert _rows(tmp_path)[REFUSED]["attempts"] == 3
+
+    # retry_failed() gives it a fresh set of attempts
+    assert outbox.retry_failed() == 1
+    assert _wait(lambda: _rows(tmp_path)[REFUSED]["attempts"] >= 1 and outbox.status_counts() == {"failed": 1})
+
+
+def test_spool_is_replayed_after_a_restart(tmp_path, make_outbox, smtp_server):
+    handler, port = smtp_server
+    # First process: SMTP unreachable → everything stays in the on-disk spool
+    dead = make_outbox(_free_port(), base_backoff=3600)
+    dead.enqueue(["a@example.com", "b@example.com"], "Profit", "<b>hi</b>")
+    assert _wait(lambda: dead.status_counts() == {"queued": 2} and
+                 all(r["last_error"] for r in _rows(tmp_path).values()))
+    dead.close()
+
+    # Simulate a crash mid-send + make the backed-off rows due again
+    with closing(sqlite3.connect(tmp_path / "outbox.sqlite3")) as db, db:
+        db.execute("update outbox set status = 'sending' where to_addr = 'a@example.com'")
+        db.execute("update outbox set next_attempt_at = 0")
+
+    # Second process on the same spool: 'sending' rows are re-queued and everything is delivered
+    outbox = make_outbox(port)
+    assert _wait(lambda: outbox.status_counts() == {"sent": 2})
+    assert sorted(rcpt for _, rcpt in handler.messages) == ["a@example.com", "b@example.com"]
+
+
+def test_smtp_outage_backs_off_the_worker_without_using_attempts(tmp_path, make_outbox, smtp_server):
+    handler, port = smtp_server
+    recipients = [f"member{i}@example.com" for i in range(5)]
+    outbox = make_outbox(_free_port(), max_attempts=1, base_backoff=0.05, max_backoff=0.1)
+
+    outbox.enqueue(recipients, "Profit", "<b>hi</b>")
+    # Several connect failures: every row is requeued untouched, none is charged an attempt
+    assert _wait(lambda: outbox._connect_failures >= 3 and outbox.status_counts() == {"queued": 5})
+    assert all(r["attempts"] == 0 and r["last_error"] for r in _rows(tmp_path).values())
+
+    # Server back → the same messages go out on their first attempt
+    outbox.port = port
+    assert _wait(lambda: outbox.status_counts() == {"sent": 5})
+    assert all(r["attempts"] == 0 for r in _rows(tmp_path).values())
+    assert sorted(rcpt for _, rcpt in handler.messages) == sorted(recipients)
+
+
+def test_sent_rows_older_than_retention_are_pruned(tmp_path, make_outbox, smtp_server):
+    _, port = smtp_server
+    outbox = make_outbox(port, retention=3600)
+    outbox.enqueue(["old@example.com", "new@example.com"], "Profit", "<b>hi</b>")
+    assert _wait(lambda: outbox.status_counts() == {"sent": 2})
+
+    with closing(sqlite3.connect(tmp_path / "outbox.sqlite3")) as db, db:
+        db.execute("update outbox set sent_at = ? where to_addr = 'old@example.com'", (time.time() - 7200,))
+
+    assert outbox.prune_sent() == 1
+    assert list(_rows(tmp_path)) == ["new@example.com"]
+
+
+def test_close_stops_the_worker(make_outbox, smtp_server):
+    _, port = smtp_server
+    outbox = make_outbox(port)
+    outbox.enqueue(["a@example.com"], "Profit", "<b>hi</b>")
+    assert _wait(lambda: outbox.status_counts() == {"sent": 1})
+
+    outbox.close()
+    assert not outbox._thread.is_alive()
+    assert outbox._smtp is None
@@ -0,0 +1,155 @@
+import json
+import os
+import queue
+import re
+import sys
+import time
+import types
+
+import pytest
+
+from utils.gold_price import GoldPricePoller, yfinance_quote
+
+FAST_INFO = os.path.join(os.path.dirname(__file__), "fixtures", "gold_fast_info.json")
+
+
+class ScriptedQuotes:
+    """fetch_quote stand-in: each call returns (or raises) the next scripted result"""
+
+    def __init__(self):
+        self.results = queue.Queue()
+        self.calls = 0
+
+    def push(self, result):
+        self.results.put(result)
+
+    def __call__(self):
+        result = self.results.get(timeout=5)
+        self.calls += 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class RecordedFastInfo:
+    """FastInfo stand-in: serves a recorded camelCase payload through FastInfo's snake_case attributes"""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def __getattr__(self, name):
+        camel = re.sub(r"_([a-z])", lambda m: m.group(1).upper(), name)
+        if camel not in self._payload:
+            raise AttributeError(name)
+        return self._payload[camel]
+
+
+@pytest.fixture
+def recorded_yfinance(monkeypatch):
+    """Replaces the yfinance module with one whose Ticker serves the recorded fast_info payloads"""
+    with open(FAST_INFO) as f:
+        payloads = json.load(f)
+    feed = {"payload": None, "symbols": []}
+
+    def ticker(symbol):
+        feed["symbols"].append(symbol)
+        return types.SimpleNamespace(fast_info=RecordedFastInfo(payloads[feed["payload"]]))
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=ticker))
+    return feed
+
+
+def _wait(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def quotes():
+    fetch = ScriptedQuotes()
+    poller = GoldPricePoller(fetch, interval=0.01)
+    yield fetch, poller
+    poller.stop()
+    fetch.push((0.0, 0.0))  # unblock the last fetch so the thread can exit
+
+
+def test_no_quote_until_first_success(quotes):
+    fetch, poller = quotes
+    assert poller.latest() is None
+
+    fetch.push(RuntimeError("rate limited"))
+    assert _wait(lambda: fetch.calls == 1 and poller.last_error)
+    assert poller.latest() is None
+
+
+def test_error_keeps_last_good_price_marked_stale_then_recovers(quotes):
+    fetch, poller = quotes
+
+    fetch.push((2400.5, 0.8))
+    assert _wait(lambda: poller.latest() is not None)
+    good = poller.latest()
+    assert (good.price, good.change_pct, good.stale) == (2400.5, 0.8, False)
+
+    fetch.push(RuntimeError("upstream down"))
+    assert _wait(lambda: poller.latest().stale)
+    stale = poller.latest()
+    assert (stale.price, stale.change_pct, stale.fetched_at) == (good.price, good.change_pct, good.fetched_at)
+    assert poller.last_error == "upstream down"
+
+    fetch.push((2410.0, 1.2))
+    assert _wait(lambda: not poller.latest().stale)
+    recovered = poller.latest()
+    assert (recovered.price, recovered.change_pct) == (2410.0, 1.2)
+    assert recovered.fetched_at >= good.fetched_at
+    assert poller.last_error is None
+
+
+def test_quote_older_than_stale_after_is_stale(quotes):
+    fetch, poller = quotes
+    poller.stale_after = 0.05
+
+    fetch.push((2400.0, 0.0))
+    assert _wait(lambda: poller.latest() is not None)
+    # No further fetch succeeds (the poller is blocked waiting for the next result)
+    assert _wait(lambda: poller.latest().stale)
+    assert poller.latest().price == 2400.0
+
+
+def test_fast_info_quote_against_previous_close(recorded_yfinance):
+    recorded_yfinance["payload"] = "regular_session"
+    price, change_pct = yfinance_quote()
+    assert recorded_yfinance["symbols"] == ["GC=F"]
+    assert price == pytest.approx(2412.300048828125)
+    assert change_pct == pytest.approx((2412.300048828125 / 2393.199951171875 - 1) * 100)
+
+
+def test_fast_info_falls_back_to_regular_market_previous_close(recorded_yfinance):
+    recorded_yfinance["payload"] = "no_previous_close"
+    price, change_pct = yfinance_quote()
+    assert price == 2401.5
+    assert change_pct == pytest.approx((2401.5 / 2380.0 - 1) * 100)
+
+
+def test_fast_info_without_any_close_reports_no_change(recorded_yfinance):
+    recorded_yfinance["payload"] = "no_close_history"
+    assert yfinance_quote() == (2401.5, 0.0)
+
+
+def test_fast_info_without_last_price_keeps_the_last_good_quote(recorded_yfinance):
+    recorded_yfinance["payload"] = "regular_session"
+    poller = GoldPricePoller(interval=0.01)
+    try:
+        assert _wait(lambda: poller.latest() is not None)
+        good = poller.latest()
+        assert good.price == pytest.approx(2412.300048828125) and not good.stale
+
+        recorded_yfinance["payload"] = "no_last_price"
+        assert _wait(lambda: poller.latest().stale)
+        assert poller.latest().price == good.price
+        assert poller.last_error
+    finally:
+        poller.stop()
@@ -0,0 +1,234 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from websockets.asyncio.server import serve
+
+from utils.cache_tags import table_versions
+from utils.live_tables import LiveTables, _default_realtime
+
+
+class RealtimeStandIn:
+    """
+    Local Phoenix/Supabase Realtime stand-in on its own thread:
+    - acknowledges channel joins (echoing the postgres_changes bindings with ids)
+      unless `reject_joins` is set,
+    - push() broadcasts one postgres change to every joined socket,
+    - drop() closes every connection (the server keeps listening).
+    """
+
+    def __init__(self):
+        self.connections = []       # monotonic time of every accepted connection
+        self.reject_joins = False
+        self._sockets = {}          # websocket → (topic, binding ids by table)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._server = self._call(self._serve())
+        self.url = "ws://127.0.0.1:%d" % self._server.sockets[0].getsockname()[1]
+
+    async def _serve(self):
+        return await serve(self._handler, "127.0.0.1", 0)
+
+    def _call(self, coro, timeout=5):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    async def _handler(self, ws):
+        self.connections.append(time.monotonic())
+        try:
+            async for raw in ws:
+                msg = json.loads(raw)
+                if msg["event"] == "phx_join":
+                    bindings = msg["payload"]["config"]["postgres_changes"]
+                    if self.reject_joins:
+                        reply = {"status": "error", "response": {"reason": "unavailable"}}
+                    else:
+                        changes = [dict(b, id=i + 1) for i, b in enumerate(bindings)]
+                        self._sockets[ws] = (msg["topic"], {b["table"]: b["id"] for b in changes})
+                        reply = {"status": "ok", "response": {"postgres_changes": changes}}
+                elif msg["event"] == "heartbeat":
+                    reply = {"status": "ok", "response": {}}
+                else:
+                    continue
+                await ws.send(json.dumps({"event": "phx_reply", "topic": msg["topic"],
+                                          "payload": reply, "ref": msg.get("ref")}))
+        finally:
+            self._sockets.pop(ws, None)
+
+    def push(self, table, type_, record=None, old_record=None):
+        async def _push():
+            for ws, (topic, ids) in list(self._sockets.items()):
+                data = {"schema": "public", "table": table, "commit_timestamp": "2026-10-18T00:00:00Z",
+                        "type": type_, "errors": None, "columns": [],
+                        "record": record or {}, "old_record": old_record or {}}
+                await ws.send(json.dumps({"event": "postgres_changes", "topic": topic,
+                                          "payload": {"data": data, "ids": [ids[table]]}, "ref": None}))
+        self._call(_push())
+
+    def drop(self):
+        async def _drop():
+            for ws in list(self._sockets):
+                await ws.close(1011, "server restart")
+        self._call(_drop())
+
+    @property
+    def joined(self):
+        return len(self._sockets)
+
+    def close(self):
+        self._server.close()
+        self._call(self._server.wait_closed())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class FakeSupabase:
+    """client.table(t).select("*").execute().data • `gate` (if set) holds every select until released"""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.selects = 0
+        self.gate = None
+        self.selecting = threading.Event()
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+class _Query:
+    def __init__(self, db, name):
+        self.db, self.name = db, name
+
+    def select(self, *_):
+        return self
+
+    def execute(self):
+        self.db.selects += 1
+        self.db.selecting.set()
+        if self.db.gate is not None:
+            assert self.db.gate.wait(5)
+        return type("Resp", (), {"data": [dict(r) for r in self.db.tables[self.name]]})()
+
+
+def _wait(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _by_id(rows):
+    return {r["id"]: r for r in rows}
+
+
+@pytest.fixture
+def server():
+    s = RealtimeStandIn()
+    yield s
+    s.close()
+
+
+@pytest.fixture
+def db():
+    return FakeSupabase({
+        "messages": [{"id": 1, "text": "hello"}, {"id": 2, "text": "world"}],
+        "likes": [],
+    })
+
+
+@pytest.fixture
+def live(server, db):
+    tables = LiveTables(db, server.url, "anon-key", ["messages", "likes"])
+    yield tables
+    tables.stop()
+
+
+def test_seed_then_apply_deltas(server, db, live):
+    assert _wait(lambda: live.live and server.joined)
+    assert _by_id(live.rows("messages")) == {1: {"id": 1, "text": "hello"}, 2: {"id": 2, "text": "world"}}
+    assert db.selects == 1
+    assert live.rows("unknown_table") is None
+
+    version = table_versions(["messages"])
+    server.push("messages", "INSERT", record={"id": 3, "text": "new"})
+    server.push("messages", "UPDATE", record={"id": 1, "text": "edited"})
+    server.push("messages", "DELETE", old_record={"id": 2})
+    assert _wait(lambda: live.events_applied == 3)
+
+    assert _by_id(live.rows("messages")) == {1: {"id": 1, "text": "edited"}, 3: {"id": 3, "text": "new"}}
+    assert db.selects == 1  # served from the mirror
+    assert table_versions(["messages"]) > version
+
+
+def test_events_during_seed_are_buffered_and_replayed(server, db, live):
+    assert _wait(lambda: live.live and server.joined)
+    db.gate = threading.Event()
+
+    result = {}
+    reader = threading.Thread(target=lambda: result.update(rows=live.rows("messages")))
+    reader.start()
+    assert db.selecting.wait(5)
+
+    # The select has already read its snapshot; these land while it is in flight
+    server.push("messages", "INSERT", record={"id": 3, "text": "during seed"})
+    server.push("messages", "DELETE", old_record={"id": 1})
+    assert _wait(lambda: live.events_applied == 2)
+    db.gate.set()
+    reader.join(5)
+
+    expected = {2: {"id": 2, "text": "world"}, 3: {"id": 3, "text": "during seed"}}
+    assert _by_id(result["rows"]) == expected
+    assert _by_id(live.rows("messages")) == expected
+
+
+def test_reconnects_with_backoff_and_reseeds(server, db, live):
+    assert _wait(lambda: live.live and server.joined)
+    live.rows("messages")
+    assert db.selects == 1
+
+    # Server restart + joins refused for a while → retries back off 1s, 2s, 4s
+    server.reject_joins = True
+    attempts = len(server.connections)
+    server.drop()
+    assert _wait(lambda: not live.live)
+    assert live.rows("messages") is None  # callers fall back to the database
+    assert _wait(lambda: len(server.connections) >= attempts + 3, timeout=15)
+    first, second, third = server.connections[attempts:attempts + 3]
+    assert second - first >= 1.9
+    assert third - second >= 3.9
+    assert not live.live
+
+    # Joins accepted again → live again, and the mirror is re-seeded with one fresh select
+    db.tables["messages"].append({"id": 4, "text": "while offline"})
+    server.reject_joins = False
+    assert _wait(lambda: live.live and server.joined, timeout=15)
+    assert 4 in _by_id(live.rows("messages"))
+    assert db.selects == 2
+
+
+class PublicOnlySocket:
+    """Realtime client seen through its public API only (as if a release renamed _listen_task)"""
+
+    def __init__(self, url, key):
+        self._socket = _default_realtime(url, key)
+
+    def __getattr__(self, name):
+        if name == "_listen_task":
+            raise AttributeError(name)
+        return getattr(self._socket, name)
+
+
+def test_missing_reader_task_attribute_is_not_treated_as_disconnected(server, db):
+    live = LiveTables(db, server.url, "anon-key", ["messages"], realtime_factory=PublicOnlySocket)
+    try:
+        assert _wait(lambda: live.live and server.joined)
+        attempts = len(server.connections)
+        time.sleep(2.5)  # several liveness checks
+        assert live.live
+        assert len(server.connections) == attempts
+        assert live.last_error is None
+    finally:
+        live.stop()
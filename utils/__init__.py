@@ -0,0 +1 @@
+# KMFX shared helpers (storage, caching, background workers)
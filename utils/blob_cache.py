@@ -0,0 +1,172 @@
+# ====================== SHARED STORAGE BLOB CACHE ======================
+# One process-wide cache for Supabase Storage objects, shared by every session.
+# Objects are uploaded under a UUID-prefixed storage_path (see upload_to_supabase)
+# and never change, so entries never expire — they are only evicted for space.
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+
+class _Flight:
+    """One in-progress fetch that concurrent callers for the same object wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.data = None
+        self.error = None
+
+
+class BlobCache:
+    """
+    LRU of immutable blobs keyed by (bucket, storage_path), bounded by total bytes.
+
+    - Memory tier evicts least-recently-used objects once max_bytes is exceeded.
+    - If spill_dir is set (a directory owned by the cache alone), evicted objects
+      are written to spill_dir/<bucket>/ and read back (and promoted to memory)
+      on the next hit instead of re-downloading.
+      The spill files are capped at max_spill_bytes in total; the least recently
+      used ones (oldest mtime, refreshed on every disk hit) are deleted first.
+    - Concurrent misses for the same object share ONE fetch (single-flight), so
+      10 sessions opening the same proof trigger a single Storage download.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, spill_dir: str = None,
+                 max_spill_bytes: int = 2 * 1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_spill_bytes = max_spill_bytes
+        self._spill_size = None  # bytes on disk • scanned on first spill (files survive restarts)
+        self._spill_lock = threading.Lock()
+        self._items = OrderedDict()
+        self._size = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    # ---------- public ----------
+    def get(self, bucket: str, storage_path: str, fetch) -> bytes:
+        """Return the object bytes, calling fetch() at most once per object across all sessions"""
+        key = (bucket, storage_path)
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+                return data
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.data
+
+        try:
+            data = self._read_spill(key)
+            if data is None:
+                data = fetch()
+            flight.data = data
+            self._store(key, data)
+            return data
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"objects": len(self._items), "bytes": self._size, "max_bytes": self.max_bytes}
+
+    # ---------- internals ----------
+    def _store(self, key, data: bytes):
+        if len(data) > self.max_bytes:
+            self._write_spill(key, data)  # too big for memory, still worth keeping on disk
+            return
+        evicted = []
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._items[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                old_key, old_data = self._items.popitem(last=False)
+                self._size -= len(old_data)
+                evicted.append((old_key, old_data))
+        for old_key, old_data in evicted:  # disk I/O outside the lock
+            self._write_spill(old_key, old_data)
+
+    def _spill_path(self, key):
+        bucket, storage_path = key
+        digest = hashlib.sha256(storage_path.encode("utf-8")).hexdigest()
+        return os.path.join(self.spill_dir, bucket, digest)
+
+    def _read_spill(self, key):
+        if not self.spill_dir:
+            return None
+        path = self._spill_path(key)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+            os.utime(path)  # recently used → evicted last
+            return data
+        except OSError:
+            return None
+
+    def _write_spill(self, key, data: bytes):
+        if not self.spill_dir or len(data) > self.max_spill_bytes:
+            return
+        path = self._spill_path(key)
+        if os.path.exists(path):
+            return  # immutable — already spilled once
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            return  # disk tier is best-effort
+        with self._spill_lock:
+            if self._spill_size is None:
+                self._spill_size = sum(size for _, size, _ in self._spill_files())
+            else:
+                self._spill_size += len(data)
+            if self._spill_size > self.max_spill_bytes:
+                self._evict_spill()
+
+    def _spill_files(self) -> list:
+        """(mtime, size, path) of every spilled object • other files in spill_dir are never touched"""
+        files = []
+        for bucket in os.listdir(self.spill_dir):
+            folder = os.path.join(self.spill_dir, bucket)
+            if not os.path.isdir(folder):
+                continue
+            for name in os.listdir(folder):
+                if len(name) != 64 or not all(c in "0123456789abcdef" for c in name):
+                    continue  # not a sha256 spill file
+                try:
+                    info = os.stat(os.path.join(folder, name))
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, os.path.join(folder, name)))
+        return files
+
+    def _evict_spill(self):
+        """Delete the oldest spill files until the total fits max_spill_bytes (caller holds _spill_lock)"""
+        files = sorted(self._spill_files())
+        total = sum(size for _, size, _ in files)  # re-measured: other processes may share the directory
+        for _, size, path in files:
+            if total <= self.max_spill_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._spill_size = total
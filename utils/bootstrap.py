@@ -0,0 +1,108 @@
+# ====================== ONE-TIME STARTUP (PER PROCESS) ======================
+# Local folders, the default owner account and the Streamlit Cloud keep-alive
+# thread used to run on EVERY rerun of EVERY session (incl. a users count query).
+# They now sit behind a process-level once-latch: each step runs until it
+# succeeds once, failed steps are retried at most every RETRY_AFTER seconds,
+# and steady-state reruns return without a lock, a query or a filesystem call.
+import os
+import threading
+import time
+
+LOCAL_FOLDERS = [
+    "uploaded_files",
+    "uploaded_files/client_files",
+    "uploaded_files/announcements",
+    "uploaded_files/testimonials",
+    "uploaded_files/ea_versions"
+]
+KEEP_ALIVE_URL = "https://kmfxeaftmo.streamlit.app"
+DEFAULT_OWNER_NOTICE = "Default owner created. CHANGE PASSWORD ASAP!"
+RETRY_AFTER = 60
+
+_lock = threading.Lock()
+_keep_alive_lock = threading.Lock()
+_status = {}  # step → {"ok": bool, "detail": str, "at": unix time}
+_complete = False
+_keep_alive_thread = None
+
+
+def ensure_local_folders() -> str:
+    for folder in LOCAL_FOLDERS:
+        os.makedirs(folder, exist_ok=True)
+    return f"{len(LOCAL_FOLDERS)} folders ready"
+
+
+def create_default_users() -> str:
+    import bcrypt
+
+    from utils.supabase_client import supabase
+
+    response = supabase.table("users").select("id", count="exact").limit(1).execute()
+    if response.count:
+        return f"{response.count} users present"
+    hashed_owner = bcrypt.hashpw("ChangeMeNow123!".encode(), bcrypt.gensalt()).decode()
+    supabase.table("users").insert([
+        {"username": "kingminted", "password": hashed_owner, "full_name": "King Minted", "role": "owner"}
+    ]).execute()
+    return DEFAULT_OWNER_NOTICE
+
+
+def _keep_alive():
+    import requests
+
+    while True:
+        try:
+            requests.get(KEEP_ALIVE_URL, timeout=10)
+        except Exception:
+            pass
+        time.sleep(1500)
+
+
+def start_keep_alive_if_needed() -> str:
+    """Keep-alive pinger for Streamlit Cloud • at most one thread per process"""
+    global _keep_alive_thread
+    if not (os.getenv("STREAMLIT_SHARING") or os.getenv("STREAMLIT_CLOUD")):
+        return "not on Streamlit Cloud"
+    with _keep_alive_lock:
+        if _keep_alive_thread is None:
+            _keep_alive_thread = threading.Thread(target=_keep_alive, name="keep-alive", daemon=True)
+            _keep_alive_thread.start()
+    return "keep-alive thread running"
+
+
+STEPS = (
+    ("local_folders", ensure_local_folders),
+    ("default_users", create_default_users),
+    ("keep_alive", start_keep_alive_if_needed),
+)
+
+
+def run_bootstrap() -> list:
+    """
+    Run every startup step that has not succeeded yet in this process.
+    Returns [(step, ok, detail)] for the steps that ran NOW — empty on every
+    steady-state rerun, so callers only surface messages once.
+    """
+    global _complete
+    if _complete:
+        return []
+    ran = []
+    with _lock:
+        for name, step in STEPS:
+            previous = _status.get(name)
+            if previous and (previous["ok"] or time.time() - previous["at"] < RETRY_AFTER):
+                continue
+            try:
+                ok, detail = True, step()
+            except Exception as e:
+                ok, detail = False, str(e)
+            _status[name] = {"ok": ok, "detail": detail, "at": time.time()}
+            ran.append((name, ok, detail))
+        _complete = all(s["ok"] for s in _status.values()) and len(_status) == len(STEPS)
+    return ran
+
+
+def bootstrap_status() -> dict:
+    """Health of every startup step: {step: {"ok", "detail", "at"}} (missing = not run yet)"""
+    with _lock:
+        return {name: dict(s) for name, s in _status.items()}
@@ -0,0 +1,52 @@
+# ====================== TAG-BASED CACHE INVALIDATION ======================
+# Every cached fetcher declares the tables it reads; every write bumps only the
+# tables it touches. Replaces the global st.cache_data.clear() that used to flush
+# every page's cache for every user on any single like / message / approval.
+import functools
+import threading
+
+import streamlit as st
+
+_table_versions = {}
+_lock = threading.Lock()
+
+
+def table_versions(tables) -> tuple:
+    """Current version of each table (process-wide, shared by all sessions)"""
+    with _lock:
+        return tuple(_table_versions.get(t, 0) for t in tables)
+
+
+def invalidate_tables(*tables):
+    """Call after a write • only fetchers that read one of these tables refetch"""
+    with _lock:
+        for t in tables:
+            _table_versions[t] = _table_versions.get(t, 0) + 1
+
+
+def cached_query(*tables, ttl=None, max_entries=None):
+    """
+    Drop-in replacement for @st.cache_data(ttl=...) that is ALSO invalidated by
+    invalidate_tables() on any of `tables`.
+
+    The current table versions are passed as an extra hashed argument, so a bump
+    simply makes the next call miss • stale entries age out via ttl/max_entries.
+    """
+    def decorator(func):
+        def _cached(versions, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        # st.cache_data keys on module + qualname + source • make each wrapper unique
+        _cached.__module__ = func.__module__
+        _cached.__qualname__ = f"{func.__qualname__}[{','.join(tables)}]"
+        cached = st.cache_data(ttl=ttl, max_entries=max_entries)(_cached)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(table_versions(tables), *args, **kwargs)
+
+        wrapper.tables = tables
+        wrapper.clear = cached.clear  # manual "Refresh Now" → this fetcher only
+        return wrapper
+
+    return decorator
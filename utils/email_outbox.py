@@ -0,0 +1,242 @@
+# ====================== EMAIL OUTBOX ======================
+# Rendered emails are written to a local SQLite spool and sent by ONE background
+# worker per process, so recording a profit no longer waits on Gmail for every
+# recipient. The worker keeps its SMTP connection open between batches, retries
+# failures with exponential backoff and survives restarts (the spool is on disk).
+import os
+import smtplib
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+_SCHEMA = """
+create table if not exists outbox (
+    id integer primary key autoincrement,
+    created_at real not null,
+    to_addr text not null,
+    subject text not null,
+    html text not null,
+    status text not null default 'queued',   -- queued | sending | sent | failed
+    attempts integer not null default 0,
+    next_attempt_at real not null,
+    last_error text,
+    sent_at real
+);
+create index if not exists outbox_due_idx on outbox (status, next_attempt_at);
+"""
+
+
+class EmailOutbox:
+    """
+    SQLite-backed outbox + background sender.
+
+    - enqueue() only writes rows and wakes the worker • returns immediately.
+    - The worker sends up to `batch_size` due messages per pass over ONE SMTP
+      connection, reused across passes and closed after `idle_timeout` seconds idle.
+    - A failed message is retried after base_backoff × 2^(attempts-1) seconds
+      (capped at max_backoff) and marked 'failed' after `max_attempts`.
+    - If the SMTP server cannot be reached (connect / STARTTLS / login error),
+      the rest of the batch goes back to 'queued' without using an attempt and
+      the whole worker backs off on the same schedule until a connection succeeds.
+    - Rows left 'sending' by a crash are re-queued on start.
+    - 'sent' rows older than `retention` seconds are pruned (at most once per
+      `prune_interval`), so the spool only keeps recent history.
+    """
+
+    def __init__(self, db_path: str, sender: str, password: str,
+                 host: str = "smtp.gmail.com", port: int = 587, starttls: bool = True,
+                 batch_size: int = 50, poll_interval: float = 5, idle_timeout: float = 60,
+                 max_attempts: int = 6, base_backoff: float = 30, max_backoff: float = 3600,
+                 retention: float = 7 * 24 * 3600, prune_interval: float = 3600):
+        self.db_path = db_path
+        self.sender = sender
+        self.password = password
+        self.host = host
+        self.port = port
+        self.starttls = starttls
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.retention = retention
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+        self._smtp = None
+        self._last_used = 0.0
+        self._connect_failures = 0
+        self._outage_until = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with closing(self._connect()) as db, db:
+            db.executescript(_SCHEMA)
+            db.execute("update outbox set status = 'queued' where status = 'sending'")
+
+        self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+        self._thread.start()
+
+    # ---------- public ----------
+    def enqueue(self, recipients, subject: str, html: str) -> int:
+        """Queue one rendered email per recipient • returns how many were queued"""
+        now = time.time()
+        rows = [(now, addr, subject, html, now) for addr in dict.fromkeys(r for r in recipients if r)]
+        if rows:
+            with closing(self._connect()) as db, db:
+                db.executemany(
+                    "insert into outbox (created_at, to_addr, subject, html, next_attempt_at) values (?, ?, ?, ?, ?)",
+                    rows
+                )
+            self._wake.set()
+        return len(rows)
+
+    def status_counts(self) -> dict:
+        """{status: count} for the status view"""
+        with closing(self._connect()) as db:
+            return dict(db.execute("select status, count(*) from outbox group by status").fetchall())
+
+    def recent(self, limit: int = 50) -> list:
+        """Newest messages (without the HTML body) for the status view"""
+        with closing(self._connect()) as db:
+            db.row_factory = sqlite3.Row
+            rows = db.execute(
+                "select id, created_at, to_addr, subject, status, attempts, next_attempt_at, last_error, sent_at "
+                "from outbox order by id desc limit ?", (limit,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def retry_failed(self) -> int:
+        """Give every 'failed' message a fresh set of attempts"""
+        with closing(self._connect()) as db, db:
+            count = db.execute(
+                "update outbox set status = 'queued', attempts = 0, next_attempt_at = ? where status = 'failed'",
+                (time.time(),)
+            ).rowcount
+        self._wake.set()
+        return count
+
+    def prune_sent(self) -> int:
+        """Delete 'sent' rows older than the retention window • returns how many"""
+        self._last_prune = time.monotonic()
+        with closing(self._connect()) as db, db:
+            return db.execute(
+                "delete from outbox where status = 'sent' and sent_at < ?", (time.time() - self.retention,)
+            ).rowcount
+
+    def close(self, timeout: float = 5):
+        """Stop the worker and close the pooled SMTP connection (queued rows stay in the spool)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._close_smtp()
+
+    # ---------- worker ----------
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                if time.monotonic() - self._last_prune >= self.prune_interval:
+                    self.prune_sent()
+                sent_any = self._send_due()
+            except Exception:
+                sent_any = False
+            if not sent_any:
+                if self._smtp and time.monotonic() - self._last_used > self.idle_timeout:
+                    self._close_smtp()
+                self._wake.wait(self.poll_interval)
+
+    def _send_due(self) -> bool:
+        if time.monotonic() < self._outage_until:
+            return False
+        now = time.time()
+        with closing(self._connect()) as db, db:
+            batch = db.execute(
+                "select id, to_addr, subject, html, attempts from outbox "
+                "where status = 'queued' and next_attempt_at <= ? order by id limit ?",
+                (now, self.batch_size)
+            ).fetchall()
+            db.executemany("update outbox set status = 'sending' where id = ?", [(row[0],) for row in batch])
+        if not batch:
+            return False
+
+        for i, (msg_id, to_addr, subject, html, attempts) in enumerate(batch):
+            try:
+                server = self._smtp_connection()
+            except Exception as e:
+                # Server unreachable → not this message's fault • requeue the rest, back off the worker
+                self._requeue([row[0] for row in batch[i:]], str(e))
+                self._connect_failures += 1
+                delay = min(self.base_backoff * 2 ** (self._connect_failures - 1), self.max_backoff)
+                self._outage_until = time.monotonic() + delay
+                return False
+            self._connect_failures = 0
+            try:
+                server.sendmail(self.sender, to_addr, self._render(to_addr, subject, html))
+                self._last_used = time.monotonic()
+            except Exception as e:
+                # No SMTP reply → connection is likely dead • reconnect on the next message
+                if not isinstance(e, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)):
+                    self._close_smtp()
+                self._mark_failed(msg_id, attempts + 1, str(e))
+            else:
+                with closing(self._connect()) as db, db:
+                    db.execute("update outbox set status = 'sent', sent_at = ?, last_error = null where id = ?",
+                               (time.time(), msg_id))
+        return True
+
+    def _requeue(self, msg_ids: list, error: str):
+        with closing(self._connect()) as db, db:
+            db.executemany("update outbox set status = 'queued', last_error = ? where id = ?",
+                           [(error[:500], msg_id) for msg_id in msg_ids])
+
+    def _mark_failed(self, msg_id: int, attempts: int, error: str):
+        delay = min(self.base_backoff * 2 ** (attempts - 1), self.max_backoff)
+        status = "failed" if attempts >= self.max_attempts else "queued"
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "update outbox set status = ?, attempts = ?, next_attempt_at = ?, last_error = ? where id = ?",
+                (status, attempts, time.time() + delay, error[:500], msg_id)
+            )
+
+    def _render(self, to_addr: str, subject: str, html: str) -> str:
+        msg = MIMEMultipart()
+        msg["From"] = self.sender
+        msg["To"] = to_addr
+        msg["Subject"] = subject
+        msg.attach(MIMEText(html, "html"))
+        return msg.as_string()
+
+    def _smtp_connection(self):
+        if self._smtp is None:
+            server = smtplib.SMTP(self.host, self.port, timeout=30)
+            try:
+                if self.starttls:
+                    server.starttls()
+                if self.password:
+                    server.login(self.sender, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+
+    def _close_smtp(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
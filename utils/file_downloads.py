@@ -0,0 +1,21 @@
+# ====================== ON-DEMAND FILE DOWNLOADS ======================
+# Files are fetched only when the user clicks Download (deferred st.download_button)
+# and streamed in chunks • caching lives in utils.blob_cache
+import requests
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # 256 KB per chunk
+
+
+def stream_download(url: str, timeout: int = 15, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> bytes:
+    """
+    Stream a file from Storage in chunks instead of one big response body.
+    Raises on HTTP errors so a failed fetch is never cached.
+    """
+    buf = bytearray()
+    with requests.get(url, stream=True, timeout=timeout) as r:
+        r.raise_for_status()
+        for chunk in r.iter_content(chunk_size=chunk_size):
+            if chunk:
+                buf.extend(chunk)
+    return bytes(buf)
+
@@ -0,0 +1,69 @@
+# ====================== GOLD PRICE SERVICE ======================
+# One background poller per process keeps the latest GC=F quote in memory.
+# Page renders only read that value (never block on market data), and when the
+# upstream fails the last good quote keeps being served, marked stale.
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Quote:
+    price: float
+    change_pct: float
+    fetched_at: float  # unix time of the last SUCCESSFUL fetch
+    stale: bool = False
+
+
+def yfinance_quote(symbol: str = "GC=F") -> tuple:
+    """(price, change %) from yfinance fast_info (lightweight, unlike Ticker.info)"""
+    import yfinance as yf
+
+    fast = yf.Ticker(symbol).fast_info
+    price = float(fast.last_price)
+    previous = fast.previous_close or fast.regular_market_previous_close
+    change_pct = (price / previous - 1) * 100 if previous else 0.0
+    return price, change_pct
+
+
+class GoldPricePoller:
+    """
+    - Fetches `fetch_quote()` → (price, change_pct) every `interval` seconds on a daemon thread.
+    - latest() returns the newest Quote, or None until the first fetch succeeds.
+    - A failed fetch keeps the previous Quote (stale=True) and retries next tick;
+      a quote older than `stale_after` seconds is also reported stale.
+    """
+
+    def __init__(self, fetch_quote=yfinance_quote, interval: float = 30, stale_after: float = 300):
+        self.fetch_quote = fetch_quote
+        self.interval = interval
+        self.stale_after = stale_after
+        self.last_error = None
+        self._quote = None
+        self._failing = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gold-price-poller", daemon=True)
+        self._thread.start()
+
+    def latest(self):
+        quote = self._quote
+        if quote is None:
+            return None
+        if self._failing or time.time() - quote.fetched_at > self.stale_after:
+            return Quote(quote.price, quote.change_pct, quote.fetched_at, stale=True)
+        return quote
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                price, change_pct = self.fetch_quote()
+                self._quote = Quote(float(price), float(change_pct), time.time())
+                self._failing = False
+                self.last_error = None
+            except Exception as e:
+                self._failing = True
+                self.last_error = str(e)
+            self._stop.wait(self.interval)
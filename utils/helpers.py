@@ -0,0 +1,234 @@
+# ====================== SHARED APP HELPERS ======================
+# Storage uploads, process-wide singletons (blob cache, signed URLs, audit log
+# writer, email outbox, realtime mirror) and log_action — imported by the app
+# entry and by every page module in app_pages/.
+import datetime
+import functools
+import io
+import os
+import uuid
+
+import streamlit as st
+
+from utils.blob_cache import BlobCache
+from utils.cache_tags import invalidate_tables, table_versions
+from utils.file_downloads import stream_download
+from utils.live_tables import LiveTables
+from utils.log_writer import AuditLogWriter
+from utils.public_stats import PublicStatsRefresher, fetch_public_stats
+from utils.signed_urls import SignedUrlManager
+from utils.supabase_client import supabase, supabase_key, supabase_url
+from utils.thumbnails import GRID_THUMBNAIL, THUMBNAIL_SIZES, encode_thumbnail, is_thumbnailable, thumbnail_path
+from utils.user_directory import UserDirectory
+
+
+def upload_to_supabase(file, bucket: str, folder: str = "", use_signed_url: bool = False, signed_expiry: int = 3600,
+                       thumbnails: bool = False) -> tuple[str, str]:
+    """
+    Upload file to Supabase Storage - FIXED for memoryview + upsert header issues
+    thumbnails=True: images also get WebP thumbnails next to the original (see utils/thumbnails.py)
+    Returns (url, storage_path)
+    """
+    try:
+        # Unique filename to prevent overwrites
+        safe_name = f"{uuid.uuid4()}_{file.name}"
+        file_path = f"{folder}/{safe_name}" if folder else safe_name
+
+        # Convert memoryview → bytes (fixes previous error)
+        content = file.getbuffer()
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+        elif not isinstance(content, bytes):
+            content = bytes(content)
+
+        with st.spinner(f"Uploading {file.name}..."):
+            supabase.storage.from_(bucket).upload(
+                path=file_path,
+                file=content,
+                file_options={
+                    "content-type": file.type or "application/octet-stream",
+                    "upsert": "true"          # ← fixed: string instead of bool
+                }
+            )
+            if thumbnails and is_thumbnailable(file.name, file.type):
+                upload_thumbnails(bucket, file_path, content)
+
+        # Get URL
+        if use_signed_url:
+            signed = supabase.storage.from_(bucket).create_signed_url(file_path, signed_expiry)
+            url = signed["signedURL"]
+        else:
+            url = supabase.storage.from_(bucket).get_public_url(file_path)
+
+        st.success(f"✅ {file.name} uploaded successfully!")
+        return url, file_path
+
+    except Exception as e:
+        st.error(f"Upload failed for {file.name}: {str(e)}")
+        raise
+
+# === IMAGE RESIZE HELPER (for timeline photos, testimonials, etc.) ===
+def make_same_size(image_path, target_width=800, target_height=500):
+    """
+    Center-crops and resizes image to exact same dimensions (no distortion).
+    Adjust target_width/height as needed (e.g., 700, 450 or 600, 400).
+    """
+    from PIL import Image, ImageOps  # Pillow is only loaded by pages that resize images
+
+    img = ImageOps.exif_transpose(Image.open(image_path))  # phone photos: apply EXIF rotation
+    return crop_to_size(img, target_width, target_height)
+
+
+def crop_to_size(img, target_width, target_height):
+    """make_same_size() for an already opened PIL image (decode once, resize to several sizes)"""
+    from PIL import Image
+
+    target_ratio = target_width / target_height
+    img_ratio = img.width / img.height
+    
+    if img_ratio > target_ratio:  # too wide → crop sides
+        new_width = int(img.height * target_ratio)
+        left = (img.width - new_width) // 2
+        img = img.crop((left, 0, left + new_width, img.height))
+    elif img_ratio < target_ratio:  # too tall → crop top/bottom
+        new_height = int(img.width / target_ratio)
+        top = (img.height - new_height) // 2
+        img = img.crop((0, top, img.width, top + new_height))
+    
+    img = img.resize((target_width, target_height), Image.LANCZOS)
+    return img
+
+
+def upload_thumbnails(bucket: str, storage_path: str, content: bytes) -> list:
+    """
+    Store every THUMBNAIL_SIZES variant of an uploaded image next to it • returns the sizes stored.
+    Best effort: an image Pillow cannot read simply has no thumbnails (grids fall back to the original).
+    """
+    from PIL import Image, ImageOps
+
+    try:
+        img = ImageOps.exif_transpose(Image.open(io.BytesIO(content)))  # decoded ONCE for every size
+    except Exception:
+        return []
+    stored = []
+    for size, (width, height) in THUMBNAIL_SIZES.items():
+        try:
+            thumb = encode_thumbnail(crop_to_size(img, width, height))
+            supabase.storage.from_(bucket).upload(
+                path=thumbnail_path(storage_path, size),
+                file=thumb,
+                file_options={"content-type": "image/webp", "upsert": "true"}
+            )
+            stored.append(size)
+        except Exception:
+            break
+    return stored
+
+
+def thumbnail_urls(bucket: str, storage_paths, size: str = GRID_THUMBNAIL) -> dict:
+    """{storage_path: signed thumbnail URL} • originals without thumbnails (older uploads) are absent"""
+    by_thumb = {thumbnail_path(p, size): p for p in storage_paths if p}
+    signed = get_signed_urls().get_many(bucket, list(by_thumb))
+    return {by_thumb[t]: url for t, url in signed.items()}
+
+
+# === SHARED STORAGE BLOB CACHE + ON-CLICK DOWNLOADS ===
+@st.cache_resource
+def get_blob_cache():
+    # Process-wide, shared by ALL sessions • bounded by bytes • evicted blobs spill to uploaded_files/blob_cache/<bucket>/
+    # (own root: the spill cap / eviction never sees the app's upload folders or uploaded_files/spool/)
+    return BlobCache(max_bytes=256 * 1024 * 1024, spill_dir="uploaded_files/blob_cache")
+
+def storage_blob(bucket, storage_path, file_url) -> bytes:
+    """Bytes of a Storage object via the shared cache (objects are immutable → cached forever)"""
+    return get_blob_cache().get(bucket, storage_path or file_url, functools.partial(stream_download, file_url))
+
+def deferred_download(bucket, storage_path, file_url):
+    """
+    Zero-arg callable for st.download_button(data=...).
+    Nothing is fetched on render — the file is pulled only when the user clicks,
+    through the shared blob cache (one fetch per object across all sessions).
+    """
+    return functools.partial(storage_blob, bucket, storage_path, file_url)
+
+@st.cache_resource
+def get_signed_urls():
+    # Process-wide signed-URL cache • same URL reused until half its lifetime → browser image cache hits
+    return SignedUrlManager(supabase, expires_in=3600 * 24 * 30, refresh_fraction=0.5)
+
+# Background audit log writer (one per process • bulk inserts off the request path)
+@st.cache_resource
+def get_log_writer():
+    return AuditLogWriter(
+        insert_rows=lambda rows: supabase.table("logs").insert(rows).execute(),
+        spool_path="uploaded_files/spool/logs.jsonl",
+        on_flush=lambda: invalidate_tables("logs")
+    )
+
+# Background email outbox (one per process • SQLite spool + pooled SMTP connection)
+@st.cache_resource
+def get_email_outbox():
+    sender_email = os.getenv("EMAIL_SENDER")
+    sender_password = os.getenv("EMAIL_PASSWORD")
+    if not (sender_email and sender_password):
+        return None
+    from utils.email_outbox import EmailOutbox  # smtplib only loads where email is sent
+
+    return EmailOutbox("uploaded_files/spool/outbox.sqlite3", sender_email, sender_password)
+
+# Realtime table mirror (one subscription per process • replaces 6–10s TTL polling)
+LIVE_TABLES = ("messages", "notifications", "withdrawals", "client_files", "announcements")
+
+@st.cache_resource
+def get_live_tables():
+    return LiveTables(supabase, supabase_url, supabase_key, LIVE_TABLES)
+
+def live_select(table, order_by, desc=True):
+    """select * ordered by `order_by` • from the realtime mirror when live, else one DB query"""
+    rows = get_live_tables().rows(table)
+    if rows is None:
+        return supabase.table(table).select("*").order(order_by, desc=desc).execute().data or []
+    return sorted(rows, key=lambda r: r.get(order_by) or "", reverse=desc)
+
+def watch_tables(*tables, every=3):
+    """
+    Wake this session when any of `tables` changes (realtime event or another
+    session's write): a tiny fragment compares table versions every `every`
+    seconds and reruns the app only when one moved — no DB query involved.
+    """
+    get_live_tables()  # make sure the process-wide subscription is running
+    seen = table_versions(tables)
+
+    @st.fragment(run_every=every)
+    def _watch():
+        if table_versions(tables) != seen:
+            st.rerun()
+
+    _watch()
+
+# Shared user directory (one per process • columnar + indexed by id / full_name / role)
+@st.cache_resource
+def get_user_directory():
+    return UserDirectory(supabase)
+
+def user_directory():
+    """Current users snapshot (UserIndex) • O(1) lookups, no per-page users query"""
+    return get_user_directory().current()
+
+# Public landing stats (one refresher per process • fixed query rate for any number of visitors)
+@st.cache_resource
+def get_public_stats():
+    return PublicStatsRefresher(functools.partial(fetch_public_stats, supabase), interval=60)
+
+# Log action
+def log_action(action, details="", user_name=None):
+    # Session state is read HERE (caller's thread) • the writer thread only sees the finished row
+    user_name = user_name or st.session_state.get("full_name", "Unknown")
+    user_type = st.session_state.get("role", "unknown")
+    get_log_writer().write({
+        "timestamp": datetime.datetime.now().isoformat(),
+        "action": action,
+        "details": details,
+        "user_type": user_type,
+        "user_name": user_name
+    })
@@ -0,0 +1,180 @@
+# ====================== REALTIME TABLE MIRROR ======================
+# One Supabase Realtime subscription per process replaces the short-TTL polling
+# (6–10s per session) used to fake live pages. Postgres change events are applied
+# row by row to an in-memory mirror shared by every session, and each change bumps
+# its table in cache_tags → cached fetchers on that table miss once and sessions
+# watching it (table_versions) rerun. While the socket is down, pages fall back to
+# querying the database and every table is bumped on the old polling interval.
+import asyncio
+import functools
+import threading
+import time
+
+from utils.cache_tags import invalidate_tables
+
+
+def _default_realtime(url: str, key: str):
+    from realtime import AsyncRealtimeClient
+
+    # Reconnects are handled here (the mirror must be re-seeded after any gap)
+    return AsyncRealtimeClient(url, token=key, auto_reconnect=False)
+
+
+class LiveTables:
+    """
+    - rows(table)   → copies of the table's rows from the mirror (seeded with
+                      one select on first read), or None while not subscribed —
+                      callers then query the DB as before.
+    - live          → True while the subscription is up.
+    - Runs on a daemon thread with its own asyncio loop; reconnects with
+      exponential backoff (1s → 60s).
+    """
+
+    def __init__(self, client, url: str, key: str, tables, primary_key: str = "id",
+                 fallback_interval: float = 10, realtime_factory=_default_realtime,
+                 subscribe_timeout: float = 15):
+        self.client = client
+        self.url = url
+        self.key = key
+        self.tables = tuple(tables)
+        self.primary_key = primary_key
+        self.fallback_interval = fallback_interval
+        self.realtime_factory = realtime_factory
+        self.subscribe_timeout = subscribe_timeout
+        self.last_error = None
+        self.events_applied = 0
+        self._mirror = {}   # table → {pk: row} • only seeded tables
+        self._pending = {}  # table → events that arrived while it was seeding
+        self._live = False
+        self._last_bump = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._main()), name="live-tables", daemon=True)
+        self._thread.start()
+
+    @property
+    def live(self) -> bool:
+        return self._live
+
+    def rows(self, table: str):
+        with self._lock:
+            if not self._live or table not in self.tables:
+                return None
+            if table in self._mirror:
+                return [dict(row) for row in self._mirror[table].values()]
+            self._pending.setdefault(table, [])
+
+        # Seed outside the lock (events keep buffering meanwhile), then replay the buffer
+        try:
+            data = self.client.table(table).select("*").execute().data or []
+        except Exception:
+            with self._lock:
+                self._pending.pop(table, None)
+            raise
+        with self._lock:
+            pending = self._pending.pop(table, None)
+            if not self._live or pending is None:
+                return data  # connection dropped meanwhile • serve the fresh select once
+            self._mirror[table] = {row[self.primary_key]: row for row in data}
+            for event in pending:
+                self._apply(table, event)
+            return [dict(row) for row in self._mirror[table].values()]
+
+    def stop(self):
+        self._stop.set()
+
+    # ---------- event handling (asyncio thread) ----------
+    def _on_change(self, table: str, payload: dict):
+        event = payload.get("data") or {}
+        with self._lock:
+            if table in self._pending:
+                self._pending[table].append(event)
+            elif table in self._mirror:
+                self._apply(table, event)
+            self.events_applied += 1
+        invalidate_tables(table)
+
+    def _apply(self, table: str, event: dict):
+        rows = self._mirror[table]
+        if event.get("type") == "DELETE":
+            old = event.get("old_record") or {}
+            rows.pop(old.get(self.primary_key), None)
+        else:  # INSERT / UPDATE carry the full new row
+            record = event.get("record") or {}
+            if self.primary_key in record:
+                rows[record[self.primary_key]] = record
+
+    def _set_live(self, live: bool):
+        with self._lock:
+            self._live = live
+            self._mirror.clear()
+            self._pending.clear()
+        # Events may have been missed around a (re)connect • every reader refetches once
+        invalidate_tables(*self.tables)
+
+    @staticmethod
+    def _still_connected(socket, channel) -> bool:
+        """
+        Public signals first: socket.is_connected and the channel's joined state.
+        realtime (pinned in requirements.txt) keeps is_connected True after the server
+        closes the socket, so its reader task is checked too — only when present:
+        a missing / renamed attribute means "unknown", never "dead".
+        """
+        if not socket.is_connected or not getattr(channel, "is_joined", True):
+            return False
+        if not hasattr(socket, "_listen_task"):
+            return True
+        listener = socket._listen_task
+        return listener is not None and not listener.done()
+
+    # ---------- connection loop ----------
+    async def _main(self):
+        backoff = 1
+        while not self._stop.is_set():
+            socket = None
+            try:
+                socket = self.realtime_factory(self.url, self.key)
+                await socket.connect()
+                channel = socket.channel("live-tables")
+                for table in self.tables:
+                    channel.on_postgres_changes("*", table=table, callback=functools.partial(self._on_change, table))
+
+                subscribed = asyncio.get_running_loop().create_future()
+
+                def on_state(state, error=None):
+                    if not subscribed.done():
+                        if str(getattr(state, "value", state)) == "SUBSCRIBED":
+                            subscribed.set_result(True)
+                        else:
+                            subscribed.set_exception(error or RuntimeError(f"subscribe: {state}"))
+
+                await channel.subscribe(on_state)
+                await asyncio.wait_for(subscribed, self.subscribe_timeout)
+
+                self._set_live(True)
+                self.last_error = None
+                backoff = 1
+                # Stay until the socket or the channel reports it is gone
+                while not self._stop.is_set():
+                    if not self._still_connected(socket, channel):
+                        raise ConnectionError("realtime socket closed")
+                    await asyncio.sleep(1)
+            except Exception as e:
+                self.last_error = str(e)
+            finally:
+                if self._live:
+                    self._set_live(False)
+                if socket is not None:
+                    try:
+                        await socket.close()
+                    except Exception:
+                        pass
+
+            # Degraded mode until the next attempt: bump every table like the old TTL polling
+            deadline = time.monotonic() + backoff
+            while time.monotonic() < deadline and not self._stop.is_set():
+                await asyncio.sleep(min(1, deadline - time.monotonic()))
+                if time.monotonic() - self._last_bump >= self.fallback_interval:
+                    self._last_bump = time.monotonic()
+                    invalidate_tables(*self.tables)
+            backoff = min(backoff * 2, 60)
@@ -0,0 +1,191 @@
+# ====================== BACKGROUND AUDIT LOG WRITER ======================
+# log_action() used to insert into `logs` synchronously on the request path, so
+# every login / QR action / EA download paid a Supabase round trip. Rows are now
+# queued in-process and bulk-inserted by one background thread. If Supabase is
+# unreachable the batch goes to a local JSONL spool and is replayed later.
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+
+
+class AuditLogWriter:
+    """
+    Bounded queue → background thread → bulk insert.
+
+    - A batch is flushed once `batch_size` rows are queued or `flush_interval`
+      seconds have passed, whichever comes first.
+    - write() never blocks: when the queue is full the row goes straight to the spool.
+    - Failed batches are appended to `spool_path` (one JSON row per line) and
+      re-sent, oldest first, on the next successful flush or every `retry_interval`.
+    - A spooled chunk Supabase rejects is split until the bad rows are isolated;
+      a row rejected `max_row_attempts` times on its own is moved to
+      `<spool_path>.rejected` so it no longer blocks the rows behind it.
+    - Remaining rows are flushed at interpreter exit (atexit).
+    """
+
+    def __init__(self, insert_rows, spool_path: str, batch_size: int = 200,
+                 flush_interval: float = 0.5, max_queue: int = 10000,
+                 retry_interval: float = 60, max_row_attempts: int = 3, on_flush=None):
+        self.insert_rows = insert_rows
+        self.spool_path = spool_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.max_row_attempts = max_row_attempts
+        self.on_flush = on_flush
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._spool_lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._row_failures = {}  # spooled line → times it was rejected on its own
+        self._stop = threading.Event()
+        self._last_retry = 0.0
+        self._closed = False
+
+        os.makedirs(os.path.dirname(spool_path) or ".", exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ---------- public ----------
+    def write(self, row: dict):
+        """Queue one row • returns immediately"""
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._spool([row])
+
+    def close(self, timeout: float = 5):
+        """Stop the worker and flush everything still queued (spooling on failure)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._thread.join(timeout)
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._flush(batch)
+
+    # ---------- internals ----------
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+            elif time.monotonic() - self._last_retry >= self.retry_interval:
+                self._replay_spool()
+
+    def _next_batch(self) -> list:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: list):
+        try:
+            self.insert_rows(batch)
+        except Exception:
+            self._spool(batch)
+            return
+        if self.on_flush:
+            self.on_flush()
+        self._replay_spool(reachable=True)
+
+    def _spool(self, rows: list):
+        with self._spool_lock:
+            with open(self.spool_path, "a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, default=str) + "\n")
+
+    def _replay_spool(self, reachable: bool = False):
+        """
+        Re-send the spool oldest first. Only the file read and rewrite hold the
+        spool lock — the inserts run outside it, so write() never waits on Supabase.
+        `reachable` (a flush just succeeded, or a chunk did) enables splitting a
+        failing chunk to isolate rejected rows; otherwise the first failure ends
+        the pass (Supabase is probably down).
+        """
+        self._last_retry = time.monotonic()
+        if not self._replay_lock.acquire(blocking=False):
+            return  # close() and the worker can both get here
+        try:
+            with self._spool_lock:
+                if not os.path.exists(self.spool_path):
+                    return
+                with open(self.spool_path, "rb") as f:
+                    data = f.read()
+            consumed = data.rfind(b"\n") + 1  # complete lines only • rows appended later stay put
+            lines = [line for line in data[:consumed].decode("utf-8").splitlines() if line.strip()]
+
+            sent, kept, rejected = 0, [], []
+            pending = [lines[i:i + self.batch_size] for i in range(0, len(lines), self.batch_size)]
+            while pending:
+                chunk = pending.pop(0)
+                try:
+                    self.insert_rows([json.loads(line) for line in chunk])
+                except Exception:
+                    if reachable and len(chunk) > 1:
+                        mid = len(chunk) // 2
+                        pending[:0] = [chunk[:mid], chunk[mid:]]
+                        continue
+                    if reachable and self._reject(chunk[0]):
+                        rejected.append(chunk[0])
+                        continue
+                    kept = chunk + [line for rest in pending for line in rest]
+                    break
+                sent += len(chunk)
+                reachable = True
+                if len(chunk) == 1:
+                    self._row_failures.pop(chunk[0], None)
+
+            if sent or rejected:
+                self._rewrite_spool(consumed, kept, rejected)
+        finally:
+            self._replay_lock.release()
+
+        if sent and self.on_flush:
+            self.on_flush()
+
+    def _reject(self, line: str) -> bool:
+        """Count one failure of a row sent on its own • True once it should be quarantined"""
+        try:
+            json.loads(line)
+        except ValueError:
+            return True  # torn line from a crash mid-write
+        failures = self._row_failures.get(line, 0) + 1
+        if failures < self.max_row_attempts:
+            self._row_failures[line] = failures
+            return False
+        self._row_failures.pop(line, None)
+        return True
+
+    def _rewrite_spool(self, consumed: int, kept: list, rejected: list):
+        with self._spool_lock:
+            with open(self.spool_path, "rb") as f:
+                f.seek(consumed)
+                appended = f.read()
+            if rejected:
+                with open(self.spool_path + ".rejected", "a", encoding="utf-8") as f:
+                    f.writelines(line + "\n" for line in rejected)
+            if not kept and not appended:
+                os.remove(self.spool_path)
+                return
+            tmp_path = self.spool_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.writelines((line + "\n").encode("utf-8") for line in kept)
+                f.write(appended)
+            os.replace(tmp_path, self.spool_path)
@@ -0,0 +1,155 @@
+# ====================== INCREMENTAL MESSAGE SYNC ======================
+# Per-session view of the `messages` table. Instead of re-reading the whole
+# history on every refresh, a cursor on (timestamp, id) fetches only rows newer
+# than the last one seen and appends them to an in-memory index keyed by client
+# name (one list per conversation). Older history is loaded on demand, one page
+# at a time, per conversation.
+# Senders stamp `timestamp` before their insert commits, so a row can become
+# visible after a newer one: every sync re-reads an overlap window before the
+# cursor and drops the rows it already has.
+import bisect
+import datetime
+import time
+
+MESSAGE_COLUMNS = "id, message, timestamp, from_admin, from_client, to_client"
+
+
+def conversation_key(msg: dict):
+    """Every message belongs to exactly one client's conversation"""
+    return msg.get("from_client") or msg.get("to_client")
+
+
+def _quote(value) -> str:
+    """PostgREST filter value (quoted so commas / parentheses / spaces are safe)"""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _conversation_filter(client_name: str) -> str:
+    return f"from_client.eq.{_quote(client_name)},to_client.eq.{_quote(client_name)}"
+
+
+class MessageSync:
+    """
+    - sync()            → rows newer than the cursor minus `overlap` seconds
+                          (optionally only one client's conversation), merged
+                          in (timestamp, id) order, repeats dropped.
+    - conversation(c)   → loaded messages of client c, oldest first.
+    - load_older(c)     → prepend the previous page of c's history.
+    - has_older(c)      → False once the start of c's history is loaded.
+    """
+
+    def __init__(self, client, scope: str = None, batch_size: int = 500,
+                 page_size: int = 50, min_sync_interval: float = 2, overlap: float = 30):
+        self.client = client
+        self.scope = scope  # client name for client sessions • None = all conversations
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.min_sync_interval = min_sync_interval
+        self.overlap = overlap
+        self.cursor = None  # (timestamp, id) of the newest row seen
+        self._positioned = False
+        self._index = {}
+        self._ids = set()
+        self._exhausted = set()
+        self._last_sync = None
+        self._synced_version = None
+
+    # ---------- public ----------
+    def conversation(self, client_name: str) -> list:
+        if client_name not in self._index and client_name not in self._exhausted:
+            self.load_older(client_name)
+        return self._index.get(client_name, [])
+
+    def has_older(self, client_name: str) -> bool:
+        return client_name not in self._exhausted
+
+    def sync(self, force: bool = False, version=None) -> int:
+        """
+        Fetch rows newer than the cursor • returns how many were new.
+        version: current cache_tags version of `messages` — when given, the
+        query is skipped entirely while it has not changed since the last sync
+        (otherwise syncs are throttled to one per min_sync_interval).
+        """
+        now = time.monotonic()
+        if not force and self._positioned:
+            if version is not None:
+                if version == self._synced_version:
+                    return 0
+            elif now - self._last_sync < self.min_sync_interval:
+                return 0
+        self._last_sync = now
+        self._synced_version = version
+
+        if not self._positioned:
+            # First sync: only position the cursor • history pages load per conversation
+            rows = self._query(desc=True, limit=1).execute().data or []
+            if rows:
+                self.cursor = (rows[0]["timestamp"], rows[0]["id"])
+            self._positioned = True
+            return 0
+
+        added = 0
+        page_after = None  # keyset position inside this sync's pages
+        while True:
+            query = self._query(desc=False, limit=self.batch_size)
+            if page_after:
+                ts, last_id = page_after
+                query = query.or_(f"timestamp.gt.{_quote(ts)},and(timestamp.eq.{_quote(ts)},id.gt.{last_id})")
+            elif self.cursor:
+                # Overlap window: rows committed late with an older timestamp are picked up here
+                query = query.gte("timestamp", self._overlap_start(self.cursor[0]))
+            rows = query.execute().data or []
+            for msg in rows:
+                added += self._append(msg)
+            if rows:
+                page_after = (rows[-1]["timestamp"], rows[-1]["id"])
+                if self.cursor is None or page_after > self.cursor:
+                    self.cursor = page_after
+            if len(rows) < self.batch_size:
+                return added
+
+    def load_older(self, client_name: str) -> int:
+        """Prepend the previous page of one conversation • returns rows added"""
+        convo = self._index.setdefault(client_name, [])
+        query = self._query(desc=True, limit=self.page_size, conversation=client_name)
+        if convo:
+            ts, first_id = convo[0]["timestamp"], convo[0]["id"]
+            query = query.or_(f"timestamp.lt.{_quote(ts)},and(timestamp.eq.{_quote(ts)},id.lt.{first_id})")
+        elif self.cursor:
+            # Never past the cursor: newer rows arrive through sync()
+            ts, last_id = self.cursor
+            query = query.or_(f"timestamp.lt.{_quote(ts)},and(timestamp.eq.{_quote(ts)},id.lte.{last_id})")
+        rows = query.execute().data or []
+
+        if len(rows) < self.page_size:
+            self._exhausted.add(client_name)
+        older = [m for m in reversed(rows) if m["id"] not in self._ids]
+        self._ids.update(m["id"] for m in older)
+        convo[:0] = older
+        return len(older)
+
+    # ---------- internals ----------
+    def _query(self, desc: bool, limit: int, conversation: str = None):
+        query = self.client.table("messages").select(MESSAGE_COLUMNS)
+        if conversation or self.scope:
+            query = query.or_(_conversation_filter(conversation or self.scope))
+        return query.order("timestamp", desc=desc).order("id", desc=desc).limit(limit)
+
+    def _overlap_start(self, ts) -> str:
+        try:
+            start = datetime.datetime.fromisoformat(str(ts)) - datetime.timedelta(seconds=self.overlap)
+        except ValueError:
+            return str(ts)
+        return start.isoformat()
+
+    def _append(self, msg: dict) -> int:
+        if msg["id"] in self._ids:
+            return 0
+        key = conversation_key(msg)
+        # Only conversations that were opened keep a list; others page in from the DB later
+        if key not in self._index:
+            return 0
+        self._ids.add(msg["id"])
+        # Late commits land before newer rows already shown
+        bisect.insort(self._index[key], msg, key=lambda m: (m["timestamp"], m["id"]))
+        return 1
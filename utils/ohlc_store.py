@@ -0,0 +1,114 @@
+# ====================== LOCAL OHLC CANDLE STORE ======================
+# SQLite store of hourly candles for the landing-page gold chart. Each sync only
+# downloads bars newer than the last stored one (the last bar is re-fetched since
+# it may still be forming), and chart payloads are built with vectorized column
+# operations. Longer ranges (30d, 1y) are served from the same local history,
+# with no extra upstream calls.
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+import pandas as pd
+
+_SCHEMA = """
+create table if not exists candles (
+    symbol text not null,
+    interval text not null,
+    ts integer not null,          -- bar open, unix seconds (UTC)
+    open real not null,
+    high real not null,
+    low real not null,
+    close real not null,
+    primary key (symbol, interval, ts)
+);
+"""
+
+# yfinance caps intraday history (1h → 730 days); first sync backfills this much
+BACKFILL_DAYS = 365
+
+
+def yfinance_download(symbol: str, start, end, interval: str) -> pd.DataFrame:
+    """OHLC DataFrame (DatetimeIndex, Open/High/Low/Close) from yfinance"""
+    import yfinance as yf
+
+    df = yf.download(symbol, start=start, end=end, interval=interval, progress=False, auto_adjust=False)
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    return df
+
+
+class OhlcStore:
+    """
+    sync(symbol, interval)       → fetch only bars newer than the last stored one
+    chart_payload(symbol, days)  → renderLightweightCharts candlestick data,
+                                   optionally re-bucketed (e.g. 1h → 1d for 1y)
+    """
+
+    def __init__(self, db_path: str, download=yfinance_download, min_sync_interval: float = 300):
+        self.db_path = db_path
+        self.download = download
+        self.min_sync_interval = min_sync_interval
+        self._last_sync = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with closing(self._connect()) as db, db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def last_ts(self, symbol: str, interval: str = "1h"):
+        with closing(self._connect()) as db:
+            row = db.execute("select max(ts) from candles where symbol = ? and interval = ?", (symbol, interval)).fetchone()
+        return row[0]
+
+    def sync(self, symbol: str, interval: str = "1h", force: bool = False) -> int:
+        """Download and upsert new bars • returns how many rows were written"""
+        key = (symbol, interval)
+        with self._lock:
+            if not force and time.monotonic() - self._last_sync.get(key, -self.min_sync_interval) < self.min_sync_interval:
+                return 0
+            self._last_sync[key] = time.monotonic()
+
+            last = self.last_ts(symbol, interval)
+            end = pd.Timestamp.now(tz="UTC")
+            start = pd.Timestamp(last, unit="s", tz="UTC") if last else end - pd.Timedelta(days=BACKFILL_DAYS)
+            df = self.download(symbol, start.to_pydatetime(), end.to_pydatetime(), interval)
+            if df is None or df.empty:
+                return 0
+
+            df = df[["Open", "High", "Low", "Close"]].dropna()
+            index = df.index.tz_localize("UTC") if df.index.tz is None else df.index.tz_convert("UTC")
+            ts = index.as_unit("s").asi8
+            rows = zip([symbol] * len(df), [interval] * len(df), ts.tolist(),
+                       *(df[c].astype(float).tolist() for c in ("Open", "High", "Low", "Close")))
+            with closing(self._connect()) as db, db:
+                db.executemany("insert or replace into candles values (?, ?, ?, ?, ?, ?, ?)", rows)
+            return len(df)
+
+    def candles(self, symbol: str, days: float, interval: str = "1h") -> pd.DataFrame:
+        since = int(time.time() - days * 86400)
+        with closing(self._connect()) as db:
+            return pd.read_sql_query(
+                "select ts as time, open, high, low, close from candles "
+                "where symbol = ? and interval = ? and ts >= ? order by ts",
+                db, params=(symbol, interval, since)
+            )
+
+    def chart_payload(self, symbol: str, days: float, interval: str = "1h", bucket: str = None) -> list:
+        """
+        List of {time, open, high, low, close} for renderLightweightCharts.
+        bucket (pandas freq, e.g. "1D") re-aggregates stored bars: first open,
+        max high, min low, last close — all column-wise, no row iteration.
+        """
+        df = self.candles(symbol, days, interval)
+        if df.empty:
+            return []
+        if bucket:
+            groups = pd.to_datetime(df["time"], unit="s").dt.floor(bucket)
+            df = df.groupby(groups).agg(open=("open", "first"), high=("high", "max"),
+                                        low=("low", "min"), close=("close", "last"))
+            df.insert(0, "time", df.index.as_unit("s").asi8)
+        return df[["time", "open", "high", "low", "close"]].to_dict("records")
@@ -0,0 +1,107 @@
+# ====================== BULK HISTORICAL PROFIT IMPORT ======================
+# Backfill many FTMO payouts at once from a CSV / Parquet of
+# (account_id, record_date, gross_profit). Rows are validated in bulk against the
+# stored accounts, each account's rows are split in ONE vectorized
+# split_profits() call, and the result is shaped for the
+# record_profit_distributions_bulk RPC.
+import numpy as np
+import pandas as pd
+
+from utils.profit_split import split_profits
+
+REQUIRED_COLUMNS = ["account_id", "record_date", "gross_profit"]
+UNIT_VALUE = 3000.0  # same units_generated rule as the single-profit form
+
+
+def read_profit_file(uploaded) -> pd.DataFrame:
+    """CSV or Parquet upload → DataFrame"""
+    if uploaded.name.lower().endswith(".parquet"):
+        return pd.read_parquet(uploaded)
+    return pd.read_csv(uploaded)
+
+
+def validate_profit_rows(df: pd.DataFrame, accounts: list, existing: list = None):
+    """
+    Returns (valid, rejected). `rejected` keeps the source row number and the
+    first reason it failed. `existing` = profits already stored
+    (account_id, record_date, gross_profit) → those rows are skipped, so
+    re-running the same file never double-credits anyone.
+    """
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    rows = df[REQUIRED_COLUMNS].copy()
+    rows.insert(0, "row", np.arange(len(rows)) + 2)  # spreadsheet line (after header)
+    rows["account_id"] = rows["account_id"].astype(str).str.strip()
+    rows["record_date"] = pd.to_datetime(rows["record_date"], errors="coerce").dt.date
+    rows["gross_profit"] = pd.to_numeric(rows["gross_profit"], errors="coerce").round(2)
+
+    known = {str(a["id"]) for a in accounts}
+    with_tree = {str(a["id"]) for a in accounts if a.get("participants_v2")}
+    key = rows["account_id"] + "|" + rows["record_date"].astype(str) + "|" + rows["gross_profit"].map("{:.2f}".format)
+    stored = {
+        f"{e['account_id']}|{e['record_date']}|{float(e['gross_profit']):.2f}" for e in existing or []
+    }
+
+    checks = [
+        (~rows["account_id"].isin(known), "Unknown account_id"),
+        (~rows["account_id"].isin(with_tree), "Account missing v2 participants"),
+        (rows["record_date"].isna(), "Invalid record_date"),
+        (rows["gross_profit"].isna() | (rows["gross_profit"] <= 0), "gross_profit must be > 0"),
+        (key.duplicated(), "Duplicate row in file"),
+        (key.isin(stored), "Already recorded")
+    ]
+    rows["error"] = np.select([mask.to_numpy() for mask, _ in checks], [reason for _, reason in checks], default="")
+    ok = rows["error"] == ""
+    return rows[ok].drop(columns="error").reset_index(drop=True), rows[~ok].reset_index(drop=True)
+
+
+def build_import_payload(valid: pd.DataFrame, accounts: list, display_names: dict, recorded_by: str):
+    """
+    One split_profits() pass per account over ALL its rows →
+    (items for record_profit_distributions_bulk, per-account summary DataFrame)
+    """
+    acc_by_id = {str(a["id"]): a for a in accounts}
+    items, summary = [], []
+    for acc_key, group in valid.groupby("account_id", sort=False):
+        acc = acc_by_id[acc_key]
+        split = split_profits(
+            acc.get("participants_v2"), acc.get("contributors_v2"),
+            acc.get("contributor_share_pct", 0.0), group["gross_profit"].to_numpy(), display_names
+        )
+        gf_adds = split.gf_cents / 100
+        has_user = np.array([bool(uid) for uid in split.rows["user_id"]], dtype=bool)
+        credited = split.rows["share_cents"][has_user & ~split.rows["is_growth_fund"]].sum(axis=0) / 100
+
+        for j, (record_date, gross) in enumerate(zip(group["record_date"], group["gross_profit"])):
+            items.append({
+                "profit": {
+                    "account_id": acc["id"],
+                    "gross_profit": float(gross),
+                    "record_date": str(record_date),
+                    "units_generated": float(gross) / UNIT_VALUE,
+                    "growth_fund_add": float(gf_adds[j]),
+                    "contributor_share_pct": acc.get("contributor_share_pct", 0.0)
+                },
+                "distributions": split.distribution_rows(j),
+                "growth_fund": {
+                    "date": str(record_date),
+                    "type": "In",
+                    "amount": float(gf_adds[j]),
+                    "description": f"Auto from {acc['name']} profit (bulk import)",
+                    "account_source": acc["name"],
+                    "recorded_by": recorded_by
+                } if gf_adds[j] > 0 else None
+            })
+
+        summary.append({
+            "Account": acc["name"],
+            "Profits": len(group),
+            "From": min(group["record_date"]),
+            "To": max(group["record_date"]),
+            "Gross": float(group["gross_profit"].sum()),
+            "Credited to Balances": float(credited.sum()),
+            "Growth Fund Add": float(gf_adds.sum())
+        })
+    return items, pd.DataFrame(summary)
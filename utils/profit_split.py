@@ -0,0 +1,128 @@
+# ====================== PROFIT SPLIT ENGINE ======================
+# ONE implementation of the v2 tree split, shared by the Profit Sharing preview,
+# submit, email and Sankey (and the bulk importer). Works on a whole vector of
+# gross profits at once and rounds to exact cents with the largest-remainder
+# method, so every group of shares always adds up to its rounded total.
+import numpy as np
+
+CONTRIBUTOR = "contributor"
+PARTICIPANT = "participant"
+
+
+def _largest_remainder(exact_cents: np.ndarray) -> np.ndarray:
+    """
+    Round a (recipients × profits) matrix of exact cent amounts to int64 cents so
+    each column sums to round(column total) • leftover cents go to the largest
+    fractional parts (ties → earlier row).
+    """
+    if exact_cents.size == 0:
+        return exact_cents.astype(np.int64)
+    floors = np.floor(exact_cents + 1e-9)
+    target = np.rint(exact_cents.sum(axis=0))
+    leftover = (target - floors.sum(axis=0)).astype(np.int64)
+
+    order = np.argsort(-(exact_cents - floors), axis=0, kind="stable")
+    ranks = np.argsort(order, axis=0)
+    return (floors + (ranks < leftover[None, :])).astype(np.int64)
+
+
+class ProfitSplit:
+    """
+    Result of split_profits().
+
+    rows         structured array, one entry per recipient:
+                 kind, name, user_id, role, percentage, funded_php, is_growth_fund,
+                 share_cents (int64 vector, one value per gross profit)
+    gross_cents  (n,) gross profits in cents
+    pool_cents   (n,) contributor pool in cents (0 when no pool / nothing funded)
+    gf_cents     (n,) total going to Growth Fund participant rows
+    """
+
+    def __init__(self, rows, gross_cents, pool_cents):
+        self.rows = rows
+        self.gross_cents = gross_cents
+        self.pool_cents = pool_cents
+        gf_mask = rows["is_growth_fund"]
+        self.gf_cents = rows["share_cents"][gf_mask].sum(axis=0) if gf_mask.any() else np.zeros_like(gross_cents)
+
+    @property
+    def contributors(self):
+        return self.rows[self.rows["kind"] == CONTRIBUTOR]
+
+    @property
+    def participants(self):
+        return self.rows[self.rows["kind"] == PARTICIPANT]
+
+    def shares(self, j: int = 0) -> np.ndarray:
+        """Dollar share of every row for profit j"""
+        return self.rows["share_cents"][:, j] / 100
+
+    def recipient_ids(self) -> set:
+        """Every real user involved (email recipients)"""
+        return {uid for uid in self.rows["user_id"] if uid}
+
+    def distribution_rows(self, j: int = 0) -> list:
+        """profit_distributions rows (without profit_id) for profit j"""
+        return [{
+            "participant_name": r["name"],
+            "participant_user_id": r["user_id"],
+            "participant_role": "Contributor" if r["kind"] == CONTRIBUTOR else r["role"],
+            "percentage": round(float(r["percentage"]), 2) if r["kind"] == CONTRIBUTOR else float(r["percentage"]),
+            "share_amount": int(r["share_cents"][j]) / 100,
+            "is_growth_fund": bool(r["is_growth_fund"])
+        } for r in self.rows]
+
+
+def split_profits(participants, contributors, contributor_share_pct, gross_profits, display_names=None) -> ProfitSplit:
+    """
+    Split every gross profit in `gross_profits` through one account's v2 tree.
+
+    - Contributors with a user_id share the pool (gross × contributor_share_pct %)
+      pro-rata to units × php_per_unit over ALL funded rows.
+    - Every participant row (incl. Growth Fund / manual rows without a user) gets
+      gross × percentage %. Growth Fund = display name containing "growth fund".
+    """
+    display_names = display_names or {}
+    gross_cents = np.rint(np.atleast_1d(np.asarray(gross_profits, dtype=float)) * 100)
+    n = gross_cents.shape[0]
+    contributors = contributors or []
+    participants = participants or []
+
+    funded = np.array([c.get("units", 0) * c.get("php_per_unit", 0) for c in contributors], dtype=float)
+    total_funded = funded.sum()
+    pool_exact = gross_cents * (contributor_share_pct or 0) / 100
+    has_pool = total_funded > 0 and (contributor_share_pct or 0) > 0
+
+    meta = []
+    contrib_exact = np.zeros((0, n))
+    if has_pool:
+        paid = [i for i, c in enumerate(contributors) if c.get("user_id")]
+        weights = funded[paid] / total_funded
+        contrib_exact = weights[:, None] * pool_exact[None, :]
+        for i, w in zip(paid, weights):
+            uid = contributors[i]["user_id"]
+            meta.append((CONTRIBUTOR, display_names.get(uid, "Unknown"), uid, "Contributor", w * 100, funded[i], False))
+
+    pcts = np.array([p["percentage"] for p in participants], dtype=float)
+    part_exact = pcts[:, None] * gross_cents[None, :] / 100
+    for p in participants:
+        uid = p.get("user_id")
+        fallback = p.get("display_name", "Unknown")
+        name = display_names.get(uid, fallback) if uid else fallback
+        meta.append((PARTICIPANT, name, uid, p.get("role", ""), p["percentage"], 0.0, "growth fund" in name.lower()))
+
+    dtype = np.dtype([
+        ("kind", "U11"), ("name", object), ("user_id", object), ("role", object),
+        ("percentage", "f8"), ("funded_php", "f8"), ("is_growth_fund", "?"),
+        ("share_cents", "i8", (n,))
+    ])
+    rows = np.zeros(len(meta), dtype=dtype)
+    for k, field in enumerate(dtype.names[:-1]):
+        rows[field] = [m[k] for m in meta]
+    rows["share_cents"] = np.vstack([
+        _largest_remainder(contrib_exact),
+        _largest_remainder(part_exact.reshape(len(participants), n))
+    ]) if meta else np.zeros((0, n), dtype=np.int64)
+
+    pool_cents = np.rint(pool_exact).astype(np.int64) if has_pool else np.zeros(n, dtype=np.int64)
+    return ProfitSplit(rows, gross_cents.astype(np.int64), pool_cents)
@@ -0,0 +1,69 @@
+# ====================== PROJECTION KERNEL ======================
+# One closed-form / cumsum projection shared by the Growth Fund page ("Advanced
+# Scaling Projections") and the Simulator's steady mode. Whole trajectories come
+# back from ONE call — no month-by-month list appends.
+import numpy as np
+import pandas as pd
+
+DEFAULT_GROSS_PER_ACC = 15000.0  # used until there is enough profit history
+
+
+def empire_profit_stats(profits: list, total_accounts: int) -> tuple:
+    """
+    profits rows (record_date, gross_profit[, growth_fund_add]) →
+    (avg monthly gross per account, realized Growth Fund % of gross or None)
+    """
+    if not profits:
+        return DEFAULT_GROSS_PER_ACC, None
+    df = pd.DataFrame(profits)
+    df["record_date"] = pd.to_datetime(df["record_date"])
+    monthly_sums = df.groupby(df["record_date"].dt.to_period("M"))["gross_profit"].sum()
+    avg_per_acc = monthly_sums.mean() / total_accounts if total_accounts > 0 and len(monthly_sums) else 0.0
+    if avg_per_acc < 1000:
+        avg_per_acc = DEFAULT_GROSS_PER_ACC
+
+    realized_gf_pct = None
+    gross_total = df["gross_profit"].sum()
+    if "growth_fund_add" in df and gross_total > 0:
+        realized_gf_pct = float(df["growth_fund_add"].fillna(0).sum() / gross_total * 100)
+    return float(avg_per_acc), realized_gf_pct
+
+
+def project(months: int, monthly_gross: float, gf_pct: float = 0.0, manual_in: float = 0.0,
+            unit_value: float = 3000.0, start_equity: float = 0.0, start_gf: float = 0.0,
+            gross_growth_pct: float = 0.0, gf_return_pct: float = 0.0) -> dict:
+    """
+    All series for months 0..months (index 0 = today) in one call:
+
+      gross        monthly gross, compounding by gross_growth_pct % per month
+      gf_add       gross × gf_pct % + manual_in
+      equity       start_equity + cumulative gross
+      growth_fund  start_gf compounding at gf_return_pct % per month (reinvested)
+                   plus every month's gf_add
+      distributed  cumulative gross − gf_add
+      units        cumulative gross / unit_value
+
+    With both growth rates at 0 this is the plain linear projection.
+    """
+    t = np.arange(months + 1)
+    gross = monthly_gross * (1 + gross_growth_pct / 100) ** np.maximum(t - 1, 0)
+    gross[0] = 0.0
+    gf_add = gross * gf_pct / 100 + np.where(t > 0, manual_in, 0.0)
+
+    r = gf_return_pct / 100
+    if r == 0:
+        growth_fund = start_gf + np.cumsum(gf_add)
+    else:
+        # B_t = (1+r)^t · (B_0 + Σ_{k≤t} add_k / (1+r)^k)
+        growth = (1 + r) ** t
+        growth_fund = growth * (start_gf + np.cumsum(gf_add / growth))
+
+    return {
+        "month": t,
+        "gross": gross,
+        "gf_add": gf_add,
+        "equity": start_equity + np.cumsum(gross),
+        "growth_fund": growth_fund,
+        "distributed": np.cumsum(gross - gf_add),
+        "units": np.cumsum(gross) / unit_value if unit_value > 0 else np.zeros(months + 1)
+    }
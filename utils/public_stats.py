@@ -0,0 +1,68 @@
+# ====================== PUBLIC LANDING STATS ======================
+# The landing page's four headline numbers come from ONE row of the
+# `public_landing_stats` view (materialized-view totals). A single refresher per
+# process re-reads that row every `interval` seconds on a daemon thread, so any
+# number of anonymous visitors costs a fixed number of queries per minute.
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PublicStats:
+    total_accounts: int = 0
+    total_equity: float = 0.0
+    growth_fund_balance: float = 0.0
+    members: int = 0
+    fetched_at: float = 0.0  # unix time of the last SUCCESSFUL read (0 = never)
+
+
+def fetch_public_stats(client) -> PublicStats:
+    """Single-row read of public_landing_stats"""
+    row = client.table("public_landing_stats").select(
+        "total_accounts, total_equity, growth_fund_balance, members"
+    ).limit(1).execute().data
+    row = row[0] if row else {}
+    return PublicStats(
+        total_accounts=int(row.get("total_accounts") or 0),
+        total_equity=float(row.get("total_equity") or 0),
+        growth_fund_balance=float(row.get("growth_fund_balance") or 0),
+        members=int(row.get("members") or 0),
+        fetched_at=time.time()
+    )
+
+
+class PublicStatsRefresher:
+    """
+    - Calls `fetch()` → PublicStats every `interval` seconds on a daemon thread.
+    - latest(wait) returns the newest snapshot; only the very first visitors of
+      a fresh process wait (up to `wait` s) for the initial read.
+    - A failed read keeps serving the previous snapshot (zeros before the first success).
+    """
+
+    def __init__(self, fetch, interval: float = 60):
+        self.fetch = fetch
+        self.interval = interval
+        self.last_error = None
+        self._stats = PublicStats()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="public-stats", daemon=True)
+        self._thread.start()
+
+    def latest(self, wait: float = 5) -> PublicStats:
+        self._ready.wait(wait)
+        return self._stats
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._stats = self.fetch()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+            self._ready.set()
+            self._stop.wait(self.interval)
@@ -0,0 +1,80 @@
+# ====================== SIMULATOR SCENARIO SWEEP ======================
+# Evaluates the full Cartesian grid of Simulator parameters (projected accounts,
+# gross per account, GF %, unit value, manual GF inflow) as one vectorized numpy
+# pass. Results are memoized by a hash of the sweep parameters, so re-running the
+# same sweep (from any session) is free.
+# No process pool: shipping the grid to workers cost more than evaluating it inline
+# at every grid size the Simulator can build (up to 12^5 = 248,832 scenarios,
+# see benchmarks/scenario_sweep.py).
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+AXES = ("projected_accounts", "gross_per_acc", "gf_pct", "unit_value", "manual_in")
+
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+_MEMO_SIZE = 32
+
+
+def sweep_key(axes: dict, fixed: dict) -> str:
+    """Stable hash of every sweep input"""
+    payload = json.dumps({"axes": {k: list(map(float, axes[k])) for k in AXES}, "fixed": fixed}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _evaluate_chunk(grid: np.ndarray, fixed: dict) -> np.ndarray:
+    """
+    (n × 5) grid rows in AXES order → (n × 5) outcomes:
+    final_equity, final_gf, total_distributed, total_units, months_to_target
+    (same linear model as the Simulator's steady projection; inf = target not reached)
+    """
+    accounts, gross_per_acc, gf_pct, unit_value, manual_in = grid.T
+    months = fixed["months"]
+    gross = accounts * gross_per_acc
+    gf_add = gross * gf_pct / 100 + manual_in
+    units = np.divide(gross, unit_value, out=np.zeros_like(gross), where=unit_value > 0)
+
+    gap = fixed["gf_target"] - fixed["start_gf"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        to_target = np.where(gap <= 0, 0.0, np.where(gf_add > 0, np.ceil(gap / gf_add), np.inf))
+    to_target[to_target > months] = np.inf
+
+    return np.column_stack([
+        fixed["start_equity"] + gross * months,
+        fixed["start_gf"] + gf_add * months,
+        (gross - gf_add) * months,
+        units * months,
+        to_target
+    ])
+
+
+def run_sweep(axes: dict, fixed: dict) -> pd.DataFrame:
+    """
+    axes  → {axis: list of values} for every name in AXES
+    fixed → months, start_equity, start_gf, gf_target
+    Returns one row per scenario (inputs + outcomes), memoized by sweep_key() •
+    the DataFrame is shared between callers, treat it as read-only.
+    """
+    key = sweep_key(axes, fixed)
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+    mesh = np.meshgrid(*(np.asarray(axes[k], dtype=float) for k in AXES), indexing="ij")
+    grid = np.stack(mesh, axis=-1).reshape(-1, len(AXES))
+    outcomes = _evaluate_chunk(grid, fixed)
+
+    result = pd.DataFrame(np.hstack([grid, outcomes]), columns=[
+        *AXES, "final_equity", "final_gf", "total_distributed", "total_units", "months_to_target"
+    ])
+    with _memo_lock:
+        _memo[key] = result
+        if len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+    return result
@@ -0,0 +1,93 @@
+# ====================== SIGNED-URL MANAGER ======================
+# Remembers every signed URL minted for (bucket, storage_path) together with its
+# expiry and hands the SAME URL back until it is past `refresh_fraction` of its
+# lifetime. Stable URLs → browsers reuse cached images across reruns, and minting
+# is no longer a per-render cost. Renewals are batched into one
+# create_signed_urls call per bucket.
+import threading
+import time
+
+
+class SignedUrlManager:
+    """
+    Process-wide cache of Supabase Storage signed URLs.
+
+    - get_many(bucket, paths) → {path: url}; only missing / stale paths are
+      minted, all in ONE create_signed_urls round trip.
+    - An entry is stale once `refresh_fraction` of its lifetime has passed, so a
+      handed-out URL always has at least (1 - refresh_fraction) of it left.
+      Lifetimes are per call: a cached URL minted for a shorter `expires_in`
+      than the caller asks for is re-signed when too little of it remains.
+    - Paths that fail to sign are simply absent from the result (callers keep
+      their existing fallback, e.g. the stored public file_url). A path the
+      server rejects (e.g. a thumbnail that was never generated) is not asked
+      for again until `miss_ttl` seconds have passed.
+    """
+
+    def __init__(self, client, expires_in: int = 3600 * 24, refresh_fraction: float = 0.5,
+                 miss_ttl: float = 600):
+        self.client = client
+        self.expires_in = expires_in
+        self.refresh_fraction = refresh_fraction
+        self.miss_ttl = miss_ttl
+        self._urls = {}    # (bucket, path) -> (url, refresh_at, expires_at)
+        self._misses = {}  # (bucket, path) -> retry_at
+        self._lock = threading.Lock()
+
+    # ---------- public ----------
+    def get(self, bucket: str, storage_path: str, expires_in: int = None):
+        """Single signed URL (or None if it could not be minted)"""
+        if not storage_path:
+            return None
+        return self.get_many(bucket, [storage_path], expires_in).get(storage_path)
+
+    def get_many(self, bucket: str, paths, expires_in: int = None) -> dict:
+        """Signed URLs for many objects of one bucket • mints only what is missing/stale"""
+        expires_in = expires_in or self.expires_in
+        now = time.time()
+        min_left = expires_in * (1 - self.refresh_fraction)  # what a URL minted now would keep at refresh time
+        result, stale = {}, []
+        with self._lock:
+            for path in dict.fromkeys(p for p in paths if p):
+                entry = self._urls.get((bucket, path))
+                if entry and entry[1] > now and entry[2] - now >= min_left:
+                    result[path] = entry[0]
+                elif self._misses.get((bucket, path), 0) > now:
+                    continue
+                else:
+                    stale.append(path)
+
+        if stale:
+            result.update(self._mint(bucket, stale, expires_in))
+        return result
+
+    def invalidate(self, bucket: str, storage_path: str):
+        """Forget one URL (e.g. after the object was deleted)"""
+        with self._lock:
+            self._urls.pop((bucket, storage_path), None)
+
+    # ---------- internals ----------
+    def _mint(self, bucket: str, paths: list, expires_in: int) -> dict:
+        minted_at = time.time()
+        try:
+            signed = self.client.storage.from_(bucket).create_signed_urls(paths, expires_in)
+        except Exception:
+            return {}
+
+        refresh_at = minted_at + expires_in * self.refresh_fraction
+        fresh, missing = {}, []
+        for item in signed or []:
+            url = item.get("signedURL") or item.get("signedUrl")
+            if item.get("error") or not url:
+                if item.get("path"):
+                    missing.append(item["path"])
+                continue
+            fresh[item["path"]] = url
+
+        with self._lock:
+            for path, url in fresh.items():
+                self._urls[(bucket, path)] = (url, refresh_at, minted_at + expires_in)
+                self._misses.pop((bucket, path), None)
+            for path in missing:
+                self._misses[(bucket, path)] = minted_at + self.miss_ttl
+        return fresh
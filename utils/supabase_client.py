@@ -0,0 +1,18 @@
+# ====================== SUPABASE CLIENT ======================
+# One client per process, created on first import and shared by the app entry,
+# utils.helpers and every page module.
+import os
+
+import streamlit as st
+from dotenv import load_dotenv
+from supabase import Client, create_client
+
+load_dotenv()
+
+supabase_url = os.getenv("SUPABASE_URL")
+supabase_key = os.getenv("SUPABASE_KEY")
+if not supabase_url or not supabase_key:
+    st.error("Missing SUPABASE_URL or SUPABASE_KEY in .env file!")
+    st.stop()
+
+supabase: Client = create_client(supabase_url, supabase_key)
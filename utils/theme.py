@@ -0,0 +1,30 @@
+# ====================== THEME & COLORS ======================
+# Accents are the same in both modes; everything else follows the session's
+# light / dark theme. Shared by the app entry (global CSS) and the page modules.
+from collections import namedtuple
+
+accent_primary = "#00ffaa"
+accent_gold = "#ffd700"
+accent_glow = "#00ffaa40"
+accent_color = accent_primary
+
+ThemeColors = namedtuple("ThemeColors", [
+    "accent_hover", "bg_color", "card_bg", "border_color", "text_primary",
+    "text_muted", "card_shadow", "card_shadow_hover", "sidebar_bg"
+])
+
+
+def theme_colors(theme: str) -> ThemeColors:
+    """Colors adaptive to the session theme ("light" / "dark")"""
+    light = theme == "light"
+    return ThemeColors(
+        accent_hover="#00cc99" if light else "#00ffcc",
+        bg_color="#f8fbff" if light else "#0a0d14",
+        card_bg="rgba(255, 255, 255, 0.75)" if light else "rgba(15, 20, 30, 0.70)",
+        border_color="rgba(0, 0, 0, 0.08)" if light else "rgba(100, 100, 100, 0.15)",
+        text_primary="#0f172a" if light else "#ffffff",
+        text_muted="#64748b" if light else "#aaaaaa",
+        card_shadow="0 8px 25px rgba(0,0,0,0.12)" if light else "0 10px 30px rgba(0,0,0,0.5)",
+        card_shadow_hover="0 15px 40px rgba(0,0,0,0.2)" if light else "0 20px 50px rgba(0,255,170,0.45)",
+        sidebar_bg="rgba(248, 251, 255, 0.95)" if light else "rgba(10, 13, 20, 0.95)"
+    )
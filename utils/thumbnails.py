@@ -0,0 +1,43 @@
+# ====================== IMAGE THUMBNAILS ======================
+# Image grids (File Vault, Testimonials, My Profile proofs) used to hand the
+# full-resolution Storage object to st.image — multi-MB screenshots for 300px
+# tiles. upload_to_supabase now also stores small WebP thumbnails next to every
+# uploaded image, under a path derived from the original's storage_path, so
+# readers never need a column to find them. Grids show the thumbnail and link
+# to the full image, which is only downloaded when clicked.
+import io
+import os
+
+# name → (width, height) • grids use GRID_THUMBNAIL (2x a ~300px tile)
+THUMBNAIL_SIZES = {
+    "sm": (320, 240),
+    "md": (640, 480),
+}
+GRID_THUMBNAIL = "md"
+THUMBNAIL_QUALITY = 80
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+
+def thumbnail_path(storage_path: str, size: str = GRID_THUMBNAIL) -> str:
+    """Storage path of one thumbnail of `storage_path` (same bucket, next to the original)"""
+    return f"{storage_path}@{size}.webp"
+
+
+def is_thumbnailable(name: str, content_type: str = None) -> bool:
+    return bool(content_type and content_type.startswith("image/")) or \
+        os.path.splitext(name or "")[1].lower() in IMAGE_EXTENSIONS
+
+
+def encode_thumbnail(img) -> bytes:
+    """WebP bytes of an already resized PIL image (alpha kept)"""
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    img = img.convert("RGBA" if has_alpha else "RGB")
+    out = io.BytesIO()
+    img.save(out, format="WEBP", quality=THUMBNAIL_QUALITY, method=4)
+    return out.getvalue()
+
+
+def with_thumbnails(storage_path: str) -> list:
+    """The original plus every thumbnail path • for storage .remove() (missing paths are ignored)"""
+    return [storage_path] + [thumbnail_path(storage_path, size) for size in THUMBNAIL_SIZES]
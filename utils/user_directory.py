@@ -0,0 +1,144 @@
+# ====================== SHARED USER DIRECTORY ======================
+# Almost every page used to download its own copy of `users` (different columns
+# each time) and build its own {id: full_name} / {full_name: balance} dicts. One
+# process-wide directory now keeps the public user columns in columnar form with
+# prebuilt indexes by id, full_name and role. It loads once, applies the app's own
+# writes in place (no re-download), and reloads only when `users` is bumped by a
+# write it did not see, or after max_age seconds.
+import threading
+import time
+
+from utils.cache_tags import invalidate_tables, table_versions
+
+DIRECTORY_COLUMNS = ("id", "full_name", "role", "title", "balance", "email")
+
+
+class UserIndex:
+    """
+    Immutable snapshot • one tuple per column + O(1) indexes.
+    - get(user_id) / by_name(full_name) → row dict or None
+    - balance_of(full_name)            → balance (0 if unknown)
+    - rows(*roles) / names(*roles)     → all rows / sorted full names, optionally by role
+    - mapping(key, value)              → {key: value} dict, built once per snapshot
+    """
+
+    def __init__(self, rows):
+        self.columns = {c: tuple(r.get(c) for r in rows) for c in DIRECTORY_COLUMNS}
+        self.by_id = {str(uid): i for i, uid in enumerate(self.columns["id"])}
+        self.by_full_name = {name: i for i, name in enumerate(self.columns["full_name"]) if name}
+        by_role = {}
+        for i, role in enumerate(self.columns["role"]):
+            by_role.setdefault(role, []).append(i)
+        self.by_role = {role: tuple(ix) for role, ix in by_role.items()}
+        self._memo = {}
+
+    def __len__(self):
+        return len(self.columns["id"])
+
+    def row(self, i: int) -> dict:
+        return {c: self.columns[c][i] for c in DIRECTORY_COLUMNS}
+
+    def get(self, user_id):
+        i = self.by_id.get(str(user_id))
+        return None if i is None else self.row(i)
+
+    def by_name(self, full_name):
+        i = self.by_full_name.get(full_name)
+        return None if i is None else self.row(i)
+
+    def balance_of(self, full_name) -> float:
+        i = self.by_full_name.get(full_name)
+        return (self.columns["balance"][i] or 0) if i is not None else 0
+
+    def _indices(self, roles):
+        if not roles:
+            return range(len(self))
+        return sorted(i for role in roles for i in self.by_role.get(role, ()))
+
+    def rows(self, *roles) -> list:
+        return [self.row(i) for i in self._indices(roles)]
+
+    def names(self, *roles) -> list:
+        key = ("names", roles)
+        if key not in self._memo:
+            self._memo[key] = sorted(self.columns["full_name"][i] for i in self._indices(roles)
+                                     if self.columns["full_name"][i])
+        return self._memo[key]
+
+    def mapping(self, key: str, value: str) -> dict:
+        """{key column: value column} (ids as str) • shared, treat as read-only"""
+        memo_key = ("mapping", key, value)
+        if memo_key not in self._memo:
+            keys = self.columns[key]
+            if key == "id":
+                keys = tuple(str(k) for k in keys)
+            self._memo[memo_key] = dict(zip(keys, self.columns[value]))
+        return self._memo[memo_key]
+
+
+class UserDirectory:
+    """
+    - current()          → UserIndex (loads / reloads only when needed)
+    - upsert(*rows)      → apply rows the app just wrote (e.g. insert/update .data)
+    - remove(*user_ids)  → drop deleted users
+    - refresh(*user_ids) → re-read only these users (server-side changes, e.g. an RPC)
+    Every write method also bumps `users` in cache_tags for the other fetchers.
+    """
+
+    def __init__(self, client, max_age: float = 300):
+        self.client = client
+        self.max_age = max_age
+        self._index = None
+        self._rows = {}       # str(id) → row (public columns only)
+        self._version = None  # cache_tags version of `users` the index reflects
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> UserIndex:
+        version = table_versions(("users",))
+        index = self._index
+        if index is not None and version == self._version and time.monotonic() - self._loaded_at < self.max_age:
+            return index
+        with self._lock:
+            version = table_versions(("users",))
+            if self._index is None or version != self._version or time.monotonic() - self._loaded_at >= self.max_age:
+                data = self.client.table("users").select(", ".join(DIRECTORY_COLUMNS)).execute().data or []
+                self._rows = {str(r["id"]): self._public(r) for r in data}
+                self._rebuild(version)
+                self._loaded_at = time.monotonic()
+            return self._index
+
+    def upsert(self, *rows):
+        with self._lock:
+            for r in rows:
+                if r and r.get("id") is not None:
+                    self._rows[str(r["id"])] = {**self._rows.get(str(r["id"]), {}), **self._public(r)}
+            self._applied()
+
+    def remove(self, *user_ids):
+        with self._lock:
+            for uid in user_ids:
+                self._rows.pop(str(uid), None)
+            self._applied()
+
+    def refresh(self, *user_ids):
+        ids = [uid for uid in dict.fromkeys(user_ids) if uid is not None]
+        if not ids:
+            return
+        data = self.client.table("users").select(", ".join(DIRECTORY_COLUMNS)).in_("id", ids).execute().data or []
+        self.upsert(*data)
+
+    # ---------- internals (lock held) ----------
+    @staticmethod
+    def _public(row: dict) -> dict:
+        return {c: row[c] for c in DIRECTORY_COLUMNS if c in row}
+
+    def _applied(self):
+        # Other fetchers on `users` must miss • this directory already holds the change
+        invalidate_tables("users")
+        if self._index is not None:
+            self._rebuild(table_versions(("users",)))
+
+    def _rebuild(self, version):
+        self._index = UserIndex(list(self._rows.values()))
+        self._version = version